@@ -0,0 +1,51 @@
+import os
+import time
+
+from scraper.extractor import get_extractor
+
+SAMPLES = [
+    ("it_article.html", "https://www.indiatoday.in/india/story/sample-article-123456-2024-01-01"),
+    ("ht_sample.html", "https://www.hindustantimes.com/cricket/players/tim-david-67402"),
+    ("ht_sample_news.html", "https://www.hindustantimes.com/india-news/sample-story-101700000000000.html"),
+]
+
+
+def compare(rounds=20):
+    # Checks the lxml engine gives exactly the BeautifulSoup engine's output on the saved
+    # sample pages, then times both
+    folder = os.path.dirname(os.path.abspath(__file__))
+    pages = []
+    for name, url in SAMPLES:
+        with open(os.path.join(folder, name), encoding="utf-8") as f:
+            pages.append((name, url, f.read()))
+
+    mismatches = 0
+    for mode in ("density", "container"):
+        engines = {engine: get_extractor(engine, mode) for engine in ("bs4", "lxml")}
+        for name, url, html in pages:
+            results = {}
+            for engine, extractor in engines.items():
+                data = extractor.parse(html, url)
+                data.pop("scraped_at")
+                results[engine] = data
+            diff = [key for key in results["bs4"] if results["bs4"][key] != results["lxml"].get(key)]
+            if diff or results["bs4"].keys() != results["lxml"].keys():
+                mismatches += 1
+                print(f"{name} ({mode}): engines differ on {diff or 'keys'}")
+            else:
+                print(f"{name} ({mode}): identical, {len(results['bs4']['content'])} chars of content")
+
+    engines = {engine: get_extractor(engine) for engine in ("bs4", "lxml")}
+    for engine, extractor in engines.items():
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for _, url, html in pages:
+                extractor.parse(html, url)
+        elapsed = time.perf_counter() - start
+        count = rounds * len(pages)
+        print(f"{engine}: {count} pages in {elapsed:.2f}s ({elapsed / count * 1000:.1f} ms/page)")
+    return mismatches == 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if compare() else 1)
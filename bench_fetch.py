@@ -0,0 +1,53 @@
+import asyncio
+import os
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from scraper.fetcher import HttpFetcher
+
+SAMPLES = ["it_article.html", "ht_sample.html", "ht_sample_news.html"]
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+
+def serve_samples():
+    # Serve the saved sample pages from this folder on a random local port
+    folder = os.path.dirname(os.path.abspath(__file__))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=folder))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def bench(total=300, concurrency=50):
+    server = serve_samples()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/{SAMPLES[i % len(SAMPLES)]}" for i in range(total)]
+
+    sem = asyncio.Semaphore(concurrency)
+    escalations = 0
+
+    async with HttpFetcher(max_connections=concurrency) as fetcher:
+        async def one(url):
+            nonlocal escalations
+            async with sem:
+                result = await fetcher.fetch(url)
+                if fetcher.needs_browser(result):
+                    escalations += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(u) for u in urls))
+        elapsed = time.perf_counter() - start
+
+    server.shutdown()
+    print(f"Fetched {total} pages in {elapsed:.2f}s ({total / elapsed:.0f} pages/sec), {escalations} would escalate to the browser")
+
+
+if __name__ == "__main__":
+    asyncio.run(bench())
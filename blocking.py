@@ -0,0 +1,56 @@
+from urllib.parse import urlparse
+
+# We only ever read page.content(), so none of these affect what we extract
+DEFAULT_BLOCKED_TYPES = ["image", "font", "media"]
+
+# Ads, analytics, consent/notification widgets and recommendation widgets
+DEFAULT_BLOCKED_DOMAINS = [
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com", "googletagservices.com",
+    "google-analytics.com", "googletagmanager.com", "adservice.google.com", "amazon-adsystem.com",
+    "adnxs.com", "pubmatic.com", "rubiconproject.com", "openx.net", "criteo.com", "criteo.net",
+    "taboola.com", "outbrain.com", "moatads.com", "scorecardresearch.com", "quantserve.com",
+    "chartbeat.com", "chartbeat.net", "hotjar.com", "clarity.ms", "facebook.net",
+    "platform.twitter.com", "newrelic.com", "nr-data.net", "segment.io", "cdn.mxpnl.com",
+    "izooto.com", "onesignal.com", "cookielaw.org", "onetrust.com", "quantcast.com",
+    "adsafeprotected.com", "teads.tv", "vdo.ai",
+]
+
+
+class RequestBlocker:
+    # Aborts subresources we don't need, on every page of a browser context.
+    # allowed_domains always wins, so a site whose own CDN or player is on the list can opt out.
+    def __init__(self, blocked_types=None, blocked_domains=None, allowed_domains=None):
+        self.blocked_types = set(DEFAULT_BLOCKED_TYPES if blocked_types is None else blocked_types)
+        self.blocked_domains = list(DEFAULT_BLOCKED_DOMAINS if blocked_domains is None else blocked_domains)
+        self.allowed_domains = list(allowed_domains or [])
+        self.blocked = 0
+        self.allowed = 0
+
+    async def attach(self, context):
+        await context.route("**/*", self._handle)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        host = (urlparse(url).hostname or "").lower()
+        if self._matches(host, self.allowed_domains):
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return self._matches(host, self.blocked_domains)
+
+    def _matches(self, host, domains):
+        return any(host == d or host.endswith("." + d) for d in domains)
+
+    async def _handle(self, route):
+        request = route.request
+        try:
+            # Never block the page itself (iframes from blocked domains are fair game)
+            is_page = request.is_navigation_request() and request.frame.parent_frame is None
+            if not is_page and self.should_block(request.resource_type, request.url):
+                self.blocked += 1
+                await route.abort()
+            else:
+                self.allowed += 1
+                await route.continue_()
+        except Exception:
+            # Page/context already closed while the request was in flight
+            pass
@@ -0,0 +1,205 @@
+import re
+
+# Never article text
+BOILERPLATE_TAGS = {
+    "nav", "aside", "footer", "header", "script", "style", "noscript", "template", "form",
+    "button", "select", "iframe", "svg", "canvas", "figcaption",
+}
+# Blocks whose text (and that of their descendants) scores as paragraphs
+PARAGRAPH_TAGS = {"p", "pre", "blockquote", "td", "h2", "h3", "h4"}
+# Container tags dropped from the chosen block when they are mostly links ("Also read" lists)
+LIST_TAGS = {"ul", "ol", "div", "section", "table"}
+# Never treated as boilerplate, whatever their class says
+KEEP_TAGS = {"html", "body", "article", "main"}
+
+# class/id words, matched as whole dash/underscore separated tokens. Page chrome goes
+# unless the same names also say it's content; widgets only when short or mostly links.
+CHROME_RE = re.compile(
+    r"(?:^|[\s_-])(?:nav|navbar|navigation|menu|footer|sidebar|comments?|breadcrumbs?|newsletter|"
+    r"subscribe|cookie|masthead)(?:[\s_-]|$)",
+    re.I,
+)
+WIDGET_RE = re.compile(
+    r"(?:^|[\s_-])(?:share|sharing|social|related|promo|advert|ads?|sponsored|popup|modal|widget|"
+    r"tags|recommended|trending)(?:[\s_-]|$)",
+    re.I,
+)
+POSITIVE_RE = re.compile(r"(?:^|[\s_-])(?:article|body|content|entry|post|story|text|blog)", re.I)
+
+MIN_PARAGRAPH_CHARS = 25
+
+
+class Block:
+    __slots__ = ("element", "name", "parent", "children", "chars", "link_chars", "commas", "score", "scored")
+
+    def __init__(self, element, name, parent):
+        self.element = element
+        self.name = name
+        self.parent = parent
+        self.children = []   # text strings and child Blocks, in document order
+        self.chars = 0
+        self.link_chars = 0
+        self.commas = 0
+        self.score = 0.0
+        self.scored = False
+
+    def link_density(self):
+        return self.link_chars / self.chars if self.chars else 0.0
+
+
+class ContentScorer:
+    # Finds the article body by text and link density, in time linear in the page size.
+    # One pass builds a light copy of the tree without boilerplate (nav/aside/footer/
+    # script..., hidden elements, blocks whose class/id says menu/footer/comments, and
+    # share/related/ad widgets that are short or mostly links) and adds up text, link
+    # text and commas per element. Every paragraph-like block with real text then scores
+    # its parent (and half of that its grandparent); the best scorer, weighted by class
+    # name and penalised by link density, is the article container. Sibling blocks that scored well join it, link-heavy lists inside it are
+    # dropped. Tree access is split out into iter_children/tag_name/attr so other tree
+    # types can subclass it, like TextScanner.
+
+    def extract(self, root):
+        # Article text, or None when nothing on the page reads like paragraphs
+        top = self._build(root, None, False)
+        if top is None:
+            return None
+        # Blocks inside dropped widgets may have been scored too; only count kept ones
+        candidates = []
+        stack = [top]
+        while stack:
+            block = stack.pop()
+            if block.scored:
+                candidates.append(block)
+            stack.extend(child for child in block.children if isinstance(child, Block))
+        if not candidates:
+            return None
+        best = max(candidates, key=self._final_score)
+        best_score = self._final_score(best)
+        if best_score <= 0:
+            return None
+
+        blocks = [best]
+        if best.parent is not None:
+            threshold = max(10.0, best_score * 0.2)
+            blocks = [
+                child for child in best.parent.children
+                if child is best or (isinstance(child, Block) and self._joins(child, threshold))
+            ]
+        parts = []
+        for block in blocks:
+            self._collect(block, parts)
+        return "".join(parts)
+
+    def _build(self, element, parent, in_link):
+        name = self.tag_name(element)
+        kind = self._boilerplate(element, name)
+        if kind == "chrome":
+            return None
+        block = Block(element, name, parent)
+        in_link = in_link or name == "a"
+        own_chars = 0
+        for child in self.iter_children(element):
+            if isinstance(child, str):
+                block.children.append(child)
+                length = len(child.strip())
+                own_chars += length
+                block.chars += length
+                block.commas += child.count(",")
+                if in_link:
+                    block.link_chars += length
+            else:
+                child_block = self._build(child, block, in_link)
+                if child_block is not None:
+                    block.children.append(child_block)
+                    block.chars += child_block.chars
+                    block.link_chars += child_block.link_chars
+                    block.commas += child_block.commas
+
+        # div+br layouts keep their paragraphs as bare text inside a div
+        is_paragraph = name in PARAGRAPH_TAGS or (name == "div" and own_chars >= MIN_PARAGRAPH_CHARS)
+        text_chars = block.chars - block.link_chars
+        if is_paragraph and text_chars >= MIN_PARAGRAPH_CHARS:
+            points = 1 + block.commas + min(text_chars // 100, 3)
+            for ancestor, share in ((parent, 1.0), (parent.parent if parent else None, 0.5)):
+                if ancestor is None:
+                    continue
+                if not ancestor.scored:
+                    ancestor.scored = True
+                    ancestor.score = self._class_weight(ancestor)
+                ancestor.score += points * share
+        if kind == "widget" and (text_chars < 200 or block.link_density() > 0.33):
+            return None
+        return block
+
+    def _final_score(self, block):
+        return block.score * (1 - block.link_density())
+
+    def _joins(self, block, threshold):
+        if block.scored and self._final_score(block) >= threshold:
+            return True
+        text_chars = block.chars - block.link_chars
+        return block.name == "p" and text_chars >= 80 and block.link_density() < 0.25
+
+    def _collect(self, block, parts):
+        for child in block.children:
+            if isinstance(child, str):
+                parts.append(child)
+            elif child.name == "h1" or (child.name in LIST_TAGS and child.link_density() > 0.5):
+                continue  # the headline is the title field
+            else:
+                self._collect(child, parts)
+
+    def _boilerplate(self, element, name):
+        # "chrome" (drop), "widget" (drop if short or link-heavy) or None
+        if name in KEEP_TAGS:
+            return None
+        if name in BOILERPLATE_TAGS:
+            return "chrome"
+        if self.attr(element, "hidden") is not None or self.attr(element, "aria-hidden") == "true":
+            return "chrome"
+        style = (self.attr(element, "style") or "").replace(" ", "").lower()
+        if "display:none" in style or "visibility:hidden" in style:
+            return "chrome"
+        names = self._names(element)
+        if not names.strip():
+            return None
+        if CHROME_RE.search(names) and not POSITIVE_RE.search(names):
+            return "chrome"
+        if WIDGET_RE.search(names):
+            return "widget"
+        return None
+
+    def _names(self, element):
+        return f"{self.attr(element, 'class') or ''} {self.attr(element, 'id') or ''}"
+
+    def _class_weight(self, block):
+        names = self._names(block.element)
+        weight = 0
+        if POSITIVE_RE.search(names):
+            weight += 25
+        if CHROME_RE.search(names) or WIDGET_RE.search(names):
+            weight -= 25
+        if block.name in ("article", "main"):
+            weight += 10
+        return weight
+
+    # --- tree access (BeautifulSoup) ---
+
+    def iter_children(self, element):
+        from bs4 import NavigableString, Tag
+
+        for child in element.children:
+            # Exact type check skips comments and script/style strings, like get_text()
+            if type(child) is NavigableString:
+                yield str(child)
+            elif isinstance(child, Tag):
+                yield child
+
+    def tag_name(self, element):
+        return element.name
+
+    def attr(self, element, name):
+        value = element.get(name)
+        if isinstance(value, list):
+            return " ".join(value)
+        return value
@@ -2,31 +2,129 @@ import asyncio
 from playwright.async_api import async_playwright
 
 class Crawler:
-    def __init__(self):
+    def __init__(self, fetch_mode: str = "browser", concurrency: int = 5, extract_workers: int = 0,
+                 extract_engine: str = "bs4", content_mode: str = "density",
+                 blocking: bool = True, block_types: list = None, block_domains: list = None, allow_domains: list = None,
+                 page_pool_size: int = None, page_max_uses: int = 50,
+                 host_concurrency: int = None, rates: dict = None, target_latency: float = 5.0,
+                 serve_frontier: str = None, frontier_url: str = None, frontier_token: str = None, worker_id: str = None,
+                 lease_size: int = 10, lease_ttl: float = 120.0, cache_path: str = None,
+                 url_classifier: bool = True, article_patterns: list = None, skip_patterns: list = None,
+                 url_patterns_path: str = None, classifier_sitemap: bool = False, discovery: str = "listing",
+                 stop_after_old_pages: int = 3, ready_selector: str = None, wait_timeout: float = 8.0,
+                 pagination_batch: int = 5, state_mappings: dict = None, capture_json: bool = False,
+                 profiles: dict = None, session_dir: str = None, session_max_age: float = 6 * 3600):
         self.playwright = None
         self.browser = None
-        self.context = None
+        self.http_fetcher = None
+        # "browser": every article through Chromium
+        # "auto": plain HTTP first, escalate to Chromium only when the page needs it
+        self.fetch_mode = fetch_mode
+        # Total article fetches in flight, shared by every site crawled in this process
+        self.concurrency = concurrency
+        self.global_slots = None
+        # 0 parses inside the event loop, N > 0 hands HTML to N extraction processes
+        self.extract_workers = extract_workers
+        # "bs4" or "lxml" (same output, several times faster)
+        self.extract_engine = extract_engine
+        # "density": scored article body without boilerplate; "container": old whole-block text
+        self.content_mode = content_mode
+        self.extraction = None
+        # Per-host politeness: adaptive concurrency (up to host_concurrency) and optional
+        # token buckets, rates = {"example.com": (requests_per_sec, burst)}
+        from scraper.rate_control import RateController
+        self.rate = RateController(
+            start_concurrency=min(2, concurrency),
+            max_concurrency=host_concurrency or concurrency,
+            rates=rates,
+            target_latency=target_latency,
+        )
+        # Subresource blocking in the browser context (None = built-in defaults)
+        self.blocking = blocking
+        self.block_types = block_types
+        self.block_domains = block_domains
+        self.allow_domains = allow_domains
+        # Reused browser pages for article fetches (defaults to one per worker)
+        self.page_pool_size = page_pool_size or concurrency
+        self.page_max_uses = page_max_uses
+        # Distributed crawl: the coordinator crawls the listing and serves its frontier on
+        # serve_frontier ("host:port"); workers (frontier_url) lease article URLs from it
+        # and report results back, which the coordinator merges into its output. Both
+        # sides need the same frontier_token; a coordinator without one makes one up.
+        self.serve_frontier = serve_frontier
+        self.frontier_url = frontier_url
+        self.frontier_token = frontier_token
+        if not worker_id:
+            import os
+            import socket
+            worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self.worker_id = worker_id
+        self.lease_size = lease_size
+        self.lease_ttl = lease_ttl
+        # Article responses and records kept across runs for conditional re-crawls
+        self.cache_path = cache_path
+        self.page_cache = None
+        # Listing links are scored before they are scheduled; URL shapes learned per host
+        # can be kept in url_patterns_path and seeded from the site's sitemap
+        self.url_classifier = url_classifier
+        self.article_patterns = article_patterns
+        self.skip_patterns = skip_patterns
+        self.url_patterns_path = url_patterns_path
+        self.classifier_sitemap = classifier_sitemap
+        # "listing": follow the seed's pagination; "sitemap": read sitemaps and RSS/Atom
+        # feeds instead, date-filtered before fetching (listing crawl if there are none)
+        self.discovery = discovery
+        # With --start_date, pagination stops after this many consecutive listing pages
+        # that are entirely older than the window (0 keeps paginating)
+        self.stop_after_old_pages = stop_after_old_pages
+        # Pages are ready when ready_selector shows up (or, without one, when the DOM goes
+        # quiet); no readiness wait lasts longer than wait_timeout seconds
+        self.ready_selector = ready_selector
+        self.wait_timeout = wait_timeout
+        # Listings numbered in the URL (?page=N, /page/N/, offsets) are fetched directly,
+        # this many pages at a time; 0 always clicks through "Next" instead
+        self.pagination_batch = pagination_batch
+        # Per-site paths into embedded app state (__NEXT_DATA__, __NUXT__, ...): articles
+        # are read from the site's own data instead of the rendered HTML when they match.
+        # capture_json also takes story links from the JSON the listing pages load (XHR/
+        # fetch calls behind infinite scroll, "load more") and from their embedded state.
+        self.state_mappings = state_mappings
+        self.capture_json = capture_json
+        # Per-site extraction profiles: field selectors and cascade step order
+        self.profiles = profiles
+        # Browser cookies/localStorage saved per site in session_dir and restored by the
+        # next run (for session_max_age seconds), so challenges aren't solved every time
+        self.sessions = None
+        if session_dir:
+            from scraper.sessions import SessionStore
+            self.sessions = SessionStore(session_dir, session_max_age)
         
-    async def run(self, url: str, max_pages: int, output_base: str, output_format: str, headless: bool = True, start_date: str = None, end_date: str = None, categories: list = None):
-        from scraper.extractor import Extractor
-        from exporter.writer import write_data
-        from datetime import datetime
-        import dateparser
-        
-        # Parse filter dates
-        filter_start = dateparser.parse(start_date) if start_date else None
-        filter_end = dateparser.parse(end_date) if end_date else None
-        
-        if filter_start:
-            print(f"Filtering items from {filter_start.strftime('%Y-%m-%d')}")
-        if filter_end:
-            print(f"Filtering items up to {filter_end.strftime('%Y-%m-%d')}")
-        if categories:
-            print(f"Filtering items by categories: {categories}")
+    async def run(self, url: str, max_pages: int, output_base: str, output_format: str, headless: bool = True, start_date: str = None, end_date: str = None, categories: list = None, resume: bool = False, state_file: str = None):
+        seed = {
+            "url": url,
+            "max_pages": max_pages,
+            "output": output_base,
+            "start_date": start_date,
+            "end_date": end_date,
+            "categories": categories,
+            "state_file": state_file,
+        }
+        await self.run_many([seed], output_format, headless=headless, resume=resume)
+
+    async def work(self, headless: bool = True):
+        # Worker node: fetch articles leased from the coordinator at self.frontier_url
+        await self.run_many([], None, headless=headless)
+
+    async def run_many(self, seeds: list, output_format: str, headless: bool = True, resume: bool = False):
+        # Crawls every seed concurrently in one browser process, each in its own context,
+        # with self.concurrency as the global budget for article fetches
+        from scraper.extract_pool import ExtractionPool
         
-        extractor = Extractor()
-        collected_data = []
-        visited_urls = set()
+        if self.serve_frontier and len(seeds) > 1:
+            raise ValueError("A distributed crawl coordinates a single seed")
+        self.extraction = await ExtractionPool(self.extract_workers, self.extract_engine, self.content_mode,
+                                               self.state_mappings, self.profiles).start()
+        self.global_slots = asyncio.Semaphore(self.concurrency)
         
         print(f"Launching browser (Headless: {headless})...")
         async with async_playwright() as p:
@@ -40,173 +138,869 @@ class Crawler:
                     "--disable-setuid-sandbox"
                 ]
             )
-            self.context = await self.browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                viewport={"width": 1280, "height": 720},
-                device_scale_factor=1,
-                locale="en-US",
-            )
             
-            # Inject stealth script to hide webdriver property
-            await self.context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-            """)
+            if self.cache_path:
+                from scraper.page_cache import PageCache, config_fingerprint
+                config = config_fingerprint(self.extract_engine, self.content_mode, self.state_mappings, self.profiles)
+                self.page_cache = PageCache(self.cache_path, config)
             
-            page = await self.context.new_page()
-            results = []
-            
-            current_url = url
-            is_pagination_active = True
-            
-            print(f"Starting crawl at {url}")
+            # The HTTP client also revalidates cached articles in browser mode and reads sitemaps
+            uses_sitemaps = any((seed.get("discovery") or self.discovery) == "sitemap" for seed in seeds)
+            if self.fetch_mode == "auto" or self.page_cache or uses_sitemaps:
+                from scraper.fetcher import HttpFetcher
+                self.http_fetcher = await HttpFetcher(max_connections=max(self.concurrency * 2, 10)).start()
             
             try:
-                # Increased timeout for initial load and potential challenges
-                await page.goto(current_url, timeout=60000, wait_until="domcontentloaded")
-                
-                # Cloudflare bypass check
-                for _ in range(5):
-                    title = await page.title()
-                    if "One moment" in title or "Just a moment" in title:
-                        print(f"Cloudflare challenge detected (Title: {title}). Waiting...")
-                        await page.wait_for_timeout(5000)
-                    else:
+                if self.frontier_url:
+                    await self._work_for_frontier()
+                    return
+                outcomes = await asyncio.gather(
+                    *(self._crawl_site(seed, output_format, resume) for seed in seeds),
+                    return_exceptions=True,
+                )
+                for seed, outcome in zip(seeds, outcomes):
+                    if isinstance(outcome, Exception):
+                        print(f"Crawl of {seed['url']} failed: {outcome}")
+            finally:
+                if self.http_fetcher:
+                    await self.http_fetcher.close()
+                if self.page_cache:
+                    print(f"Page cache: {self.page_cache.hits} unchanged articles reused, {self.page_cache.misses} parsed.")
+                    self.page_cache.close()
+                self.extraction.close()
+                await self.browser.close()
+
+    async def _new_context(self, storage_state: dict = None):
+        from scraper.fetcher import DEFAULT_USER_AGENT
+        # Same user agent as the HTTP client, so clearance cookies work for both
+        context = await self.browser.new_context(
+            user_agent=DEFAULT_USER_AGENT,
+            viewport={"width": 1280, "height": 720},
+            device_scale_factor=1,
+            locale="en-US",
+            storage_state=storage_state,
+        )
+        
+        # Inject stealth script to hide webdriver property
+        await context.add_init_script("""
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined
+            });
+        """)
+        return context
+
+    async def _open_context(self, site_url):
+        # A site's context, starting from the session an earlier run saved for it
+        state = self.sessions.load(site_url) if self.sessions else None
+        if state:
+            from scraper.sessions import site_key
+            print(f"Reusing saved browser session for {site_key(site_url)} ({len(state['cookies'])} cookies)")
+            self._share_cookies(state["cookies"])
+        return await self._new_context(state)
+
+    async def _keep_session(self, context, site_url):
+        # The context's cookies go to the HTTP client and, with --session_dir, are saved
+        # (with localStorage) for the next run
+        if not (self.sessions or self.http_fetcher):
+            return
+        try:
+            state = await context.storage_state()
+        except Exception as e:
+            print(f"Could not read the browser session: {e}")
+            return
+        self._share_cookies(state.get("cookies", []))
+        if self.sessions:
+            self.sessions.save(site_url, state)
+
+    def _share_cookies(self, cookies):
+        if self.http_fetcher and cookies:
+            self.http_fetcher.add_cookies(cookies)
+
+    async def _crawl_site(self, seed: dict, output_format: str, resume: bool = False):
+        from scraper.frontier import CrawlFrontier, IN_FLIGHT, DONE, SKIPPED, FAILED
+        from scraper.rate_control import Blocked
+        from scraper.page_pool import PagePool
+        from scraper.stream_writer import open_writer
+        from scraper.date_window import DateWindow
+        from scraper.dedup import canonicalize_url
+        from scraper.url_classifier import looks_like_article
+        from scraper.readiness import Readiness
+        from scraper.utils import normalize_date
+        
+        url = seed["url"]
+        max_pages = seed.get("max_pages", 10)
+        output_base = seed["output"]
+        categories = seed.get("categories")
+        start_date = seed.get("start_date")
+        end_date = seed.get("end_date")
+        workers_count = seed.get("concurrency") or self.concurrency
+        discovery = seed.get("discovery") or self.discovery
+        readiness = Readiness(seed.get("ready_selector") or self.ready_selector, self.wait_timeout)
+        
+        # Parse filter dates
+        filter_start = normalize_date(start_date) if start_date else None
+        filter_end = normalize_date(end_date) if end_date else None
+        
+        if filter_start:
+            print(f"Filtering items from {filter_start.strftime('%Y-%m-%d')}")
+        if filter_end:
+            print(f"Filtering items up to {filter_end.strftime('%Y-%m-%d')}")
+        if categories:
+            print(f"Filtering items by categories: {categories}")
+        
+        # Durable crawl state: lets --resume pick up after a crash or Ctrl-C
+        frontier = CrawlFrontier(seed.get("state_file") or f"{output_base}.crawl.db", resume=resume)
+        server = writer = context = page_pool = None
+        try:
+            visited_urls = frontier.finished_urls()
+            collected = frontier.counts().get(DONE, 0)
+            resume_queue = frontier.pending()
+            start_url = url
+            if resume:
+                start_url = frontier.get_state("listing_url", url)
+                print(f"Resuming crawl: {collected} items already collected, {len(resume_queue)} queued links, listing page {start_url}")
+            frontier.set_state("seed_url", url)
+        
+            # Coordinator of a distributed crawl: workers lease links from this frontier
+            shared = bool(self.serve_frontier)
+            if shared:
+                from scraper.frontier_service import FrontierServer
+                host, _, port = self.serve_frontier.rpartition(":")
+                if not self.frontier_token:
+                    import secrets
+                    self.frontier_token = secrets.token_urlsafe(16)
+                    print(f"Workers need --frontier_token {self.frontier_token}")
+                server = FrontierServer(frontier.path, self.frontier_token, host or "0.0.0.0", int(port)).start()
+                frontier.set_state("seed", {
+                    "url": url, "categories": categories, "start_date": start_date, "end_date": end_date,
+                    "ready_selector": readiness.ready_selector,
+                })
+                frontier.set_state("listing_done", False)
+                frontier.set_state("stopped", False)
+                # Records are numbered as they complete; the output holds the first max_pages
+                collected = frontier.get_state("merged_seq", 0) if resume else 0
+        
+            # Near-duplicate articles (same story under another URL, boilerplate-only pages)
+            # are dropped before they reach the output; a resumed crawl knows what it wrote
+            from scraper.dedup import SimHashIndex
+            near_dups = SimHashIndex()
+            if resume:
+                written = frontier.get_state("merged_seq", 0) if shared else None
+                seq = 0
+                while True:
+                    rows = frontier.texts_after(seq)
+                    for seq, record_url, content in rows:
+                        if written is None or seq <= written:
+                            near_dups.add(record_url, content)
+                    if not rows or (written is not None and seq >= written):
                         break
-                
-                # Wait a bit extra for dynamic content or challenges
-                await page.wait_for_timeout(5000) 
-            except Exception as e:
-                print(f"Failed to load initial page: {e}")
+        
+            # Link classifier: skips tag/author/category/pagination pages before they are fetched
+            classifier = None
+            if self.url_classifier:
+                from urllib.parse import urlparse
+                from scraper.url_classifier import UrlClassifier
+                classifier = UrlClassifier(self.article_patterns, self.skip_patterns)
+                classifier.load(self.url_patterns_path, urlparse(url).hostname)
+                if self.classifier_sitemap:
+                    await self._bootstrap_classifier(classifier, url)
+        
+            # Items are written out as they are accepted, not held until the end
+            # Frontier updates that say an item is in the output (DONE, merged_seq) wait until
+            # it really is: they run when the writer flushes, so a crash can't lose them
+            unflushed = []
+
+            def commit_flushed():
+                for update in unflushed:
+                    update()
+                unflushed.clear()
+
+            def after_write(update):
+                if writer.buffer:
+                    unflushed.append(update)
+                else:
+                    update()
+
+            writer = open_writer(output_base, output_format, source_url=url, append=resume, on_flush=commit_flushed)
+        
+            # Isolated context per site: own cookies, request blocking and page pool
+            context = await self._open_context(url)
+            blocker = None
+            if self.blocking:
+                from scraper.blocking import RequestBlocker
+                blocker = RequestBlocker(self.block_types, self.block_domains, self.allow_domains)
+                await blocker.attach(context)
+        
+            page_pool = PagePool(context, size=self.page_pool_size, max_uses=self.page_max_uses)
+        
+            page = await context.new_page()
+            capture = None
+            if self.capture_json:
+                from scraper.structured_data import JsonCapture, StateMapper
+                capture = JsonCapture(StateMapper(self.state_mappings), url).attach(page)
+        
+            current_url = start_url
+        
+            print(f"Starting crawl at {url}")
+        
+            if discovery == "listing" and not await self._open_listing(page, current_url, readiness):
                 return
+            if discovery == "listing":
+                # Whatever clearance the listing needed is good for the articles too
+                await self._keep_session(context, url)
 
             max_items = max_pages 
+        
+            # Producer/consumer: pagination keeps feeding the queue while a fixed pool of
+            # long-lived workers drains it, so no listing page waits on its slowest article.
+            # The bounded queue stops pagination from running far ahead of the workers.
+            limit_reached = asyncio.Event()
+            if shared:
+                from scraper.frontier_service import LeaseQueue
+                queue = LeaseQueue(frontier, self.worker_id, batch_size=min(self.lease_size, workers_count),
+                                   ttl=self.lease_ttl, maxsize=workers_count * 4)
+            else:
+                queue = asyncio.Queue(maxsize=workers_count * 4)
 
-            while len(results) < max_items and is_pagination_active:
-                # 1. Extract Links from current listing page
-                try:
-                    links = await self._extract_links(page, categories)
-                    print(f"Found {len(links)} potential article links on current page.")
-                except Exception as e:
-                    print(f"Error extracting links: {e}")
-                    links = []
-                
-                # 2. Visit each link in PARALLEL
-                # Create a semaphore to limit concurrency
-                sem = asyncio.Semaphore(5)  # Adjust concurrency level as needed
-
-                async def scrape_wrapper(link):
-                    if link in visited_urls:
-                        return None
-                    visited_urls.add(link)
-                    
-                    async with sem:
-                        try:
-                            print(f"Scraping: {link}")
-                            # Create a fresh page for each task
-                            detail_page = await self.context.new_page()
+            window = DateWindow(filter_start, filter_end, self.stop_after_old_pages)
+
+            async def schedule(links, listing_dates=None):
+                # Returns the links actually handed to the workers
+                nonlocal resume_queue
+                if listing_dates:
+                    links = [link for link in links if window.in_range(listing_dates.get(link))]
+                if classifier:
+                    found = len(links)
+                    links = [link for link in links if classifier.accepts(link)]
+                    if len(links) < found:
+                        print(f"Skipping {found - len(links)} links that don't look like articles.")
+            
+                # Links queued but never finished by the previous run go first
+                if resume_queue:
+                    links = resume_queue + [l for l in links if l not in resume_queue]
+                    resume_queue = []
+                frontier.add(links)
+            
+                # Hand new links to the workers
+                scheduled = []
+                for link in links:
+                    if link not in visited_urls:
+                        visited_urls.add(link)
+                        scheduled.append(link)
+                        await queue.put(link)
+                return scheduled
+
+            listing_links = set()
+
+            async def produce_links():
+                is_pagination_active = True
+                previous_url = None
+                state_url = None
+                while is_pagination_active:
+                    # 1. Extract Links from current listing page
+                    try:
+                        links = await self._extract_links(page, categories)
+                        print(f"Found {len(links)} potential article links on current page.")
+                    except Exception as e:
+                        print(f"Error extracting links: {e}")
+                        links = []
+                    captured_dates = {}
+                    if capture:
+                        if page.url != state_url:
+                            state_url = page.url
                             try:
-                                await detail_page.goto(link, timeout=45000, wait_until="domcontentloaded")
-                                
-                                # Wait for content (lighter wait)
-                                try:
-                                    await detail_page.wait_for_load_state("domcontentloaded", timeout=15000)
-                                except:
-                                    pass
-                                    
-                                content = await detail_page.content()
-                                data = extractor.parse(content, link)
-                                
-                                if data.get("title"):
-                                    # Post-processing filters
-                                    item_category = data.get("category", "").lower()
-                                    item_tags = [t.lower() for t in data.get("tags", [])]
-                                    
-                                    keep_item = True
-                                    if categories:
-                                        # RELAXED: If category is empty but we have content, keep it? 
-                                        # Or better: Check if categories matches EITHER category OR tags OR generic search
-                                        # For now, let's keep the logic but maybe relax the "empty" check if user complains?
-                                        # The users complaint was "0 items".
-                                        # Let's search the DESCRIPTION or TITLE for the category keywords as a fallback
-                                        
-                                        title_lower = data.get("title", "").lower()
-                                        desc_lower = data.get("description", "").lower()
-                                        
-                                        cat_match = any(cat.lower() in item_category for cat in categories)
-                                        tag_match = any(any(cat.lower() in t for t in item_tags) for cat in categories)
-                                        content_match = any(cat.lower() in title_lower or cat.lower() in desc_lower for cat in categories)
-                                        
-                                        if not (cat_match or tag_match or content_match):
-                                            print(f"Skipping article: '{data['title'][:20]}' - No match for {categories}")
-                                            keep_item = False
-                                    
-                                    # Date Logic
-                                    item_date_str = data.get("date")
-                                    if item_date_str and (filter_start or filter_end):
-                                        item_date = dateparser.parse(item_date_str)
-                                        if item_date:
-                                            if item_date.tzinfo and not filter_start.tzinfo:
-                                                 item_date = item_date.replace(tzinfo=None)
-                                            if filter_start and item_date < filter_start:
-                                                print(f"Skipping: Too old ({item_date})")
-                                                keep_item = False
-                                            if filter_end and item_date > filter_end:
-                                                print(f"Skipping: Too new ({item_date})")
-                                                keep_item = False
-                                    
-                                    if keep_item:
-                                        print(f"Extracted: {data['title'][:30]}...")
-                                        return data
-                                    else:
-                                        return None  # Filtered out
-                                else:
-                                    print(f"Skipped {link}: No title")
-                                    return None
+                                capture.add_state(await page.content())
                             except Exception as e:
-                                print(f"Error scraping {link}: {e}")
-                                return None
-                            finally:
-                                await detail_page.close()
-                        except Exception as e:
-                            print(f"Task error {link}: {e}")
-                            return None
-
-                # Create tasks
-                tasks = [scrape_wrapper(link) for link in links if link not in visited_urls]
+                                print(f"Error reading listing state: {e}")
+                        await capture.settle()
+                        captured, captured_dates = self._captured_links(capture, page.url)
+                        new = [link for link in captured if link not in links]
+                        if new:
+                            print(f"Found {len(new)} more links in the listing's JSON data.")
+                            links += new
+                    listing_links.update(links)
                 
-                # Run batch
-                if tasks:
-                    batch_results = await asyncio.gather(*tasks)
-                    # Filter None results
-                    valid_results = [r for r in batch_results if r]
-                    results.extend(valid_results)
-                    print(f"Batch finished. Total items: {len(results)}")
+                    # 2. Hand new links to the workers, minus those the listing dates rule out
+                    listing_dates = {**captured_dates, **await self._listing_dates(page)} if window.active() else {}
+                    scheduled = await schedule(links, listing_dates)
+                    if window.active():
+                        window.add_page(scheduled, listing_dates)
+                        if window.exhausted():
+                            print(f"Last {window.stop_after} listing pages are older than the date window, stopping pagination.")
+                            break
                 
-                # Check limits
-                if len(results) >= max_items:
-                    break
-
-                        
-                # 3. Handle Pagination
-                if len(results) < max_items:
+                    # 3. Pages numbered in the URL are fetched directly from here on
+                    if self.pagination_batch > 0:
+                        numbered = await self._pagination_pattern(page, previous_url)
+                        if numbered:
+                            await produce_numbered(*numbered)
+                            break
+                
+                    # 4. Handle Pagination (paced by the host's rate limit, not a fixed sleep)
+                    previous_url = page.url
                     try:
-                        has_next = await self._handle_pagination(page)
+                        async with self.rate.slot(page.url):
+                            has_next = await self._handle_pagination(page, readiness)
                     except Exception as e:
                         print(f"Pagination error: {e}")
                         has_next = False
-                        
+                    
                     if not has_next:
                         print("No more pages found or pagination ended.")
                         is_pagination_active = False
                     else:
                         print("Navigating to next page...")
-                        await asyncio.sleep(2)
+                        frontier.set_state("listing_url", page.url)
+
+                # JSON that arrived after the last look at the page
+                if capture and not window.exhausted():
+                    await capture.settle()
+                    links, listing_dates = self._captured_links(capture, page.url)
+                    if links:
+                        listing_links.update(links)
+                        await schedule(links, listing_dates if window.active() else None)
+
+            async def produce_numbered(pattern, number):
+                # Fetches listing pages `number`, `number + 1`, ... of `pattern` a batch at a
+                # time, through the same fetch path (and rate limits) as articles. Stops at a
+                # missing page, a page with no links not seen before (sites often repeat their
+                # last page), or once the date window is behind us.
+                print(f"Listing pages are numbered in the URL ({pattern}), fetching {self.pagination_batch} at a time.")
+                while True:
+                    urls = [pattern.url(number + i) for i in range(self.pagination_batch)]
+                    results = await asyncio.gather(
+                        *(self._fetch_listing(listing_url, page_pool, readiness, window.active()) for listing_url in urls),
+                        return_exceptions=True,
+                    )
+                    for listing_url, result in zip(urls, results):
+                        if isinstance(result, Exception) or result is None:
+                            print(f"Listing page {listing_url} unavailable ({result or 'not found'}), pagination ended.")
+                            return
+                        links, listing_dates = result
+                        if not any(link not in listing_links for link in links):
+                            print(f"No new links on {listing_url}, pagination ended.")
+                            return
+                        listing_links.update(links)
+                        print(f"Found {len(links)} potential article links on {listing_url}.")
+                        scheduled = await schedule(links, listing_dates)
+                        frontier.set_state("listing_url", listing_url)
+                        if window.active():
+                            window.add_page(scheduled, listing_dates)
+                            if window.exhausted():
+                                print(f"Last {window.stop_after} listing pages are older than the date window, stopping pagination.")
+                                return
+                    number += self.pagination_batch
+
+            async def produce_discovered():
+                from scraper.sitemaps import Discovery
+                discovered = Discovery(self.http_fetcher, url, filter_start, filter_end)
+                batch = []
+                async for link in discovered.links():
+                    batch.append(canonicalize_url(link))
+                    if len(batch) >= 50:
+                        await schedule(batch)
+                        batch = []
+                await schedule(batch)
+                print(f"Discovery read {discovered.sources} sitemaps/feeds, skipped {discovered.out_of_window} entries outside the date window.")
+                if not discovered.sources:
+                    print("No sitemaps or feeds found, crawling the listing pages instead.")
+                    if await self._open_listing(page, current_url, readiness):
+                        await produce_links()
+
+            async def produce():
+                try:
+                    if discovery == "sitemap":
+                        await produce_discovered()
+                    else:
+                        await produce_links()
+                finally:
+                    if shared:
+                        frontier.set_state("listing_done", True)
+
+            async def scrape_link(link):
+                nonlocal collected
+                print(f"Scraping: {link}")
+                if not shared:
+                    # (Leased links are already in flight, with an expiry)
+                    frontier.mark(link, IN_FLIGHT)
+                try:
+                    data, genuine = await self._fetch_article(link, page_pool, readiness)
+                    if genuine:
+                        window.record(link, data.get("date"))
+                        if classifier:
+                            # An error page says nothing about the URL's shape
+                            classifier.learn(link, looks_like_article(data))
+                
+                    if not genuine:
+                        print(f"Skipped {link}: error page")
+                        frontier.mark(link, SKIPPED, error="error page")
+                    elif not data.get("title"):
+                        print(f"Skipped {link}: No title")
+                        frontier.mark(link, SKIPPED)
+                    elif not self._keep_item(data, categories, filter_start, filter_end):
+                        frontier.mark(link, SKIPPED)  # Filtered out
+                    elif not self._claim_canonical(data, link, frontier, visited_urls):
+                        print(f"Skipped {link}: same article as {data['url']}")
+                        frontier.mark(link, SKIPPED, error=f"canonical {data['url']}")
+                    elif shared:
+                        # merge_results() writes it, in completion order across all workers
+                        print(f"Extracted: {data['title'][:30]}...")
+                        frontier.mark(link, DONE, record=data)
+                    elif collected < max_items:
+                        # (Past the limit the link stays in flight, so --resume picks it up)
+                        duplicate = near_dups.add(data["url"], data.get("content"))
+                        if duplicate:
+                            print(f"Skipped {link}: near-duplicate of {duplicate}")
+                            frontier.mark(link, SKIPPED, error=f"near-duplicate of {duplicate}")
+                            return
+                        print(f"Extracted: {data['title'][:30]}...")
+                        unflushed.append(lambda: frontier.mark(link, DONE, record=data))
+                        writer.write(data)
+                        collected += 1
+                except Blocked as e:
+                    if frontier.requeue(link, error=str(e)):
+                        print(f"Retrying {link} later: {e}")
+                        return True
+                    print(f"Error scraping {link}: {e}, giving up")
+                except Exception as e:
+                    print(f"Error scraping {link}: {e}")
+                    frontier.mark(link, FAILED, error=str(e))
+
+            retrying = set()
+
+            async def put_back(link):
+                # A turned-away link goes to the back of the queue; the host's limiter holds
+                # it until the pause is over. Its task_done() waits until it is queued again,
+                # so join() can't finish without it.
+                try:
+                    await queue.put(link)
+                finally:
+                    queue.task_done()
+
+            async def detail_worker():
+                while True:
+                    link = await queue.get()
+                    if link is None:
+                        return
+                    retry = False
+                    try:
+                        async with self.global_slots:
+                            retry = await scrape_link(link)
+                    except Exception as e:
+                        print(f"Task error {link}: {e}")
+                    finally:
+                        if retry:
+                            task = asyncio.create_task(put_back(link))
+                            retrying.add(task)
+                            task.add_done_callback(retrying.discard)
+                        else:
+                            queue.task_done()
+                    if collected >= max_items:
+                        limit_reached.set()
+
+            async def drain():
+                try:
+                    await producer
+                except Exception as e:
+                    # Links already handed to the workers are still scraped
+                    print(f"Listing discovery failed, finishing the queued links: {e!r}")
+                await queue.join()
+
+            merged_seq = frontier.get_state("merged_seq", 0)
+
+            def merge_pending():
+                # Copy records finished by any worker (local or remote) into the output
+                nonlocal collected, merged_seq
+                rows = frontier.results_after(merged_seq)
+                for seq, record in rows:
+                    duplicate = near_dups.add(record.get("url"), record.get("content"))
+                    if duplicate:
+                        print(f"Dropped {record.get('url')}: near-duplicate of {duplicate}")
+                    elif collected < max_items:
+                        writer.write(record)
+                        collected += 1
+                    merged_seq = seq
+                    after_write(lambda seq=seq: frontier.set_state("merged_seq", seq))
+                if collected >= max_items:
+                    limit_reached.set()
+                return rows
+
+            async def merge_results():
+                while True:
+                    if not merge_pending():
+                        await asyncio.sleep(1)
+
+            if collected < max_items:
+                producer = asyncio.create_task(produce())
+                workers = [asyncio.create_task(detail_worker()) for _ in range(workers_count)]
+                if shared:
+                    workers.append(asyncio.create_task(merge_results()))
+                finished = asyncio.create_task(drain())
+                limit_wait = asyncio.create_task(limit_reached.wait())
+                await asyncio.wait([finished, limit_wait], return_when=asyncio.FIRST_COMPLETED)
+            
+                # Either everything is done or max_pages was reached: cancel what is left
+                for task in [producer, finished, limit_wait, *workers]:
+                    task.cancel()
+                await asyncio.gather(producer, finished, limit_wait, *workers, return_exceptions=True)
+        
+            if shared:
+                while merge_pending():
+                    pass
+                # Tells remote workers to stop leasing; give their next poll a chance to see it
+                frontier.set_state("stopped", True)
+                await asyncio.sleep(2)
+
+            print(f"Crawl finished ({url}). Collected {collected} items.")
+            if window.skipped:
+                print(f"Skipped {window.skipped} links dated outside the window on the listing pages.")
+            if classifier:
+                print(f"Skipped {classifier.skipped} non-article links without fetching them"
+                      f" ({classifier.explored} more fetched to check the learned shapes).")
+                if self.url_patterns_path:
+                    classifier.save(self.url_patterns_path, urlparse(url).hostname)
+            if blocker:
+                print(f"Blocked {blocker.blocked} of {blocker.blocked + blocker.allowed} browser requests.")
+            await self._keep_session(context, url)
+        finally:
+            # Flushing the writer also marks its last items done, so it goes first
+            try:
+                if writer:
+                    writer.close()
+            finally:
+                if page_pool:
+                    await page_pool.close()
+                if server:
+                    server.close()
+                frontier.close()
+                if context:
+                    await context.close()
+
+    async def _bootstrap_classifier(self, classifier, url):
+        # The site's sitemap lists real articles: their URL shapes count as articles
+        from scraper.fetcher import HttpFetcher
+        from scraper.sitemaps import sitemap_urls
+
+        fetcher = self.http_fetcher or await HttpFetcher().start()
+        try:
+            urls = await sitemap_urls(fetcher, url)
+            classifier.bootstrap(urls)
+            print(f"Learned URL shapes from {len(urls)} sitemap entries.")
+        except Exception as e:
+            print(f"Sitemap bootstrap failed: {e}")
+        finally:
+            if fetcher is not self.http_fetcher:
+                await fetcher.close()
 
-            print(f"Crawl finished. Collected {len(results)} items.")
-            write_data(results, output_base, output_format, source_url=url)
-            await self.browser.close()
+    async def _work_for_frontier(self):
+        from scraper.frontier import DONE, SKIPPED, FAILED
+        from scraper.frontier_service import RemoteFrontier, LeaseQueue
+        from scraper.page_pool import PagePool
+        from scraper.rate_control import Blocked
+        from scraper.readiness import Readiness
+        from scraper.utils import normalize_date
+
+        frontier = RemoteFrontier(self.frontier_url, self.frontier_token)
+        # Filters come from the coordinator, so every worker applies the same ones
+        seed = await asyncio.to_thread(frontier.get_state, "seed") or {}
+        categories = seed.get("categories")
+        filter_start = normalize_date(seed["start_date"]) if seed.get("start_date") else None
+        filter_end = normalize_date(seed["end_date"]) if seed.get("end_date") else None
+        readiness = Readiness(seed.get("ready_selector") or self.ready_selector, self.wait_timeout)
+        print(f"Worker {self.worker_id} joined the crawl of {seed.get('url')}")
+
+        context = await self._open_context(seed.get("url") or self.frontier_url)
+        if self.blocking:
+            from scraper.blocking import RequestBlocker
+            await RequestBlocker(self.block_types, self.block_domains, self.allow_domains).attach(context)
+        page_pool = PagePool(context, size=self.page_pool_size, max_uses=self.page_max_uses)
+        queue = LeaseQueue(frontier, self.worker_id, batch_size=self.lease_size, ttl=self.lease_ttl, offload=True)
+        kept = 0
+
+        async def detail_worker():
+            nonlocal kept
+            while True:
+                link = await queue.get()
+                if link is None:
+                    return
+                print(f"Scraping: {link}")
+                try:
+                    async with self.global_slots:
+                        data, genuine = await self._fetch_article(link, page_pool, readiness)
+                    # Frontier calls go over the network, off the event loop
+                    if not genuine:
+                        print(f"Skipped {link}: error page")
+                        await asyncio.to_thread(frontier.mark, link, SKIPPED, error="error page")
+                    elif not data.get("title"):
+                        print(f"Skipped {link}: No title")
+                        await asyncio.to_thread(frontier.mark, link, SKIPPED)
+                    elif not self._keep_item(data, categories, filter_start, filter_end):
+                        await asyncio.to_thread(frontier.mark, link, SKIPPED)
+                    elif not await asyncio.to_thread(self._claim_canonical, data, link, frontier):
+                        print(f"Skipped {link}: same article as {data['url']}")
+                        await asyncio.to_thread(frontier.mark, link, SKIPPED, error=f"canonical {data['url']}")
+                    else:
+                        print(f"Extracted: {data['title'][:30]}...")
+                        await asyncio.to_thread(frontier.mark, link, DONE, record=data)
+                        kept += 1
+                except Blocked as e:
+                    # Back in the shared queue, for whichever worker leases it after the pause
+                    try:
+                        if await asyncio.to_thread(frontier.requeue, link, error=str(e)):
+                            print(f"Retrying {link} later: {e}")
+                        else:
+                            print(f"Error scraping {link}: {e}, giving up")
+                    except Exception:
+                        pass  # Lease runs out and the link is retried elsewhere
+                except Exception as e:
+                    print(f"Error scraping {link}: {e}")
+                    try:
+                        await asyncio.to_thread(frontier.mark, link, FAILED, error=str(e))
+                    except Exception:
+                        pass  # Lease runs out and the link is retried elsewhere
+
+        try:
+            await asyncio.gather(*(detail_worker() for _ in range(self.concurrency)))
+        finally:
+            print(f"Worker {self.worker_id} finished. Sent {kept} items to the coordinator.")
+            await page_pool.close()
+            frontier.close()
+            await self._keep_session(context, seed.get("url") or self.frontier_url)
+            await context.close()
+
+    async def _open_listing(self, page, listing_url, readiness):
+        try:
+            # Increased timeout for initial load and potential challenges
+            await page.goto(listing_url, timeout=60000, wait_until="domcontentloaded")
+            
+            # Cloudflare bypass check, then wait until the listing has rendered
+            await readiness.clear_challenge(page)
+            await readiness.settle(page)
+            return True
+        except Exception as e:
+            print(f"Failed to load initial page: {e}")
+            return False
+
+    def _claim_canonical(self, data, link, frontier, visited_urls=None):
+        # Honours the page's rel=canonical: the record takes the canonical URL, and the
+        # article is a duplicate if that URL is already known to the frontier. Canonicals
+        # pointing at the site root are a common CMS bug and are ignored.
+        from urllib.parse import urlparse
+        from scraper.dedup import canonicalize_url
+        from scraper.frontier import SKIPPED
+
+        canonical = data.pop("canonical_url", None)
+        if not canonical:
+            return True
+        canonical = canonicalize_url(canonical)
+        if canonical == link or urlparse(canonical).path in ("", "/"):
+            return True
+        data["url"] = canonical
+        if visited_urls is not None:
+            visited_urls.add(canonical)
+        # Recorded as handled, so the canonical URL itself is never fetched again
+        return bool(frontier.add([canonical], state=SKIPPED))
+
+    def _keep_item(self, data, categories, filter_start, filter_end):
+        from scraper.utils import normalize_date
+
+        # Post-processing filters
+        item_category = data.get("category", "").lower()
+        item_tags = [t.lower() for t in data.get("tags", [])]
+        
+        keep_item = True
+        if categories:
+            # RELAXED: If category is empty but we have content, keep it? 
+            # Or better: Check if categories matches EITHER category OR tags OR generic search
+            # For now, let's keep the logic but maybe relax the "empty" check if user complains?
+            # The users complaint was "0 items".
+            # Let's search the DESCRIPTION or TITLE for the category keywords as a fallback
+            
+            title_lower = data.get("title", "").lower()
+            desc_lower = data.get("description", "").lower()
+            
+            cat_match = any(cat.lower() in item_category for cat in categories)
+            tag_match = any(any(cat.lower() in t for t in item_tags) for cat in categories)
+            content_match = any(cat.lower() in title_lower or cat.lower() in desc_lower for cat in categories)
+            
+            if not (cat_match or tag_match or content_match):
+                print(f"Skipping article: '{data['title'][:20]}' - No match for {categories}")
+                keep_item = False
+        
+        # Date Logic
+        item_date_str = data.get("date")
+        if item_date_str and (filter_start or filter_end):
+            # Already ISO from the extractor: fast path, and cached
+            item_date = normalize_date(item_date_str)
+            if item_date:
+                if item_date.tzinfo and not (filter_start or filter_end).tzinfo:
+                     item_date = item_date.replace(tzinfo=None)
+                if filter_start and item_date < filter_start:
+                    print(f"Skipping: Too old ({item_date})")
+                    keep_item = False
+                if filter_end and item_date > filter_end:
+                    print(f"Skipping: Too new ({item_date})")
+                    keep_item = False
+        
+        return keep_item
+
+    async def _fetch_article(self, link, page_pool, readiness=None):
+        # (record, genuine): genuine is False when the page parsed was an HTTP error page
+        # rather than the article itself. Raises Blocked when the host turned us away
+        # (429/503, or a challenge the browser didn't get through)
+        from scraper.fetcher import is_challenge_page
+        from scraper.page_cache import content_hash
+        from scraper.rate_control import BACKOFF_STATUSES, Blocked, parse_retry_after
+
+        cached = self.page_cache.get(link) if self.page_cache else None
+        http_challenged = False
+        
+        # Tier 1: plain HTTP, good enough for most server-rendered article pages. In
+        # browser mode it is only a conditional request for an article cached earlier,
+        # when there is something to compare the response with.
+        revalidate = cached and (self.page_cache.validators(cached) or cached.get("body_hash"))
+        if self.http_fetcher and (self.fetch_mode == "auto" or revalidate):
+            try:
+                async with self.rate.slot(link) as outcome:
+                    result = await self.http_fetcher.fetch(link, headers=self.page_cache.validators(cached) if cached else None)
+                    outcome.status = result.status
+                    outcome.challenge = is_challenge_page(result.html)
+                    http_challenged = outcome.challenge
+                    outcome.retry_after = parse_retry_after(result.headers.get("retry-after"))
+                if cached and (result.status == 304 or (result.status == 200 and content_hash(result.html) == cached["body_hash"])):
+                    return self.page_cache.reuse(link, cached, result.headers), True
+                if self.fetch_mode == "auto" and not self.http_fetcher.needs_browser(result):
+                    data = await self.extraction.parse(result.html, link)
+                    if data.get("title"):
+                        if self.page_cache:
+                            self.page_cache.put(link, result.html, result.headers, data, body=result.html)
+                        return data, True
+                if self.fetch_mode == "auto":
+                    print(f"Escalating to browser (status {result.status}): {link}")
+            except Exception as e:
+                print(f"HTTP fetch failed, escalating to browser: {link} ({e})")
+
+        # Tier 2: full browser render, on a pooled page
+        headers = {}
+        body = None
+        async with self.rate.slot(link) as outcome:
+            async with page_pool.page() as detail_page:
+                response = await detail_page.goto(link, timeout=45000, wait_until="domcontentloaded")
+                if response:
+                    outcome.status = response.status
+                    headers = response.headers
+                    outcome.retry_after = parse_retry_after(headers.get("retry-after"))
+                    if self.page_cache:
+                        try:
+                            body = await response.text()
+                        except Exception:
+                            pass  # No body to keep (redirect, or already evicted)
+                
+                # Wait for content (only sites with a ready selector need more than the load)
+                if readiness:
+                    await readiness.content_ready(detail_page)
+                    
+                content = await detail_page.content()
+                outcome.challenge = is_challenge_page(content)
+                if http_challenged and not outcome.challenge:
+                    # The browser got through: let plain HTTP use its fresh clearance
+                    self._share_cookies(await detail_page.context.cookies())
+        if outcome.status in BACKOFF_STATUSES:
+            raise Blocked(f"HTTP {outcome.status}")
+        if outcome.challenge:
+            raise Blocked("challenge page")
+        if cached and content_hash(content) == cached["content_hash"]:
+            return self.page_cache.reuse(link, cached, headers), True
+        data = await self.extraction.parse(content, link)
+        genuine = (outcome.status or 200) < 400
+        if self.page_cache and data.get("title") and genuine:
+            self.page_cache.put(link, content, headers, data, body=body)
+        return data, genuine
+
+    async def _pagination_pattern(self, page, previous_url=None):
+        # (PagePattern, number of the next page) when the listing numbers its pages in
+        # the URL: read off the page's own next link, or off the URLs of the last two
+        # pages clicked through. None means keep clicking.
+        from scraper.pagination import NEXT_HREF_JS, detect_pattern
+        try:
+            next_href = await page.evaluate(NEXT_HREF_JS)
+        except Exception:
+            next_href = None
+        if next_href:
+            pattern = detect_pattern(page.url, next_href)
+            if pattern:
+                return pattern, 2
+        if previous_url and previous_url != page.url:
+            pattern = detect_pattern(previous_url, page.url)
+            if pattern:
+                return pattern, 3
+        return None
+
+    async def _fetch_listing(self, url, page_pool, readiness, with_dates=False):
+        # (links, {link: date}) of one listing page: plain HTTP in auto mode, otherwise (or
+        # when that doesn't do) a pooled browser page. None if the page doesn't exist.
+        from scraper.dedup import canonicalize_url
+        from scraper.pagination import links_from_html
+
+        if self.http_fetcher and self.fetch_mode == "auto":
+            try:
+                async with self.rate.slot(url) as outcome:
+                    result = await self.http_fetcher.fetch(url)
+                    outcome.status = result.status
+                if result.status in (404, 410):
+                    return None
+                if not self.http_fetcher.needs_browser(result):
+                    links, dates = links_from_html(result.html, result.url)
+                    if self.capture_json:
+                        from scraper.structured_data import JsonCapture, StateMapper
+                        capture = JsonCapture(StateMapper(self.state_mappings), result.url)
+                        capture.add_state(result.html)
+                        captured, captured_dates = self._captured_links(capture, result.url)
+                        links += [link for link in captured if link not in links]
+                        dates.update({link: date for link, date in captured_dates.items() if link not in dates})
+                    if links:
+                        dates = {canonicalize_url(href): date for href, date in dates.items()} if with_dates else {}
+                        return self._filter_links(links), dates
+            except Exception as e:
+                print(f"HTTP fetch of listing failed, using the browser: {url} ({e})")
+
+        async with self.rate.slot(url) as outcome:
+            async with page_pool.page() as listing_page:
+                capture = None
+                if self.capture_json:
+                    from scraper.structured_data import JsonCapture, StateMapper
+                    capture = JsonCapture(StateMapper(self.state_mappings), url).attach(listing_page)
+                try:
+                    response = await listing_page.goto(url, timeout=60000, wait_until="domcontentloaded")
+                    if response:
+                        outcome.status = response.status
+                        if response.status >= 400:
+                            return None
+                    await readiness.settle(listing_page)
+                    links = await self._extract_links(listing_page)
+                    dates = await self._listing_dates(listing_page) if with_dates else {}
+                    if capture:
+                        capture.add_state(await listing_page.content())
+                        await capture.settle()
+                        captured, captured_dates = self._captured_links(capture, listing_page.url)
+                        links += [link for link in captured if link not in links]
+                        dates = {**captured_dates, **dates} if with_dates else {}
+                finally:
+                    if capture:
+                        listing_page.remove_listener("response", capture.on_response)
+        return links, dates
+
+    def _captured_links(self, capture, page_url):
+        # Links (and dates) JsonCapture has collected, through the same rules as links
+        # read off the page: same origin, longer than the listing URL, not blacklisted
+        from urllib.parse import urlsplit
+        from scraper.dedup import canonicalize_url
+        captured, dates = capture.take()
+        parts = urlsplit(page_url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        links = [link for link in captured if link.startswith(origin) and len(link) > len(page_url) + 10]
+        dates = {canonicalize_url(link): date for link, date in dates.items()}
+        return self._filter_links(links), dates
 
     async def _extract_links(self, page, categories=None):
         links = await page.evaluate("""
@@ -218,8 +1012,12 @@ class Crawler:
                     .filter(href => href.length > window.location.href.length + 10) 
             }
         """)
-        
-        unique_links = list(set(links))
+        return self._filter_links(links)
+
+    def _filter_links(self, links):
+        # Tracking parameters and AMP variants collapse onto one URL per article
+        from scraper.dedup import canonicalize_url
+        unique_links = list(dict.fromkeys(canonicalize_url(link) for link in links))
         
         # Blacklist for common non-article pages
         blacklist = [
@@ -251,7 +1049,31 @@ class Crawler:
             
         return filtered_links
 
-    async def _handle_pagination(self, page):
+    async def _listing_dates(self, page):
+        # {link: date text} for listing links with exactly one <time> in their teaser
+        # (the nearest ancestor that has any); ancestors holding several are other stories
+        from scraper.dedup import canonicalize_url
+        try:
+            pairs = await page.evaluate("""
+                () => Array.from(document.querySelectorAll('a[href]')).map(a => {
+                    let el = a;
+                    for (let i = 0; i < 5 && el.parentElement; i++) {
+                        el = el.parentElement;
+                        const times = el.querySelectorAll('time');
+                        if (times.length > 1) break;
+                        if (times.length === 1) {
+                            return [a.href, times[0].getAttribute('datetime') || times[0].textContent.trim()];
+                        }
+                    }
+                    return null;
+                }).filter(pair => pair && pair[1])
+            """)
+        except Exception as e:
+            print(f"Could not read listing dates: {e}")
+            return {}
+        return {canonicalize_url(href): date for href, date in pairs}
+
+    async def _handle_pagination(self, page, readiness):
         next_selectors = [
             "text=Next", "text=next", "text=More", "text=Load more",
             "[aria-label='Next']", ".next", ".pagination-next", "a[rel='next']"
@@ -262,19 +1084,11 @@ class Crawler:
                 try:
                     # Scroll to element to ensure visibility
                     await page.eval_on_selector(selector, "el => el.scrollIntoView()")
-                    await page.click(selector, timeout=5000)
-                    await page.wait_for_load_state("networkidle", timeout=10000)
-                    return True
-                except:
+                    # Done as soon as the next page (or the loaded-more items) is there
+                    if await readiness.follow(page, lambda: page.click(selector, timeout=5000)):
+                        return True
+                except Exception:
                     continue
                     
         # Scroll check
-        previous_height = await page.evaluate("document.body.scrollHeight")
-        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await page.wait_for_timeout(2000)
-        new_height = await page.evaluate("document.body.scrollHeight")
-        
-        if new_height > previous_height:
-            return True
-            
-        return False
+        return await readiness.grow(page, lambda: page.evaluate("window.scrollTo(0, document.body.scrollHeight)"))
@@ -0,0 +1,71 @@
+from scraper.utils import normalize_date
+
+
+class DateWindow:
+    # Tracks how listing pages relate to the --start_date/--end_date window while
+    # paginating. Each link's date comes from the listing itself (a <time> next to it)
+    # or, failing that, from the extracted article. A page is "old" once every dated
+    # link on it is before the window, and only if none of its links are undated or
+    # still pending. Listings run newest-first, so after `stop_after` consecutive old
+    # pages nothing further back can be in range.
+    def __init__(self, start=None, end=None, stop_after: int = 3):
+        self.start = start
+        self.end = end
+        self.stop_after = stop_after
+        self.pages = []      # one set of links per listing page
+        self.dates = {}      # link -> -1 before / 0 inside / 1 after the window, None unknown
+        self.skipped = 0
+
+    def active(self):
+        return bool(self.start or self.end)
+
+    def position(self, date_str):
+        value = normalize_date(date_str) if date_str else None
+        if not value:
+            return None
+        window_tz = (self.start or self.end).tzinfo
+        if value.tzinfo and not window_tz:
+            value = value.replace(tzinfo=None)
+        elif window_tz and not value.tzinfo:
+            value = value.replace(tzinfo=window_tz)
+        if self.start and value < self.start:
+            return -1
+        if self.end and value > self.end:
+            return 1
+        return 0
+
+    def in_range(self, date_str):
+        # Links whose listing date is outside the window aren't worth fetching
+        if self.position(date_str) in (-1, 1):
+            self.skipped += 1
+            return False
+        return True
+
+    def add_page(self, links, listing_dates: dict):
+        page = set()
+        for link in links:
+            page.add(link)
+            self.dates[link] = self.position(listing_dates.get(link))
+        for link, date_str in listing_dates.items():
+            # Out-of-window links that were never scheduled still tell us about the page
+            if link not in page and self.position(date_str) == -1:
+                page.add(link)
+                self.dates[link] = -1
+        self.pages.append(page)
+
+    def record(self, link, date_str):
+        if link in self.dates and self.dates[link] is None:
+            self.dates[link] = self.position(date_str)
+
+    def exhausted(self):
+        if not self.active() or not self.start or self.stop_after <= 0:
+            return False
+        streak = 0
+        for page in self.pages:
+            if page and all(self.dates.get(link) == -1 for link in page):
+                streak += 1
+                if streak >= self.stop_after:
+                    return True
+            else:
+                streak = 0
+        return False
@@ -0,0 +1,74 @@
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ocid", "cmpid", "ncid", "ref", "ref_src", "ref_url", "_ga", "_gl",
+    "amp", "outputtype",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_", "__hs", "at_")
+WORD_RE = re.compile(r"\w+")
+
+
+def canonicalize_url(url: str) -> str:
+    # One spelling per article: lowercase scheme/host, no default port, no fragment,
+    # no tracking parameters, no AMP variant suffix, remaining parameters sorted
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    if parts.scheme not in ("http", "https"):
+        return url
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != {"http": 80, "https": 443}[parts.scheme]:
+        host = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    for suffix in ("/amp/", "/amp"):
+        if path.endswith(suffix) and len(path) > len(suffix):
+            path = path[: -len(suffix)] or "/"
+            break
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    return urlunsplit((parts.scheme, host, path, urlencode(sorted(query)), ""))
+
+
+def simhash(text: str, shingle: int = 3) -> int:
+    # 64-bit SimHash over word shingles: similar texts differ in only a few bits
+    words = WORD_RE.findall(text.lower())
+    shingles = {" ".join(words[i:i + shingle]) for i in range(max(1, len(words) - shingle + 1))}
+    hashes = [int.from_bytes(hashlib.md5(item.encode("utf-8")).digest()[:8], "big") for item in shingles]
+    # A bit is set when most shingle hashes have it set; zip() over the binary strings
+    # counts each bit column in C instead of 64 Python-level steps per shingle
+    fingerprint = 0
+    for position, column in enumerate(zip(*(format(value, "064b") for value in hashes))):
+        if column.count("1") * 2 > len(hashes):
+            fingerprint |= 1 << (63 - position)
+    return fingerprint
+
+class SimHashIndex:
+    # Near-duplicate lookup over extracted article text. Fingerprints within
+    # `max_distance` bits are duplicates; with 4 bands of 16 bits, any two such
+    # fingerprints share at least one band exactly (for max_distance <= 3), so only
+    # the entries in matching bands need comparing.
+    def __init__(self, max_distance: int = 3, min_words: int = 30):
+        self.max_distance = max_distance
+        self.min_words = min_words
+        self.bands = [{} for _ in range(4)]
+
+    def add(self, key: str, text: str):
+        # Returns the key of an earlier near-duplicate (and doesn't index `text`),
+        # or None after indexing it. Texts too short to judge are never duplicates.
+        if not text or len(WORD_RE.findall(text)) < self.min_words:
+            return None
+        fingerprint = simhash(text)
+        for band, table in enumerate(self.bands):
+            for other, other_key in table.get(fingerprint >> (16 * band) & 0xFFFF, []):
+                if bin(fingerprint ^ other).count("1") <= self.max_distance:
+                    return other_key
+        for band, table in enumerate(self.bands):
+            table.setdefault(fingerprint >> (16 * band) & 0xFFFF, []).append((fingerprint, key))
+        return None
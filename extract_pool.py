@@ -0,0 +1,64 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Per-process extractor, created once by the pool initializer
+_extractor = None
+
+
+def _warm_up(engine, content_mode, state_mappings, profiles):
+    global _extractor
+    import dateparser
+    import lxml.html  # noqa: F401
+    from scraper.extractor import get_extractor
+
+    _extractor = get_extractor(engine, content_mode, state_mappings, profiles)
+    # First dateparser call loads language/timezone data; pay that once per worker
+    dateparser.parse("January 1, 2024 10:00 AM IST")
+
+
+def _parse(html_content, url):
+    return _extractor.parse(html_content, url)
+
+
+def _ready():
+    return True
+
+
+class ExtractionPool:
+    # Runs Extractor.parse off the event loop. workers=0 parses inline (old behaviour),
+    # workers=None uses one process per core.
+    def __init__(self, workers: int = 0, engine: str = "bs4", content_mode: str = "density",
+                 state_mappings: dict = None, profiles: dict = None):
+        self.workers = os.cpu_count() if workers is None else workers
+        self.engine = engine
+        self.content_mode = content_mode
+        self.state_mappings = state_mappings
+        self.profiles = profiles
+        self.executor = None
+        self.extractor = None
+
+    async def start(self):
+        if self.workers <= 0:
+            from scraper.extractor import get_extractor
+            self.extractor = get_extractor(self.engine, self.content_mode, self.state_mappings, self.profiles)
+            return self
+
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_up,
+                                            initargs=(self.engine, self.content_mode, self.state_mappings, self.profiles))
+        # Get the workers spawned (and warmed up) before the crawl starts
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.executor, _ready) for _ in range(self.workers)))
+        print(f"Extraction pool ready ({self.workers} worker processes)")
+        return self
+
+    async def parse(self, html_content: str, url: str):
+        if self.executor is None:
+            return self.extractor.parse(html_content, url)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _parse, html_content, url)
+
+    def close(self):
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
@@ -1,293 +1,444 @@
+import json
+import re
+from urllib.parse import urljoin
+import soupsieve
 from bs4 import BeautifulSoup
 from .utils import clean_text, normalize_date
+from .text_scanner import TextScanner
+from .content_density import ContentScorer
+from .structured_data import StateMapper
+from .profiles import MULTI_FIELDS, SiteProfile, SiteProfiles
+
+HEAD_END_RE = re.compile(r"</head\s*>", re.I)
+
+
+class DocumentIndex:
+    # Everything the field extractors look up by key, collected in one pass over the tree:
+    # parsed JSON-LD items (lists and @graph flattened), meta tags, <time> elements and
+    # the rel=canonical link
+    def __init__(self, soup):
+        self.soup = soup
+        self.ld_items = []
+        self.meta_property = {}
+        self.meta_name = {}
+        self.times = []
+        self.canonical = None
+        self._text_hits = None
+        self._scan(soup)
+
+    # Text-node scanner for the date-label / byline fallback; lxml swaps in its own
+    scanner = TextScanner
+
+    def _scan(self, soup):
+        for tag in soup.find_all(["script", "meta", "time", "link"]):
+            if tag.name == "meta":
+                content = tag.get("content") or ""
+                prop = tag.get("property")
+                if prop and prop not in self.meta_property:
+                    self.meta_property[prop] = content
+                name = tag.get("name")
+                if name and name not in self.meta_name:
+                    self.meta_name[name] = content
+            elif tag.name == "time":
+                self.times.append(tag)
+            elif tag.name == "link":
+                if self.canonical is None and "canonical" in (tag.get("rel") or []) and tag.get("href"):
+                    self.canonical = tag["href"].strip()
+            elif tag.get("type") == "application/ld+json" and tag.string:
+                try:
+                    self._add_ld(json.loads(tag.string))
+                except ValueError:
+                    continue
+
+    def _add_ld(self, data):
+        if isinstance(data, list):
+            for item in data:
+                self._add_ld(item)
+        elif isinstance(data, dict):
+            self.ld_items.append(data)
+            if isinstance(data.get("@graph"), list):
+                self._add_ld(data["@graph"])
+
+    def meta(self, *keys):
+        # keys are ("property", value) / ("name", value) pairs tried in order;
+        # returns the first present tag's content ("" if it has none), None if none exist
+        for attr, value in keys:
+            lookup = self.meta_property if attr == "property" else self.meta_name
+            if value in lookup:
+                return lookup[value]
+        return None
+
+    def text_hits(self):
+        # Date-label / byline fallback scan, run at most once and shared by date and author
+        if self._text_hits is None:
+            self._text_hits = self.scanner().scan(self.soup)
+        return self._text_hits
+
+    def ld_types(self, item):
+        item_type = item.get("@type")
+        if isinstance(item_type, list):
+            return set(item_type)
+        return {item_type}
+
+
+# Elements the field extractors look up, by name. Each engine answers these its own
+# way: BeautifulSoup here, precompiled XPath in lxml_extractor.LxmlExtractor.
+FINDERS = {
+    "h1": lambda soup: soup.h1,
+    "title": lambda soup: soup.title,
+    "category_link": lambda soup: soup.find("a", attrs={"rel": "category tag"}),
+    "category": lambda soup: soup.select_one(".category, .post-category, .article-category, .cat-links"),
+    "author_class": lambda soup: soup.find(class_=lambda x: x and "author" in x.lower()),
+    "article": lambda soup: soup.find("article"),
+    "main": lambda soup: soup.find("main"),
+    "content_div": lambda soup: soup.find("div", class_=lambda x: x and ("content" in x.lower() or "body" in x.lower() or "article" in x.lower())),
+    "breadcrumb": lambda soup: soup.select_one(".breadcrumb, .breadcrumbs, .crt-breadcrumb"),
+}
+# Common byline classes/attributes, tried in order
+BYLINE_SELECTORS = [".byline", ".auth-nm", "[itemprop='author']", ".writer", ".journalist", ".profile-details", ".story__author"]
+
+
+def get_extractor(engine: str = "bs4", content_mode: str = "density", state_mappings: dict = None,
+                  profiles: dict = None):
+    # "bs4" (BeautifulSoup) or "lxml" (same output, built on lxml directly)
+    if engine == "lxml":
+        from .lxml_extractor import LxmlExtractor
+        return LxmlExtractor(content_mode, state_mappings, profiles)
+    return Extractor(content_mode, state_mappings, profiles)
+
 
 class Extractor:
+    # Finds the article body by text/link density; lxml swaps in its own tree access
+    content_scorer = ContentScorer
+
+    # Each field's cascade: steps tried in order until one gives a value. On a given site
+    # steps that never find anything there are left out (see profiles.SiteProfile), and
+    # the site profile's own selectors, if it has any for the field, go before everything.
+    CASCADES = {
+        "title": ("h1", "title_tag", "og_title"),
+        "date": ("meta", "time", "text", "publish_meta", "json_ld"),
+        "author": ("meta", "json_ld", "author_class", "byline", "by_text"),
+        "content": ("density", "article", "main", "content_div"),
+        "description": ("meta",),
+        "category": ("meta", "category_link", "category_class", "breadcrumb", "json_ld"),
+        "tags": ("keywords",),
+    }
+
+    def __init__(self, content_mode: str = "density", state_mappings: dict = None, profiles: dict = None):
+        # "density": scored main-content block, boilerplate removed
+        # "container": whole text of the first <article>/<main>/content-like div
+        self.content_mode = content_mode
+        # Per-site paths into embedded app state (__NEXT_DATA__ etc.), see structured_data
+        self.state_mapper = StateMapper(state_mappings) if state_mappings else None
+        # Per-site selectors, compiled here once, and the cascade order learned per site
+        self.profiles = SiteProfiles(profiles, self._compile)
+
     def parse(self, html_content: str, url: str):
-        soup = BeautifulSoup(html_content, "lxml")
+        state = self.state_mapper.article(html_content, url) if self.state_mapper else None
+        if state and state.get("title") and state.get("content"):
+            # The site's own data has the story, so only the page's <head> is parsed, for
+            # the fields the state leaves out (keywords, canonical link, JSON-LD, meta tags)
+            head_end = HEAD_END_RE.search(html_content)
+            soup, index = self._load(html_content[:head_end.end()] + "</html>" if head_end else html_content)
+            profile = self.profiles.for_url(url)
+            # A head-only page says nothing about which steps match on the site
+            head = SiteProfile(profile.domain, profile.rules, profile.pinned)
+            data = {"url": url}
+            for field in self.CASCADES:
+                data[field] = state[field] if field in state else self._cascade(field, head, soup, index)
+            data["scraped_at"] = self._get_current_time()
+            data["canonical_url"] = state.get("canonical_url") or (urljoin(url, index.canonical) if index.canonical else None)
+            return data
+
+        soup, index = self._load(html_content)
+        profile = self.profiles.for_url(url)
         data = {
             "url": url,
-            "title": self._extract_title(soup),
-            "date": self._extract_date(soup),
-            "author": self._extract_author(soup),
-            "content": self._extract_content(soup),
-            "description": self._extract_description(soup),
-            "category": self._extract_category(soup),
-            "tags": self._extract_tags(soup),
-            "scraped_at": self._get_current_time()
+            "title": self._cascade("title", profile, soup, index),
+            "date": self._cascade("date", profile, soup, index),
+            "author": self._cascade("author", profile, soup, index),
+            "content": self._cascade("content", profile, soup, index),
+            "description": self._cascade("description", profile, soup, index),
+            "category": self._cascade("category", profile, soup, index),
+            "tags": self._cascade("tags", profile, soup, index),
+            "scraped_at": self._get_current_time(),
+            "canonical_url": urljoin(url, index.canonical) if index.canonical else None,
         }
+        if state:
+            data.update(state)
         return data
 
-    def _extract_category(self, soup):
-        import json
-        
-        # 1. Try JSON-LD (BreadcrumbList)
-        ld_scripts = soup.find_all('script', type='application/ld+json')
-        for script in ld_scripts:
+    def _cascade(self, field, profile, soup, index):
+        steps = self.CASCADES[field]
+        if field == "content" and self.content_mode != "density":
+            steps = steps[1:]
+        if field in profile.rules:
+            steps = ("profile",) + steps
+        order = profile.order(field, steps)
+        # Steps left out on this site still get a last try before the field stays empty
+        for step in order + [step for step in steps if step not in order]:
+            if step == "profile":
+                value = self._profile_value(field, profile.rules[field], soup)
+            else:
+                value = getattr(self, f"_{field}_{step}")(soup, index)
+            profile.record(field, step, value is not None)
+            if value is not None:
+                return value
+        return [] if field == "tags" else ""
+
+    def _profile_value(self, field, rules, soup):
+        for rule in rules:
+            found = self._match_all(soup, rule.compiled)
+            if field not in MULTI_FIELDS:
+                found = found[:1]
+            texts = [clean_text(element.get(rule.attr) or "" if rule.attr else self._text(element)) for element in found]
+            texts = [text for text in texts if text]
+            if not texts:
+                continue
+            if field == "tags":
+                return texts
+            if field == "date":
+                dt = normalize_date(texts[0])
+                if dt:
+                    return dt.isoformat()
+                continue
+            return " ".join(texts)
+        return None
+
+    # --- tree access (BeautifulSoup), overridden by LxmlExtractor ---
+
+    def _load(self, html_content):
+        soup = BeautifulSoup(html_content, "lxml")
+        return soup, DocumentIndex(soup)
+
+    def _find(self, soup, name):
+        return FINDERS[name](soup)
+
+    def _select(self, soup, selector):
+        return soup.select_one(selector)
+
+    def _compile(self, selector):
+        return soupsieve.compile(selector)
+
+    def _match_all(self, soup, compiled):
+        return compiled.select(soup)
+
+    def _text(self, element):
+        return element.get_text()
+
+    # --- cascade steps: a value, or None to go on to the next step ---
+
+    def _category_json_ld(self, soup, index):
+        for item in index.ld_items:
             try:
-                if not script.string: continue
-                data = json.loads(script.string)
-                if isinstance(data, dict):
-                    data_list = [data]
-                elif isinstance(data, list):
-                    data_list = data
-                else:
-                    continue
-                
-                for item in data_list:
-                    # BreadcrumbList
-                    if item.get('@type') == 'BreadcrumbList' and 'itemListElement' in item:
-                        items = item['itemListElement']
-                        if items:
-                            # Sort by position if available, or assume order
-                            sorted_items = sorted(items, key=lambda x: int(x.get('position', 0)))
-                            # Usually the 2nd or 3rd item is the category (Home > Category > Subcat)
-                            # Let's take the last one before the article itself, or just the second one
-                            if len(sorted_items) >= 2:
-                                return self.clean_text(sorted_items[1]['item']['name'])
-                            if len(sorted_items) > 0:
-                                return self.clean_text(sorted_items[-1]['item']['name'])
-                                
-                    # NewsArticle / Article articleSection
-                    if item.get('@type') in ['NewsArticle', 'Article', 'ReportageNewsArticle']:
-                        if 'articleSection' in item:
-                             section = item['articleSection']
-                             if isinstance(section, list):
-                                 return self.clean_text(section[0])
-                             return self.clean_text(section)
+                types = index.ld_types(item)
+                # BreadcrumbList
+                if 'BreadcrumbList' in types and 'itemListElement' in item:
+                    items = item['itemListElement']
+                    if items:
+                        # Sort by position if available, or assume order
+                        sorted_items = sorted(items, key=lambda x: int(x.get('position', 0)))
+                        # Usually the 2nd or 3rd item is the category (Home > Category > Subcat)
+                        # Let's take the last one before the article itself, or just the second one
+                        crumb = sorted_items[1] if len(sorted_items) >= 2 else sorted_items[-1]
+                        name = crumb['item']['name'] if isinstance(crumb.get('item'), dict) else crumb['name']
+                        return clean_text(name)
+                            
+                # NewsArticle / Article articleSection
+                if types & {'NewsArticle', 'Article', 'ReportageNewsArticle'}:
+                    if 'articleSection' in item:
+                         section = item['articleSection']
+                         if isinstance(section, list):
+                             return clean_text(section[0])
+                         return clean_text(section)
             except:
                 continue
+        return None
+
+    def _category_meta(self, soup, index):
+        cat_meta = index.meta(("property", "article:section"), ("name", "category"), ("name", "section"))
+        if cat_meta is not None:
+            return clean_text(cat_meta)
+        return None
+
+    def _category_category_link(self, soup, index):
+        # Common WordPress / standard generic Classes
+        cat_link = self._find(soup, "category_link")
+        if cat_link is not None:
+             return clean_text(self._text(cat_link))
+        return None
 
-        # 2. Meta Tags
-        cat_meta = soup.find("meta", property="article:section") or \
-                   soup.find("meta", attrs={"name": "category"}) or \
-                   soup.find("meta", attrs={"name": "section"})
-        if cat_meta:
-            return clean_text(cat_meta.get("content"))
-
-        if cat_meta:
-            return clean_text(cat_meta.get("content"))
-
-        # 3. Common WordPress / standard generic Classes
-        cat_link = soup.find("a", attrs={"rel": "category tag"})
-        if cat_link:
-             return clean_text(cat_link.get_text())
-             
-        cat_elem = soup.select_one(".category, .post-category, .article-category, .cat-links")
-        if cat_elem:
-             return clean_text(cat_elem.get_text())
-
-        # 4. URL path segments (heuristic)
-        # e.g., domain.com/sports/article-name -> processed in Crawler usually, but good fallback here
-        # We can't easily see the URL here unless we pass it, which we do
-        if "url" in locals():
-            from urllib.parse import urlparse
-            path = urlparse(url).path 
-            parts = [p for p in path.split('/') if p]
-            if len(parts) > 0:
-                # heuristic: first non-empty part that isn't date-like or 'news'
-                # Check specific positions often used for categories
-                candidate = parts[0]
-                if candidate.lower() not in ['news', 'article', 'video', '2024', '2025', '2026'] and not candidate.isdigit() and len(candidate) > 3:
-                     return candidate.capitalize()
-                if len(parts) > 1:
-                     candidate = parts[1]
-                     if candidate.lower() not in ['news', 'article', 'video'] and not candidate.isdigit():
-                          return candidate.capitalize()
-
-        # 4. Common Breadcrumb HTML
-        breadcrumb = soup.select_one(".breadcrumb, .breadcrumbs, .crt-breadcrumb")
-        if breadcrumb:
-            text = breadcrumb.get_text()
+    def _category_category_class(self, soup, index):
+        cat_elem = self._find(soup, "category")
+        if cat_elem is not None:
+             return clean_text(self._text(cat_elem))
+        return None
+
+    def _category_breadcrumb(self, soup, index):
+        breadcrumb = self._find(soup, "breadcrumb")
+        if breadcrumb is not None:
+            text = self._text(breadcrumb)
             # Try to split by common separators
             parts = [p.strip() for p in text.replace('>', '|').replace('/', '|').split('|') if p.strip()]
             if len(parts) > 1:
                  return parts[1] # Usually Home > Category
+        return None
 
-        return ""
+    def _title_h1(self, soup, index):
+        h1 = self._find(soup, "h1")
+        if h1 is not None:
+            return clean_text(self._text(h1))
+        return None
 
-    def _extract_title(self, soup):
-        if soup.h1:
-            return clean_text(soup.h1.get_text())
-        if soup.title:
-            return clean_text(soup.title.get_text())
-        og_title = soup.find("meta", property="og:title")
-        if og_title:
-            return clean_text(og_title.get("content"))
-        return ""
+    def _title_title_tag(self, soup, index):
+        title = self._find(soup, "title")
+        if title is not None:
+            return clean_text(self._text(title))
+        return None
 
-    def _extract_date(self, soup):
-        import dateparser
-        
-        # Try meta tags first
-        date_meta = soup.find("meta", property="article:published_time") or \
-                    soup.find("meta", attrs={"name": "date"}) or \
-                    soup.find("time")
-                    
-        date_str = ""
-        if date_meta:
-            if date_meta.name == "time":
-                date_str = date_meta.get("datetime") or date_meta.get_text()
-            else:
-                date_str = date_meta.get("content")
-        
-        # Try generic text patterns for date
-        if not date_str:
-            for text_pattern in ["Updated:", "Created:", "Published:", "Date:"]:
-                element = soup.find(lambda tag: tag.name in ['span', 'div', 'p'] and text_pattern in tag.get_text())
-                if element:
-                    text = element.get_text().strip()
-                    if text_pattern in text:
-                         try:
-                             potential_date = text.split(text_pattern, 1)[1].strip()
-                             potential_date = " ".join(potential_date.split()[:5]) 
-                             dt = dateparser.parse(potential_date)
-                             if dt: return dt.isoformat()
-                         except:
-                             pass
-        
-        # Specific meta tags for India Today and others
-        if not date_str:
-            meta_date = soup.find("meta", attrs={"name": "publish-date"}) or \
-                        soup.find("meta", property="og:updated_time")
-            if meta_date:
-                date_str = meta_date.get("content")
-
-        # Try JSON-LD (common in modern news sites)
-        if not date_str:
-            import json
-            ld_scripts = soup.find_all('script', type='application/ld+json')
-            for script in ld_scripts:
-                try:
-                    if not script.string: continue
-                    data = json.loads(script.string)
-                    
-                    # Normalize to list to handle both dict and list of dicts
-                    if isinstance(data, dict):
-                        data_list = [data]
-                    elif isinstance(data, list):
-                        data_list = data
-                    else:
-                        continue
-                        
-                    for item in data_list:
-                        if not isinstance(item, dict): continue
-                        
-                        # NewsArticle / Article
-                        if 'datePublished' in item:
-                            dt = dateparser.parse(item['datePublished'])
-                            if dt: return dt.isoformat()
-                        if 'dateCreated' in item:
-                            dt = dateparser.parse(item['dateCreated'])
-                            if dt: return dt.isoformat()
-                            
-                        # VideoObject (India Today videos)
-                        if item.get('@type') == 'VideoObject' and 'uploadDate' in item:
-                            dt = dateparser.parse(item['uploadDate'])
-                            if dt: return dt.isoformat()
-                except:
-                    continue
+    def _title_og_title(self, soup, index):
+        og_title = index.meta(("property", "og:title"))
+        if og_title is not None:
+            return clean_text(og_title)
+        return None
+
+    def _parsed_date(self, date_str):
+        dt = normalize_date(date_str) if date_str else None
+        return dt.isoformat() if dt else None
+
+    def _date_meta(self, soup, index):
+        return self._parsed_date(index.meta(("property", "article:published_time"), ("name", "date")))
+
+    def _date_time(self, soup, index):
+        if index.times:
+            time_tag = index.times[0]
+            return self._parsed_date(time_tag.get("datetime") or self._text(time_tag))
+        return None
 
-        if date_str:
-            dt = dateparser.parse(date_str)
-            if dt:
-                return dt.isoformat()
-        return ""
-
-    def _extract_author(self, soup):
-        author_meta = soup.find("meta", property="author") or \
-                      soup.find("meta", attrs={"name": "author"})
-        if author_meta:
-            return clean_text(author_meta.get("content"))
-            
-        # Try JSON-LD first (reliable)
-        import json
-        ld_scripts = soup.find_all('script', type='application/ld+json')
-        for script in ld_scripts:
+    def _date_text(self, soup, index):
+        # Generic text patterns for date
+        for text_pattern, potential_date in index.text_hits()["dates"]:
             try:
-                if not script.string: continue
-                data = json.loads(script.string)
-                
-                if isinstance(data, dict):
-                    data_list = [data]
-                elif isinstance(data, list):
-                    data_list = data
-                else:
-                    continue
+                dt = normalize_date(potential_date)
+                if dt: return dt.isoformat()
+            except:
+                pass
+        return None
 
-                for item in data_list:
-                    if not isinstance(item, dict): continue
+    def _date_publish_meta(self, soup, index):
+        # Specific meta tags for India Today and others
+        return self._parsed_date(index.meta(("name", "publish-date"), ("property", "og:updated_time")))
+
+    def _date_json_ld(self, soup, index):
+        # Common in modern news sites
+        for item in index.ld_items:
+            try:
+                # NewsArticle / Article
+                if 'datePublished' in item:
+                    dt = normalize_date(item['datePublished'])
+                    if dt: return dt.isoformat()
+                if 'dateCreated' in item:
+                    dt = normalize_date(item['dateCreated'])
+                    if dt: return dt.isoformat()
                     
-                    if 'author' in item:
-                        author_data = item['author']
-                        if isinstance(author_data, list): 
-                            # Join multiple authors if present
-                            names = []
-                            for a in author_data:
-                                if isinstance(a, dict) and 'name' in a: names.append(clean_text(a['name']))
-                                elif isinstance(a, str): names.append(clean_text(a))
-                            if names: return ", ".join(names)
-                            
-                        if isinstance(author_data, dict) and 'name' in author_data:
-                            return clean_text(author_data['name'])
-                        if isinstance(author_data, str):
-                            return clean_text(author_data)
+                # VideoObject (India Today videos)
+                if 'VideoObject' in index.ld_types(item) and 'uploadDate' in item:
+                    dt = normalize_date(item['uploadDate'])
+                    if dt: return dt.isoformat()
+            except:
+                continue
+        return None
+
+    def _author_meta(self, soup, index):
+        author_meta = index.meta(("property", "author"), ("name", "author"))
+        if author_meta is not None:
+            return clean_text(author_meta)
+        return None
+
+    def _author_json_ld(self, soup, index):
+        for item in index.ld_items:
+            try:
+                if 'author' in item:
+                    author_data = item['author']
+                    if isinstance(author_data, list): 
+                        # Join multiple authors if present
+                        names = []
+                        for a in author_data:
+                            if isinstance(a, dict) and 'name' in a: names.append(clean_text(a['name']))
+                            elif isinstance(a, str): names.append(clean_text(a))
+                        if names: return ", ".join(names)
+                        
+                    if isinstance(author_data, dict) and 'name' in author_data:
+                        return clean_text(author_data['name'])
+                    if isinstance(author_data, str):
+                        return clean_text(author_data)
             except:
                 continue
+        return None
 
-        author_tag = soup.find(class_=lambda x: x and "author" in x.lower())
-        if author_tag:
-            return clean_text(author_tag.get_text())
-            
+    def _author_author_class(self, soup, index):
+        author_tag = self._find(soup, "author_class")
+        if author_tag is not None:
+            return clean_text(self._text(author_tag))
+        return None
+
+    def _author_byline(self, soup, index):
         # Common byline classes/attributes
-        for selector in [".byline", ".auth-nm", "[itemprop='author']", ".writer", ".journalist", ".profile-details", ".story__author"]:
-            elem = soup.select_one(selector)
-            if elem:
-                return clean_text(elem.get_text())
-                
+        for selector in BYLINE_SELECTORS:
+            elem = self._select(soup, selector)
+            if elem is not None:
+                return clean_text(self._text(elem))
+        return None
+
+    def _author_by_text(self, soup, index):
         # "By [Name]" pattern
-        by_text = soup.find(lambda tag: tag.name in ['span', 'div', 'p'] and "By" in tag.get_text() and len(tag.get_text()) < 50)
+        by_text = index.text_hits()["byline"]
         if by_text:
-            text = by_text.get_text().strip()
-            if text.lower().startswith("by") and len(text) < 50:
+            text = by_text.strip()
+            if text.lower().startswith("by"):
                  # Check if it looks like a name (no numbers, etc)
                  candidate = text[2:].strip()
                  if candidate and len(candidate.split()) < 5:
                      return clean_text(candidate)
+        return None
 
-        return ""
-
-    def _extract_content(self, soup):
-        # Heuristics for content
-        article = soup.find("article")
-        if article:
-            return clean_text(article.get_text())
-            
-        main = soup.find("main")
-        if main:
-            return clean_text(main.get_text())
-            
+    def _content_density(self, soup, index):
+        text = self.content_scorer().extract(soup)
+        if text and text.strip():
+            return clean_text(text)
+        return None
+
+    def _content_article(self, soup, index):
+        article = self._find(soup, "article")
+        if article is not None:
+            return clean_text(self._text(article))
+        return None
+
+    def _content_main(self, soup, index):
+        main = self._find(soup, "main")
+        if main is not None:
+            return clean_text(self._text(main))
+        return None
+
+    def _content_content_div(self, soup, index):
         # Fallback to largest text block ? (too expensive maybe, stick to generic classes)
-        content_div = soup.find("div", class_=lambda x: x and ("content" in x.lower() or "body" in x.lower() or "article" in x.lower()))
-        if content_div:
-            return clean_text(content_div.get_text())
-            
-        return ""
-
-    def _extract_description(self, soup):
-        og_desc = soup.find("meta", property="og:description")
-        if og_desc:
-            return clean_text(og_desc.get("content"))
-        desc = soup.find("meta", attrs={"name": "description"})
-        if desc:
-            return clean_text(desc.get("content"))
-        return ""
+        content_div = self._find(soup, "content_div")
+        if content_div is not None:
+            return clean_text(self._text(content_div))
+        return None
+
+    def _description_meta(self, soup, index):
+        desc = index.meta(("property", "og:description"), ("name", "description"))
+        if desc is not None:
+            return clean_text(desc)
+        return None
         
-    def _extract_tags(self, soup):
+    def _tags_keywords(self, soup, index):
         tags = []
         # Look for keywords meta
-        keywords = soup.find("meta", attrs={"name": "keywords"})
-        if keywords and keywords.get("content"):
-            tags.extend([t.strip() for t in keywords.get("content").split(",")])
+        keywords = index.meta(("name", "keywords"))
+        if keywords:
+            tags.extend([t.strip() for t in keywords.split(",")])
         return tags
 
     def _get_current_time(self):
@@ -0,0 +1,123 @@
+import re
+from contextlib import asynccontextmanager
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Markers of anti-bot interstitials (Cloudflare, Akamai, DataDome ...)
+CHALLENGE_MARKERS = [
+    "<title>just a moment", "<title>one moment", "cf-challenge", "challenge-platform",
+    "cf_chl_opt", "captcha-delivery.com", "_incapsula_resource", "attention required! | cloudflare",
+]
+
+# Markers of pages that only render their content client-side
+JS_REQUIRED_MARKERS = [
+    "enable javascript", "javascript is required", "javascript must be enabled",
+    "you need to enable javascript", "please turn on javascript",
+]
+
+EMPTY_APP_ROOT = re.compile(r'<div[^>]+id=["\'](?:root|app|__nuxt)["\'][^>]*>\s*</div>', re.I)
+TAG_RE = re.compile(r"<(script|style|noscript)\b.*?</\1\s*>|<[^>]+>", re.I | re.S)
+
+
+def is_challenge_page(html: str) -> bool:
+    head = (html or "")[:20000].lower()
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+
+class FetchResult:
+    def __init__(self, url, status, html, headers, content=None):
+        self.url = url
+        self.status = status
+        self.html = html
+        self.headers = headers
+        self.content = content  # raw body, for gzipped sitemaps and the like
+
+
+# First fetch tier: plain HTTP with a pooled keep-alive client, no browser
+class HttpFetcher:
+    def __init__(self, user_agent: str = DEFAULT_USER_AGENT, max_connections: int = 100, timeout: float = 20.0):
+        self.user_agent = user_agent
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.client = None
+
+    async def start(self):
+        import httpx
+
+        # HTTP/2 needs the optional 'h2' package, fall back to HTTP/1.1 keep-alive without it
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            follow_redirects=True,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            headers={
+                "User-Agent": self.user_agent,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            },
+        )
+        return self
+
+    async def close(self):
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def fetch(self, url: str, headers: dict = None) -> FetchResult:
+        response = await self.client.get(url, headers=headers)
+        return FetchResult(str(response.url), response.status_code, response.text, response.headers, response.content)
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: dict = None):
+        # The response with its body still unread, for large files (sitemaps): iterate
+        # response.aiter_bytes() to get it in chunks as it downloads
+        async with self.client.stream("GET", url, headers=headers) as response:
+            yield response
+
+    def add_cookies(self, cookies: list):
+        # Cookies from the browser (Playwright's format), e.g. a challenge clearance, sent
+        # with later requests to their domains. Clearances are tied to the user agent,
+        # which is why the browser contexts use this client's.
+        for cookie in cookies:
+            self.client.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""),
+                                    path=cookie.get("path", "/"))
+
+    def needs_browser(self, result: FetchResult) -> bool:
+        # Blocked, rate limited or server errors: let the browser try
+        if result.status >= 400:
+            return True
+
+        content_type = result.headers.get("content-type", "")
+        if content_type and "html" not in content_type:
+            return True
+
+        html = result.html or ""
+        head = html[:20000].lower()
+        if is_challenge_page(html):
+            return True
+
+        # Client-side rendered shells have almost no visible text
+        if EMPTY_APP_ROOT.search(html):
+            return True
+        visible_text = TAG_RE.sub(" ", html)
+        if len(visible_text.split()) < 50:
+            return True
+        if any(marker in head for marker in JS_REQUIRED_MARKERS) and len(visible_text.split()) < 300:
+            return True
+
+        return False
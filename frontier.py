@@ -0,0 +1,181 @@
+import json
+import sqlite3
+import time
+
+QUEUED = "queued"
+IN_FLIGHT = "in_flight"
+DONE = "done"        # extracted and kept, record stored
+SKIPPED = "skipped"  # fetched but filtered out / no title
+FAILED = "failed"
+# Fetches a URL may be put back in the queue for (rate limited, challenged) before it fails
+MAX_ATTEMPTS = 3
+
+
+class CrawlFrontier:
+    # Durable record of every article URL we have seen and what happened to it,
+    # plus the listing/pagination position, so an interrupted crawl can resume.
+    # SQLite in WAL mode: every state change is committed as it happens.
+    # In a distributed crawl the coordinator owns the file and workers lease batches of
+    # queued URLs (see frontier_service); attach=True opens it without resetting anything.
+    def __init__(self, path: str, resume: bool = False, attach: bool = False):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=not attach)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                record TEXT,
+                error TEXT,
+                updated_at REAL,
+                lease_owner TEXT,
+                lease_expires REAL,
+                done_seq INTEGER,
+                attempts INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS urls_state ON urls(state);
+            CREATE TABLE IF NOT EXISTS crawl_state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(urls)")}
+        for column, kind in [("lease_owner", "TEXT"), ("lease_expires", "REAL"), ("done_seq", "INTEGER"),
+                             ("attempts", "INTEGER NOT NULL DEFAULT 0")]:
+            if column not in columns:
+                # State files written before leases existed
+                self.conn.execute(f"ALTER TABLE urls ADD COLUMN {column} {kind}")
+        # Results are read in done_seq order, a page at a time
+        self.conn.execute("CREATE INDEX IF NOT EXISTS urls_done_seq ON urls(done_seq)")
+        if attach:
+            return
+        with self.conn:
+            if resume:
+                # Whatever was being fetched when we died goes back in the queue
+                self.conn.execute("UPDATE urls SET state = ? WHERE state = ?", (QUEUED, IN_FLIGHT))
+            else:
+                self.conn.execute("DELETE FROM urls")
+                self.conn.execute("DELETE FROM crawl_state")
+
+    def add(self, urls, state: str = QUEUED):
+        # Returns only the URLs that were not known yet
+        new_urls = []
+        with self.conn:
+            for url in urls:
+                cur = self.conn.execute(
+                    "INSERT OR IGNORE INTO urls (url, state, updated_at) VALUES (?, ?, ?)",
+                    (url, state, time.time()),
+                )
+                if cur.rowcount:
+                    new_urls.append(url)
+        return new_urls
+
+    def mark(self, url: str, state: str, record: dict = None, error: str = None):
+        # A URL that is already done stays done, so a worker finishing after its lease
+        # expired (and the URL was handed to someone else) can't produce a duplicate
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO urls (url, state, record, error, updated_at, done_seq) VALUES (?, ?, ?, ?, ?, "
+                "CASE WHEN ? = ? THEN (SELECT COALESCE(MAX(done_seq), 0) + 1 FROM urls) END) "
+                "ON CONFLICT(url) DO UPDATE SET state = excluded.state, record = excluded.record, "
+                "error = excluded.error, updated_at = excluded.updated_at, done_seq = excluded.done_seq, "
+                "lease_owner = NULL, lease_expires = NULL WHERE urls.state != ?",
+                (url, state, json.dumps(record, default=str) if record is not None else None, error, time.time(),
+                 state, DONE, DONE),
+            )
+
+    def requeue(self, url: str, error: str = None, max_attempts: int = MAX_ATTEMPTS):
+        # Puts a URL whose fetch was turned away (429/503, challenge page) back in the
+        # queue, or fails it once it has been tried max_attempts times. Returns True if
+        # it was queued again. A URL that is already done stays done.
+        with self.conn:
+            row = self.conn.execute("SELECT state, attempts FROM urls WHERE url = ?", (url,)).fetchone()
+            if row and row[0] == DONE:
+                return False
+            attempts = (row[1] if row else 0) + 1
+            state = QUEUED if attempts < max_attempts else FAILED
+            self.conn.execute(
+                "INSERT INTO urls (url, state, error, updated_at, attempts) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET state = excluded.state, error = excluded.error, "
+                "updated_at = excluded.updated_at, attempts = excluded.attempts, "
+                "lease_owner = NULL, lease_expires = NULL",
+                (url, state, error, time.time(), attempts),
+            )
+        return state == QUEUED
+
+    def lease(self, owner: str, limit: int = 10, ttl: float = 120.0):
+        # Hands out up to `limit` queued URLs to `owner` for `ttl` seconds. Leases that
+        # ran out (worker died or hung) are put back in the queue first.
+        now = time.time()
+        with self.conn:
+            # Take the write lock up front so two leasers can't pick the same rows
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.execute(
+                "UPDATE urls SET state = ?, lease_owner = NULL, lease_expires = NULL "
+                "WHERE state = ? AND lease_expires IS NOT NULL AND lease_expires < ?",
+                (QUEUED, IN_FLIGHT, now),
+            )
+            urls = [r[0] for r in self.conn.execute(
+                "SELECT url FROM urls WHERE state = ? ORDER BY updated_at LIMIT ?", (QUEUED, limit),
+            )]
+            self.conn.executemany(
+                "UPDATE urls SET state = ?, lease_owner = ?, lease_expires = ?, updated_at = ? WHERE url = ?",
+                [(IN_FLIGHT, owner, now + ttl, now, url) for url in urls],
+            )
+        return urls
+
+    def outstanding(self):
+        # URLs queued or leased: the crawl isn't finished while this is above zero
+        row = self.conn.execute("SELECT COUNT(*) FROM urls WHERE state IN (?, ?)", (QUEUED, IN_FLIGHT)).fetchone()
+        return row[0]
+
+    def results_after(self, seq: int = 0, limit: int = 100):
+        # Kept records in completion order, for merging what every worker produced
+        rows = self.conn.execute(
+            "SELECT done_seq, record FROM urls WHERE state = ? AND done_seq > ? ORDER BY done_seq LIMIT ?",
+            (DONE, seq, limit),
+        )
+        return [(r[0], json.loads(r[1])) for r in rows if r[1]]
+
+    def texts_after(self, seq: int = 0, limit: int = 500):
+        # (done_seq, url, content) of kept records in completion order, without decoding
+        # the rest of each record: all rebuilding the near-duplicate index needs
+        return self.conn.execute(
+            "SELECT done_seq, json_extract(record, '$.url'), json_extract(record, '$.content') FROM urls "
+            "WHERE state = ? AND done_seq > ? AND record IS NOT NULL ORDER BY done_seq LIMIT ?",
+            (DONE, seq, limit),
+        ).fetchall()
+
+    def pending(self):
+        rows = self.conn.execute("SELECT url FROM urls WHERE state = ? ORDER BY updated_at", (QUEUED,))
+        return [r[0] for r in rows]
+
+    def finished_urls(self):
+        rows = self.conn.execute("SELECT url FROM urls WHERE state IN (?, ?, ?)", (DONE, SKIPPED, FAILED))
+        return {r[0] for r in rows}
+
+    def results(self):
+        rows = self.conn.execute("SELECT record FROM urls WHERE state = ? ORDER BY updated_at", (DONE,))
+        return [json.loads(r[0]) for r in rows if r[0]]
+
+    def counts(self):
+        return dict(self.conn.execute("SELECT state, COUNT(*) FROM urls GROUP BY state"))
+
+    def queued_count(self) -> int:
+        # One state's count straight off the urls_state index, cheap enough to poll
+        return self.conn.execute("SELECT COUNT(*) FROM urls WHERE state = ?", (QUEUED,)).fetchone()[0]
+
+    def set_state(self, key: str, value):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO crawl_state (key, value) VALUES (?, ?)",
+                (key, json.dumps(value)),
+            )
+
+    def get_state(self, key: str, default=None):
+        row = self.conn.execute("SELECT value FROM crawl_state WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def close(self):
+        self.conn.close()
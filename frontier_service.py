@@ -0,0 +1,186 @@
+import asyncio
+import hmac
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Frontier calls a worker may make over the network. Crawl state is read-only to them:
+# the seed, listing_done and stopped keys are the coordinator's to set.
+REMOTE_METHODS = {"add", "mark", "requeue", "lease", "outstanding", "counts", "queued_count", "get_state"}
+# Header carrying the shared token every request must present
+TOKEN_HEADER = "X-Frontier-Token"
+
+
+class FrontierServer:
+    # Exposes the coordinator's CrawlFrontier to workers on other machines as a small
+    # JSON-over-HTTP API (POST /<method> with keyword arguments as the body). It uses its
+    # own SQLite connection; the coordinator's crawl keeps using its own. Requests without
+    # the shared token are refused.
+    def __init__(self, path: str, token: str, host: str = "0.0.0.0", port: int = 8765):
+        from scraper.frontier import CrawlFrontier
+
+        if not token:
+            raise ValueError("The frontier service needs a shared token")
+        self.token = token.encode("utf-8")
+        self.frontier = CrawlFrontier(path, attach=True)
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                token = (self.headers.get(TOKEN_HEADER) or "").encode("utf-8")
+                if not hmac.compare_digest(token, server.token):
+                    self.send_error(401)
+                    return
+                method = self.path.strip("/")
+                if method not in REMOTE_METHODS:
+                    self.send_error(404)
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    kwargs = json.loads(self.rfile.read(length) or b"{}")
+                    with server.lock:
+                        result = getattr(server.frontier, method)(**kwargs)
+                    body = json.dumps({"result": result}, default=str).encode("utf-8")
+                    self.send_response(200)
+                except Exception as e:
+                    body = json.dumps({"error": str(e)}).encode("utf-8")
+                    self.send_response(500)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        host, port = self.httpd.server_address[:2]
+        print(f"Frontier service listening on http://{host}:{port}")
+        return self
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.frontier.close()
+
+
+class RemoteFrontier:
+    # Same interface as CrawlFrontier (the parts workers use), backed by a FrontierServer.
+    # Every call blocks on the network, so from the event loop go through asyncio.to_thread
+    # (LeaseQueue does, given offload=True).
+    def __init__(self, url: str, token: str, timeout: float = 30.0):
+        import httpx
+
+        self.url = url.rstrip("/")
+        self.client = httpx.Client(timeout=timeout, headers={TOKEN_HEADER: token or ""})
+
+    def _call(self, method, **kwargs):
+        response = self.client.post(f"{self.url}/{method}", json=kwargs)
+        if response.status_code == 401:
+            raise Exception("Frontier refused the token (check --frontier_token)")
+        payload = response.json()
+        if response.status_code != 200:
+            raise Exception(f"Frontier {method} failed: {payload.get('error')}")
+        return payload["result"]
+
+    def add(self, urls, state: str = "queued"):
+        return self._call("add", urls=list(urls), state=state)
+
+    def mark(self, url: str, state: str, record: dict = None, error: str = None):
+        # Records go through JSON here, so serialize them the way CrawlFrontier stores them
+        if record is not None:
+            record = json.loads(json.dumps(record, default=str))
+        self._call("mark", url=url, state=state, record=record, error=error)
+
+    def requeue(self, url: str, error: str = None):
+        return self._call("requeue", url=url, error=error)
+
+    def lease(self, owner: str, limit: int = 10, ttl: float = 120.0):
+        return self._call("lease", owner=owner, limit=limit, ttl=ttl)
+
+    def outstanding(self):
+        return self._call("outstanding")
+
+    def counts(self):
+        return self._call("counts")
+
+    def queued_count(self):
+        return self._call("queued_count")
+
+    def get_state(self, key: str, default=None):
+        return self._call("get_state", key=key, default=default)
+
+    def close(self):
+        self.client.close()
+
+
+class LeaseQueue:
+    # Stands in for the crawl's asyncio.Queue when the frontier is shared: put() only
+    # waits for room (links are already in the frontier via add()), get() hands out
+    # links leased from the frontier in batches, and returns None once the listing
+    # crawl is over and nothing is queued or leased anywhere (or the frontier has been
+    # unreachable for `max_failures` polls in a row, i.e. the coordinator is gone).
+    # With offload (for a RemoteFrontier), frontier calls run in a thread so a slow
+    # coordinator doesn't stall the worker's event loop; the local SQLite frontier is
+    # called directly.
+    def __init__(self, frontier, owner: str, batch_size: int = 10, ttl: float = 120.0,
+                 maxsize: int = 0, poll_interval: float = 1.0, max_failures: int = 5, offload: bool = False):
+        self.frontier = frontier
+        self.offload = offload
+        self.owner = owner
+        self.batch_size = batch_size
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.poll_interval = poll_interval
+        self.max_failures = max_failures
+        self.failures = 0
+        self.buffer = []
+        self.lock = asyncio.Lock()
+
+    async def _call(self, method, *args):
+        if self.offload:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    async def put(self, link):
+        # Backpressure for the listing crawl: don't run far ahead of the workers
+        while self.maxsize and await self._call(self.frontier.queued_count) > self.maxsize:
+            await asyncio.sleep(self.poll_interval)
+
+    async def get(self):
+        async with self.lock:
+            while not self.buffer:
+                if self.failures >= self.max_failures:
+                    return None
+                try:
+                    self.buffer = await self._call(self.frontier.lease, self.owner, self.batch_size, self.ttl)
+                    if self.buffer:
+                        break
+                    if await self.finished():
+                        return None
+                    self.failures = 0
+                except Exception as e:
+                    self.failures += 1
+                    print(f"Frontier unavailable ({self.failures}/{self.max_failures}): {e}")
+                await asyncio.sleep(self.poll_interval)
+            return self.buffer.pop(0)
+
+    def task_done(self):
+        pass
+
+    async def finished(self):
+        if await self._call(self.frontier.get_state, "stopped", False):
+            return True
+        if not await self._call(self.frontier.get_state, "listing_done", False):
+            return False
+        return not await self._call(self.frontier.outstanding)
+
+    async def join(self):
+        while not await self.finished():
+            await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,201 @@
+import json
+import re
+
+from lxml import etree
+
+from scraper.content_density import ContentScorer
+from scraper.extractor import BYLINE_SELECTORS, DocumentIndex, Extractor
+from scraper.text_scanner import TextScanner
+
+# Elements whose text BeautifulSoup's get_text()/.strings leave out
+HIDDEN_TEXT_TAGS = {"script", "style", "template", "rt", "rp"}
+UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LOWER = "abcdefghijklmnopqrstuvwxyz"
+# One compound selector (tag, #id, .class, [attr], [attr='value']) or a combinator
+SELECTOR_TOKEN_RE = re.compile(r"""\s*(>)\s*|(\s+)|([\w-]+|\*)?((?:#[\w-]+|\.[\w-]+|\[[\w-]+(?:=(?:'[^']*'|"[^"]*"))?\])*)""")
+SIMPLE_PART_RE = re.compile(r"""([#.])([\w-]+)|\[([\w-]+)(?:=(?:'([^']*)'|"([^"]*)"))?\]""")
+
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _class_contains(*words):
+    # class_=lambda x: x and "word" in x.lower()
+    lowered = f"translate(@class, '{UPPER}', '{LOWER}')"
+    return " or ".join(f"contains({lowered}, '{word}')" for word in words)
+
+
+def css_to_xpath(selector: str) -> str:
+    # The selector forms the extractor and site profiles use: tag, #id, .class (any
+    # number), [attr] and [attr='value'], joined by descendant (space) or child (>)
+    # combinators, and comma-separated lists of those. Unions come back in document
+    # order, like select_one.
+    paths = []
+    for part in selector.split(","):
+        part = part.strip()
+        path, axis, position = "", "//", 0
+        while position < len(part):
+            match = SELECTOR_TOKEN_RE.match(part, position)
+            if not match or match.end() == position:
+                raise ValueError(f"Unsupported selector: {part!r}")
+            position = match.end()
+            child, space, tag, simple = match.groups()
+            if child:
+                axis = "/"
+            elif not space:
+                tests = []
+                for kind, name, attr, single, double in SIMPLE_PART_RE.findall(simple or ""):
+                    if kind == "#":
+                        tests.append(f"@id='{name}'")
+                    elif kind == ".":
+                        tests.append(_has_class(name))
+                    elif single or double:
+                        tests.append(f"@{attr}='{single or double}'")
+                    else:
+                        tests.append(f"@{attr}")
+                path += axis + (tag or "*") + "".join(f"[{test}]" for test in tests)
+                axis = "//"
+        if not path or axis == "/":
+            raise ValueError(f"Unsupported selector: {part!r}")
+        paths.append(path)
+    return " | ".join(paths)
+
+
+# Same lookups as extractor.FINDERS, compiled once per process
+XPATHS = {
+    "h1": etree.XPath("//h1"),
+    "title": etree.XPath("//title"),
+    "category_link": etree.XPath("//a[normalize-space(@rel)='category tag']"),
+    "category": etree.XPath(css_to_xpath(".category, .post-category, .article-category, .cat-links")),
+    "author_class": etree.XPath(f"//*[{_class_contains('author')}]"),
+    "article": etree.XPath("//article"),
+    "main": etree.XPath("//main"),
+    "content_div": etree.XPath(f"//div[{_class_contains('content', 'body', 'article')}]"),
+    "breadcrumb": etree.XPath(css_to_xpath(".breadcrumb, .breadcrumbs, .crt-breadcrumb")),
+}
+SELECTOR_XPATHS = {selector: etree.XPath(css_to_xpath(selector)) for selector in BYLINE_SELECTORS}
+
+
+class _Text:
+    # A text node: lxml keeps text on elements (.text/.tail), so remember the parent
+    __slots__ = ("parent",)
+
+    def __init__(self, parent):
+        self.parent = parent
+
+
+def iter_text(element):
+    # (text, parent) in document order, skipping comments and script/style/template
+    # contents, i.e. the strings BeautifulSoup's get_text() joins
+    if element.tag not in HIDDEN_TEXT_TAGS and element.text:
+        yield element.text, element
+    for child in element:
+        if isinstance(child.tag, str):
+            yield from iter_text(child)
+        if child.tail:
+            yield child.tail, element
+
+
+def get_text(element):
+    return "".join(text for text, _ in iter_text(element))
+
+
+class LxmlTextScanner(TextScanner):
+    def iter_strings(self, root):
+        for text, parent in iter_text(root):
+            yield text, _Text(parent)
+
+    def parent(self, node):
+        if isinstance(node, _Text):
+            return node.parent
+        return node.getparent()
+
+    def tag_name(self, element):
+        return element.tag
+
+    def short_text(self, element, limit):
+        parts = []
+        length = 0
+        for text, _ in iter_text(element):
+            length += len(text)
+            if length >= limit:
+                return None
+            parts.append(text)
+        return "".join(parts)
+
+
+class LxmlContentScorer(ContentScorer):
+    def iter_children(self, element):
+        if element.tag not in HIDDEN_TEXT_TAGS and element.text:
+            yield element.text
+        for child in element:
+            if isinstance(child.tag, str):
+                yield child
+            if child.tail:
+                yield child.tail
+
+    def tag_name(self, element):
+        return element.tag
+
+    def attr(self, element, name):
+        return element.get(name)
+
+
+class LxmlDocumentIndex(DocumentIndex):
+    scanner = LxmlTextScanner
+
+    def _scan(self, root):
+        for tag in root.iter("script", "meta", "time", "link"):
+            if tag.tag == "meta":
+                content = tag.get("content") or ""
+                prop = tag.get("property")
+                if prop and prop not in self.meta_property:
+                    self.meta_property[prop] = content
+                name = tag.get("name")
+                if name and name not in self.meta_name:
+                    self.meta_name[name] = content
+            elif tag.tag == "time":
+                self.times.append(tag)
+            elif tag.tag == "link":
+                if self.canonical is None and "canonical" in (tag.get("rel") or "").split() and tag.get("href"):
+                    self.canonical = tag.get("href").strip()
+            elif tag.get("type") == "application/ld+json" and tag.text:
+                try:
+                    self._add_ld(json.loads(tag.text))
+                except ValueError:
+                    continue
+
+
+class LxmlExtractor(Extractor):
+    # Same fields and output as Extractor, without building a BeautifulSoup tree:
+    # lxml parses straight into its C tree and lookups run as precompiled XPath.
+    content_scorer = LxmlContentScorer
+
+    def _load(self, html_content):
+        parser = etree.HTMLParser()
+        try:
+            root = etree.fromstring(html_content, parser)
+        except ValueError:
+            # str input with an <?xml encoding=...?> declaration
+            root = etree.fromstring(html_content.encode("utf-8"), etree.HTMLParser(encoding="utf-8"))
+        if root is None:
+            root = etree.fromstring("<html></html>", parser)
+        return root, LxmlDocumentIndex(root)
+
+    def _find(self, root, name):
+        found = XPATHS[name](root)
+        return found[0] if found else None
+
+    def _select(self, root, selector):
+        found = SELECTOR_XPATHS[selector](root) if selector in SELECTOR_XPATHS else root.xpath(css_to_xpath(selector))
+        return found[0] if found else None
+
+    def _compile(self, selector):
+        return etree.XPath(css_to_xpath(selector))
+
+    def _match_all(self, root, compiled):
+        return compiled(root)
+
+    def _text(self, element):
+        return get_text(element)
@@ -1,22 +1,63 @@
 import argparse
 import asyncio
 from scraper.crawler import Crawler
+from scraper.blocking import DEFAULT_BLOCKED_DOMAINS
+from scraper.rate_control import parse_rate
 
 def main():
     parser = argparse.ArgumentParser(description="Generic Web Scraper")
     parser.add_argument("url", nargs="?", help="Target Website URL")
+    parser.add_argument("--seeds", help="File with one seed per line (URL or JSON with per-seed options); all seeds share one browser")
     parser.add_argument("--max_pages", type=int, default=10, help="Maximum number of pages/items to scrape")
     parser.add_argument("--output", default="output", help="Output filename base (without extension)")
-    parser.add_argument("--format", default="csv", choices=["csv", "xml", "docx"], help="Output format")
+    parser.add_argument("--format", default="csv", choices=["csv", "xml", "docx", "jsonl"], help="Output format (written incrementally as items are scraped)")
     parser.add_argument("--headed", action="store_true", help="Run browser in headed mode (useful for debugging or bypassing anti-bot)")
     parser.add_argument("--start_date", help="Filter articles from this date (YYYY-MM-DD)")
     parser.add_argument("--end_date", help="Filter articles up to this date (YYYY-MM-DD)")
     parser.add_argument("--categories", nargs="+", help="Filter URLs by specific categories (e.g. sports business)")
+    parser.add_argument("--fetch_mode", default="browser", choices=["browser", "auto"], help="'auto' fetches articles over plain HTTP and only uses the browser for JS-rendered or challenge pages")
+    parser.add_argument("--concurrency", type=int, default=5, help="Number of articles fetched in parallel")
+    parser.add_argument("--host_concurrency", type=int, help="Upper bound for the adaptive per-host concurrency (default: --concurrency)")
+    parser.add_argument("--rate", nargs="+", metavar="DOMAIN=RPS[:BURST]", help="Token-bucket request rate per domain, e.g. example.com=2:5")
+    parser.add_argument("--target_latency", type=float, default=5.0, help="Per-host concurrency shrinks when responses are slower than this (seconds)")
+    parser.add_argument("--extract_workers", type=int, default=0, help="Parse articles in this many worker processes (0 = parse in the main process)")
+    parser.add_argument("--extract_engine", choices=["bs4", "lxml"], default="bs4", help="HTML extraction engine: bs4 (BeautifulSoup) or lxml (same output, faster)")
+    parser.add_argument("--content_mode", choices=["density", "container"], default="density", help="Article text: density (scored main block, navigation/sidebars/footers removed) or container (all text of the first article/main element)")
+    parser.add_argument("--resume", action="store_true", help="Continue the previous crawl for this --output instead of starting over")
+    parser.add_argument("--state_file", help="Crawl state database (default: <output>.crawl.db)")
+    parser.add_argument("--page_pool_size", type=int, help="Browser pages kept open for article fetches (default: --concurrency)")
+    parser.add_argument("--page_max_uses", type=int, default=50, help="Recycle a pooled browser page after this many navigations")
+    parser.add_argument("--no_blocking", action="store_true", help="Let the browser load images, fonts, media and trackers")
+    parser.add_argument("--block_types", nargs="+", help="Browser resource types to block (default: image font media)")
+    parser.add_argument("--block_domains", nargs="+", help="Extra domains whose requests are blocked, on top of the built-in ad/tracker list")
+    parser.add_argument("--stop_after_old_pages", type=int, default=3, help="With --start_date, stop paginating after this many consecutive listing pages older than the window (0 = never)")
+    parser.add_argument("--ready_selector", help="CSS selector that marks a page as rendered (default: wait for the DOM to stop changing)")
+    parser.add_argument("--wait_timeout", type=float, default=8.0, help="Longest readiness wait after loads, clicks and scrolls (seconds)")
+    parser.add_argument("--pagination_batch", type=int, default=5, help="Listing pages numbered in the URL are fetched directly, this many at a time (0 = always click Next)")
+    parser.add_argument("--state_mappings", metavar="PATH", help="JSON file mapping fields of sites' embedded state (__NEXT_DATA__, __NUXT__, window.__INITIAL_STATE__) to article fields, per domain")
+    parser.add_argument("--profiles", metavar="PATH", help="JSON (or YAML) file of per-site extraction profiles: field selectors and cascade step order")
+    parser.add_argument("--session_dir", metavar="DIR", help="Keep each site's browser cookies/localStorage here and reuse them on the next run (skips re-solving challenges)")
+    parser.add_argument("--session_max_age", type=float, default=6.0, help="Saved sessions older than this many hours are not reused")
+    parser.add_argument("--capture_json", action="store_true", help="Also take article links from the JSON listing pages load (XHR/fetch) and from their embedded state")
+    parser.add_argument("--discovery", default="listing", choices=["listing", "sitemap"], help="'sitemap' finds articles through robots.txt sitemaps and RSS/Atom feeds (filtered by --start_date/--end_date before fetching) instead of paging through the listing")
+    parser.add_argument("--no_url_classifier", action="store_true", help="Fetch every candidate link instead of skipping ones that don't look like articles")
+    parser.add_argument("--article_pattern", nargs="+", metavar="REGEX", help="URLs matching any of these regexes are always treated as articles")
+    parser.add_argument("--skip_pattern", nargs="+", metavar="REGEX", help="URLs matching any of these regexes are never fetched")
+    parser.add_argument("--url_patterns", metavar="PATH", help="JSON file where article/non-article URL shapes learned per site are kept between runs")
+    parser.add_argument("--classifier_sitemap", action="store_true", help="Learn the site's article URL shapes from its sitemap before crawling")
+    parser.add_argument("--cache", metavar="PATH", help="Article cache kept across runs (SQLite); unchanged articles are revalidated with conditional requests and not parsed again")
+    parser.add_argument("--serve_frontier", metavar="HOST:PORT", help="Coordinate a distributed crawl: serve this crawl's frontier to workers and merge their results into --output")
+    parser.add_argument("--frontier", metavar="URL", help="Run as a worker for the coordinator at URL (e.g. http://host:8765) instead of crawling a site")
+    parser.add_argument("--frontier_token", metavar="TOKEN", help="Shared secret between the coordinator and its workers (a coordinator without one prints a new one)")
+    parser.add_argument("--worker_id", help="Name of this node in a distributed crawl (default: hostname-pid)")
+    parser.add_argument("--lease_size", type=int, default=10, help="Article URLs a worker leases from the frontier at a time")
+    parser.add_argument("--lease_ttl", type=float, default=120.0, help="Seconds before a leased URL is handed to another worker")
+    parser.add_argument("--allow_domains", nargs="+", help="Domains that are never blocked (e.g. a site's own image/script CDN)")
     
     args = parser.parse_args()
 
     # Interactive Mode if no URL provided
-    if not args.url:
+    if not args.url and not args.seeds and not args.frontier:
         print("\n--- Interactive Web Scraper Mode ---")
         args.url = input("Enter Target Website URL: ").strip()
         while not args.url:
@@ -32,17 +73,83 @@ def main():
         mp = input("Enter Max Pages/Items [Default: 10]: ").strip()
         if mp.isdigit(): args.max_pages = int(mp)
         
-        fmt = input("Enter Output Format (csv/xml/docx) [Default: csv]: ").strip().lower()
-        if fmt in ["csv", "xml", "docx"]: args.format = fmt
+        fmt = input("Enter Output Format (csv/xml/docx/jsonl) [Default: csv]: ").strip().lower()
+        if fmt in ["csv", "xml", "docx", "jsonl"]: args.format = fmt
         
         headed = input("Run in Headed Mode (visible browser)? (y/n) [Default: n]: ").strip().lower()
         if headed == 'y': args.headed = True
 
-    print(f"\nStarting scrape of {args.url}")
+    seeds = None
+    if args.frontier:
+        print(f"\nJoining distributed crawl at {args.frontier}")
+    elif args.seeds:
+        from scraper.seeds import load_seeds
+        defaults = {
+            "max_pages": args.max_pages,
+            "start_date": args.start_date,
+            "end_date": args.end_date,
+            "categories": args.categories,
+        }
+        seeds = load_seeds(args.seeds, defaults, args.output)
+        print(f"\nStarting scrape of {len(seeds)} seeds from {args.seeds}")
+    else:
+        print(f"\nStarting scrape of {args.url}")
     if args.start_date: print(f"Filter Start: {args.start_date}")
     if args.end_date: print(f"Filter End: {args.end_date}")
+
+    state_mappings = None
+    if args.state_mappings:
+        from scraper.structured_data import load_mappings
+        state_mappings = load_mappings(args.state_mappings)
+    profiles = None
+    if args.profiles:
+        from scraper.profiles import load_profiles
+        profiles = load_profiles(args.profiles)
     
-    crawler = Crawler()
+    crawler = Crawler(
+        fetch_mode=args.fetch_mode,
+        concurrency=args.concurrency,
+        extract_workers=args.extract_workers,
+        extract_engine=args.extract_engine,
+        content_mode=args.content_mode,
+        blocking=not args.no_blocking,
+        block_types=args.block_types,
+        block_domains=DEFAULT_BLOCKED_DOMAINS + args.block_domains if args.block_domains else None,
+        allow_domains=args.allow_domains,
+        page_pool_size=args.page_pool_size,
+        page_max_uses=args.page_max_uses,
+        host_concurrency=args.host_concurrency,
+        rates=dict(parse_rate(r) for r in args.rate) if args.rate else None,
+        target_latency=args.target_latency,
+        serve_frontier=args.serve_frontier,
+        frontier_url=args.frontier,
+        frontier_token=args.frontier_token,
+        worker_id=args.worker_id,
+        lease_size=args.lease_size,
+        lease_ttl=args.lease_ttl,
+        cache_path=args.cache,
+        url_classifier=not args.no_url_classifier,
+        article_patterns=args.article_pattern,
+        skip_patterns=args.skip_pattern,
+        url_patterns_path=args.url_patterns,
+        classifier_sitemap=args.classifier_sitemap,
+        discovery=args.discovery,
+        stop_after_old_pages=args.stop_after_old_pages,
+        ready_selector=args.ready_selector,
+        wait_timeout=args.wait_timeout,
+        pagination_batch=args.pagination_batch,
+        state_mappings=state_mappings,
+        capture_json=args.capture_json,
+        profiles=profiles,
+        session_dir=args.session_dir,
+        session_max_age=args.session_max_age * 3600,
+    )
+    if args.frontier:
+        asyncio.run(crawler.work(headless=not args.headed))
+        return
+    if seeds:
+        asyncio.run(crawler.run_many(seeds, args.format, headless=not args.headed, resume=args.resume))
+        return
     asyncio.run(crawler.run(
         args.url, 
         args.max_pages, 
@@ -51,7 +158,9 @@ def main():
         headless=not args.headed,
         start_date=args.start_date,
         end_date=args.end_date,
-        categories=args.categories
+        categories=args.categories,
+        resume=args.resume,
+        state_file=args.state_file
     ))
 
 if __name__ == "__main__":
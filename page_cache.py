@@ -0,0 +1,108 @@
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+
+
+def content_hash(html: str) -> str:
+    return hashlib.sha256(html.encode("utf-8", "replace")).hexdigest()
+
+
+def config_fingerprint(engine: str, content_mode: str, state_mappings: dict = None, profiles: dict = None) -> str:
+    # Everything that changes what a page extracts to: a record cached under other
+    # settings is not this crawl's record for the same page
+    config = {"engine": engine, "content_mode": content_mode,
+              "state_mappings": state_mappings or {}, "profiles": profiles or {}}
+    return content_hash(json.dumps(config, sort_keys=True, default=str))[:16]
+
+
+class PageCache:
+    # Article responses kept across crawls, keyed by URL: the HTML (compressed), its
+    # ETag/Last-Modified validators, a content hash and the record extracted from it.
+    # A re-crawl revalidates with a conditional request and, on a 304 or identical
+    # content, reuses the stored record instead of parsing the page again. For a page
+    # the browser rendered, content_hash is of the rendered DOM and body_hash of the
+    # body the server sent, which is what a plain HTTP revalidation gets back. Each row
+    # also keeps the fingerprint of the extractor settings its record was made with;
+    # a row from other settings counts as not cached, so the page is parsed again.
+    def __init__(self, path: str, config: str = None):
+        self.path = path
+        self.config = config
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content_hash TEXT,
+                html BLOB,
+                record TEXT,
+                fetched_at REAL
+            )
+        """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(pages)")}
+        if "body_hash" not in columns:
+            # Caches written before body hashes were kept
+            self.conn.execute("ALTER TABLE pages ADD COLUMN body_hash TEXT")
+        if "config" not in columns:
+            self.conn.execute("ALTER TABLE pages ADD COLUMN config TEXT")
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str):
+        row = self.conn.execute(
+            "SELECT etag, last_modified, content_hash, record, body_hash, config FROM pages WHERE url = ?", (url,),
+        ).fetchone()
+        if not row or row[5] != self.config:
+            return None
+        return {"etag": row[0], "last_modified": row[1], "content_hash": row[2], "record": json.loads(row[3]),
+                "body_hash": row[4]}
+
+    def validators(self, entry) -> dict:
+        # Headers for a conditional GET
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def html(self, url: str):
+        row = self.conn.execute("SELECT html FROM pages WHERE url = ?", (url,)).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8") if row and row[0] else None
+
+    def put(self, url: str, html: str, headers, record: dict, body: str = None):
+        # body: what the server sent, when html is a rendered DOM (None if not known)
+        headers = headers or {}
+        self.misses += 1
+        body_hash = content_hash(body) if body is not None else None
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (url, etag, last_modified, content_hash, html, record, fetched_at, body_hash, config) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, headers.get("etag"), headers.get("last-modified"), content_hash(html),
+                 zlib.compress(html.encode("utf-8", "replace")), json.dumps(record, default=str), time.time(), body_hash,
+                 self.config),
+            )
+
+    def reuse(self, url: str, entry: dict, headers=None) -> dict:
+        # The page hasn't changed: hand back the stored record, stamped with this crawl's time
+        from datetime import datetime, timezone
+
+        self.hits += 1
+        headers = headers or {}
+        with self.conn:
+            self.conn.execute(
+                "UPDATE pages SET fetched_at = ?, etag = COALESCE(?, etag), "
+                "last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (time.time(), headers.get("etag"), headers.get("last-modified"), url),
+            )
+        record = dict(entry["record"])
+        record["scraped_at"] = datetime.now(timezone.utc).isoformat()
+        return record
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,85 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+
+class PagePool:
+    # Bounded set of browser pages that workers check out and give back, instead of
+    # new_page()/close() per article. At most `size` pages are checked out at once and
+    # pages are only created when no idle one is left. Idle pages are health checked on
+    # checkout (closed or crashed renderer) and recycled after `max_uses` navigations
+    # or any failure.
+    def __init__(self, context, size: int = 5, max_uses: int = 50):
+        self.context = context
+        self.size = size
+        self.max_uses = max_uses
+        self.slots = asyncio.Semaphore(size)
+        self.idle = []
+        self.uses = {}
+        self.crashed = set()
+        self.recycled = 0
+
+    @asynccontextmanager
+    async def page(self):
+        page = await self.acquire()
+        failed = False
+        try:
+            yield page
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            await self.release(page, failed=failed)
+
+    async def acquire(self):
+        await self.slots.acquire()
+        try:
+            while self.idle:
+                page = self.idle.pop()
+                if self._healthy(page):
+                    return page
+                await self._discard(page)
+            return await self._new_page()
+        except BaseException:
+            self.slots.release()
+            raise
+
+    async def release(self, page, failed: bool = False):
+        try:
+            self.uses[page] = self.uses.get(page, 0) + 1
+            if failed or not self._healthy(page) or self.uses[page] >= self.max_uses:
+                await self._discard(page)
+            else:
+                self.idle.append(page)
+        finally:
+            self.slots.release()
+
+    async def close(self):
+        while self.idle:
+            page = self.idle.pop()
+            self.uses.pop(page, None)
+            try:
+                await page.close()
+            except Exception:
+                pass
+
+    async def _new_page(self):
+        page = await self.context.new_page()
+        self.uses[page] = 0
+        page.on("crash", lambda _: self.crashed.add(page))
+        return page
+
+    def _healthy(self, page):
+        # Renderer crashes are reported through the page's "crash" event. (Not a timed
+        # evaluate() probe: asyncio.wait_for can swallow a cancellation on Python 3.11,
+        # and a hung renderer still fails its next goto() and is discarded then.)
+        return not page.is_closed() and page not in self.crashed
+
+    async def _discard(self, page):
+        # The next acquire() creates a fresh page in its place
+        self.uses.pop(page, None)
+        self.crashed.discard(page)
+        self.recycled += 1
+        try:
+            await page.close()
+        except Exception:
+            pass
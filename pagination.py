@@ -0,0 +1,145 @@
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from scraper.url_classifier import PAGINATION_PARAMS
+
+# Parameters that count items rather than pages: a missing one means 0, not page 1
+OFFSET_PARAMS = {"offset", "start", "from", "skip"}
+PAGE_PARAMS = PAGINATION_PARAMS | OFFSET_PARAMS | {"paged", "pageno", "page_no", "pagenum", "pg"}
+PAGE_SEGMENTS = {"page", "p", "pg"}
+
+# href of the page's "next" link, if it has a real one (rel=next, or a Next-style anchor)
+NEXT_HREF_JS = """
+() => {
+    const el = document.querySelector(
+        "link[rel~='next'], a[rel~='next'], a.next, .next > a, a.pagination-next, .pagination-next > a, a[aria-label='Next']"
+    );
+    return el && el.href && !el.href.startsWith('javascript') ? el.href : null;
+}
+"""
+
+
+class PagePattern:
+    # How a listing numbers its pages: a query parameter (?page=2, ?offset=20) or a path
+    # segment (/page/2/, /news/2), with the value page 1 implies and the step per page
+    def __init__(self, first_url: str, kind: str, key, first_value: int, step: int):
+        self.first_url = first_url
+        self.kind = kind          # "query" or "path"
+        self.key = key            # parameter name, or (segment index, "page"-like prefix) for "path"
+        self.first_value = first_value
+        self.step = step
+
+    def url(self, number: int) -> str:
+        # URL of page `number` (1 = the first page)
+        value = self.first_value + (number - 1) * self.step
+        parts = urlsplit(self.first_url)
+        if self.kind == "query":
+            query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != self.key]
+            query.append((self.key, str(value)))
+            return urlunsplit(parts._replace(query=urlencode(query)))
+        segments = parts.path.split("/")
+        index, prefix = self.key
+        if index < len(segments) and segments[index].isdigit():
+            segments[index] = str(value)
+        else:
+            # Page 1 had no number: /news/ -> /news/page/2/
+            trailing = segments and segments[-1] == ""
+            if trailing:
+                segments.pop()
+            segments += ([prefix] if prefix else []) + [str(value)] + ([""] if trailing else [])
+        return urlunsplit(parts._replace(path="/".join(segments)))
+
+    def __repr__(self):
+        return f"{self.kind} {self.key} from {self.first_value} step {self.step}"
+
+
+def detect_pattern(first_url: str, next_url: str):
+    # PagePattern that turns first_url into next_url, or None if the two listing pages
+    # don't differ by a page number
+    first, second = urlsplit(first_url), urlsplit(urljoin(first_url, next_url))
+    if (first.scheme, first.netloc) != (second.scheme, second.netloc):
+        return None
+
+    if first.path.rstrip("/") == second.path.rstrip("/"):
+        before = dict(parse_qsl(first.query, keep_blank_values=True))
+        after = dict(parse_qsl(second.query, keep_blank_values=True))
+        changed = [k for k in after if before.get(k) != after[k]]
+        if len(changed) != 1 or set(before) - set(after):
+            return None
+        key = changed[0]
+        if not after[key].isdigit() or (key.lower() not in PAGE_PARAMS and key not in before):
+            return None
+        default = 0 if key.lower() in OFFSET_PARAMS else 1
+        start = int(before[key]) if before.get(key, "").isdigit() else default
+        step = int(after[key]) - start
+        if step <= 0:
+            return None
+        return PagePattern(first_url, "query", key, start, step)
+
+    if first.query != second.query:
+        return None
+    a, b = first.path.split("/"), second.path.split("/")
+    if len(a) == len(b):
+        diff = [i for i in range(len(a)) if a[i] != b[i]]
+        if len(diff) != 1 or not (a[diff[0]].isdigit() and b[diff[0]].isdigit()):
+            return None
+        index = diff[0]
+        step = int(b[index]) - int(a[index])
+        return PagePattern(first_url, "path", (index, None), int(a[index]), step) if step > 0 else None
+
+    # Page 1 without a number: /news/ -> /news/page/2/ or /news/2/
+    a_core = [s for s in a if s]
+    b_core = [s for s in b if s]
+    added = b_core[len(a_core):]
+    if b_core[:len(a_core)] != a_core or not added or not added[-1].isdigit():
+        return None
+    if len(added) == 2 and added[0].lower() in PAGE_SEGMENTS:
+        prefix = added[0]
+    elif len(added) == 1:
+        prefix = None
+    else:
+        return None
+    number = int(added[-1])
+    if number < 2:
+        return None
+    # Index the number would take in page 1's path, were it there
+    index = len(first.path.rstrip("/").split("/")) + (1 if prefix else 0)
+    return PagePattern(first_url, "path", (index, prefix), 1, number - 1)
+
+
+def links_from_html(html: str, page_url: str):
+    # (links, {link: date}) as the crawler's in-page scripts would see them, from fetched
+    # HTML: hrefs on the page's origin longer than the page URL, and listing dates
+    import lxml.html
+
+    try:
+        doc = lxml.html.document_fromstring(html)
+    except Exception:
+        return [], {}
+    base = doc.xpath("string(//base/@href)") or page_url
+    base = urljoin(page_url, base)
+    parts = urlsplit(page_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    links = []
+    dates = {}
+    for anchor in doc.iter("a"):
+        href = anchor.get("href")
+        if not href:
+            continue
+        href = urljoin(base, href.strip())
+        if href.startswith(origin) and len(href) > len(page_url) + 10:
+            links.append(href)
+        # Same rule as Crawler._listing_dates: the nearest ancestor with exactly one <time>
+        element = anchor
+        for _ in range(5):
+            element = element.getparent()
+            if element is None:
+                break
+            times = element.findall(".//time")
+            if len(times) > 1:
+                break
+            if len(times) == 1:
+                value = times[0].get("datetime") or times[0].text_content().strip()
+                if value:
+                    dates[href] = value
+                break
+    return links, dates
@@ -0,0 +1,125 @@
+import json
+from collections import Counter
+from urllib.parse import urlsplit
+
+# Fields a profile can give selectors for. "content" and "tags" take every match,
+# the others the first.
+PROFILE_FIELDS = ("title", "date", "author", "content", "description", "category", "tags")
+MULTI_FIELDS = ("content", "tags")
+
+
+def load_profiles(path: str) -> dict:
+    # {domain: {"selectors": {field: selector or [selectors]}, "cascade": {field: [steps]}}}
+    # from a JSON file, or YAML (needs PyYAML) for .yaml/.yml
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError(f"{path}: YAML profiles need PyYAML (pip install pyyaml), or use JSON")
+            return yaml.safe_load(f) or {}
+        return json.load(f)
+
+
+class SelectorRule:
+    # "css selector" or "css selector@attribute", compiled once for the engine in use
+    __slots__ = ("selector", "compiled", "attr")
+
+    def __init__(self, selector: str, compile):
+        css, attr = selector, None
+        if "@" in selector.rsplit("]", 1)[-1]:
+            css, _, attr = selector.rpartition("@")
+        self.selector = selector
+        self.compiled = compile(css.strip())
+        self.attr = attr.strip() if attr else None
+
+
+class SiteProfile:
+    # What the extractor knows about one site: the selectors its profile declares and
+    # the order to try each field's cascade steps in. That order is the profile's pinned
+    # steps, then the rest in their usual priority, leaving out steps that have come up
+    # empty on SKIP_AFTER of this site's pages without ever finding anything there.
+    # Learning only drops dead steps and never reorders, so it can't change which step
+    # a page's value comes from unless a dropped step starts matching again. To catch
+    # that, every SKIP_AFTER-th page of a field runs the whole cascade, and the extractor
+    # tries dropped steps before leaving a field empty; a dropped step that finds
+    # something is taken back.
+    SKIP_AFTER = 50
+
+    def __init__(self, domain: str, rules: dict = None, pinned: dict = None):
+        self.domain = domain
+        self.rules = rules or {}
+        self.pinned = pinned or {}
+        self.hits = {}
+        self.misses = {}
+        self.runs = Counter()
+        self._orders = {}
+
+    def order(self, field: str, steps: tuple):
+        key = (field, steps)
+        self.runs[field] += 1
+        if key not in self._orders:
+            first = [step for step in self.pinned.get(field, []) if step in steps]
+            dead = self.skipped().get(field, [])
+            self._orders[key] = (first + [step for step in steps if step not in first and step not in dead],
+                                 first + [step for step in steps if step not in first])
+        order, full = self._orders[key]
+        return full if self.runs[field] % self.SKIP_AFTER == 0 else order
+
+    def record(self, field: str, step: str, found: bool):
+        hits = self.hits.setdefault(field, Counter())
+        misses = self.misses.setdefault(field, Counter())
+        if found:
+            was_dead = misses[step] >= self.SKIP_AFTER and not hits[step]
+            hits[step] += 1
+            if was_dead:
+                self._forget(field)
+        else:
+            misses[step] += 1
+            if misses[step] == self.SKIP_AFTER and not hits[step]:
+                self._forget(field)
+
+    def skipped(self):
+        # {field: [steps left out on this site]}, also for reporting
+        dead = {}
+        for field, misses in self.misses.items():
+            hits = self.hits.get(field, Counter())
+            steps = [step for step, count in misses.items() if count >= self.SKIP_AFTER and not hits[step]]
+            if steps:
+                dead[field] = steps
+        return dead
+
+    def _forget(self, field):
+        self._orders = {key: order for key, order in self._orders.items() if key[0] != field}
+
+
+class SiteProfiles:
+    # Site profiles by domain (a profile for "example.com" also covers its subdomains),
+    # with every selector compiled up front. Hosts without a profile still get a
+    # SiteProfile of their own, so cascade order is learned for every site.
+    def __init__(self, profiles: dict = None, compile=None):
+        self.profiles = {}
+        for domain, spec in (profiles or {}).items():
+            rules = {}
+            for field, selectors in (spec.get("selectors") or {}).items():
+                if field not in PROFILE_FIELDS:
+                    raise ValueError(f"Profile {domain}: unknown field {field!r}")
+                if isinstance(selectors, str):
+                    selectors = [selectors]
+                try:
+                    rules[field] = [SelectorRule(selector, compile) for selector in selectors]
+                except Exception as e:
+                    raise ValueError(f"Profile {domain}: bad {field} selector ({e})")
+            self.profiles[domain.lower()] = SiteProfile(domain.lower(), rules, spec.get("cascade"))
+        self.by_host = {}
+
+    def for_url(self, url: str) -> SiteProfile:
+        host = (urlsplit(url).hostname or "").lower()
+        profile = self.by_host.get(host)
+        if profile is None:
+            profile = next((p for domain, p in self.profiles.items()
+                            if host == domain or host.endswith("." + domain)), None)
+            if profile is None:
+                profile = SiteProfile(host)
+            self.by_host[host] = profile
+        return profile
@@ -0,0 +1,140 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+BACKOFF_STATUSES = {429, 503}
+
+
+class Blocked(Exception):
+    # The host turned a request away (429/503 or a challenge page): worth retrying once
+    # its pause is over, rather than failing the URL
+    pass
+
+
+class Outcome:
+    # Filled in by the caller inside a RateController.slot() block
+    def __init__(self):
+        self.status = None
+        self.challenge = False
+        self.retry_after = None
+
+
+class HostLimiter:
+    # Politeness for one host: an optional token bucket (requests/sec + burst) and an
+    # AIMD concurrency window. Fast, healthy responses grow the window by ~1 per window's
+    # worth of requests; 429/503/challenge pages halve it and pause the host (Retry-After
+    # if the server sent one); responses slower than target_latency shrink it a little.
+    def __init__(self, host: str, rate: float = None, burst: int = None, start: int = 2,
+                 min_concurrency: int = 1, max_concurrency: int = 16, target_latency: float = 5.0):
+        self.host = host
+        self.rate = rate
+        self.burst = burst or (max(1, int(rate)) if rate else 1)
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.limit = float(max(min_concurrency, min(start, max_concurrency)))
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.changed = asyncio.Event()
+
+    async def acquire(self):
+        # No await between a check and taking the slot, so no lock is needed. Waits are
+        # plain sleeps and an Event, not asyncio.wait_for(): on Python 3.11 wait_for can
+        # swallow a cancellation that lands as it times out, which kept workers queued
+        # here alive after their crawl had been cancelled.
+        while True:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self.blocked_until:
+                await asyncio.sleep(self.blocked_until - now)
+            elif self.in_flight >= int(self.limit):
+                self.changed.clear()
+                await self.changed.wait()  # set by release()
+            elif self.rate and self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+            else:
+                if self.rate:
+                    self.tokens -= 1
+                self.in_flight += 1
+                return
+
+    def release(self, latency: float, outcome: Outcome):
+        self.in_flight -= 1
+        if outcome.status in BACKOFF_STATUSES or outcome.challenge:
+            self.limit = max(self.min_concurrency, self.limit / 2)
+            pause = outcome.retry_after if outcome.retry_after is not None else 2.0 * (self.max_concurrency / self.limit)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + min(pause, 300))
+            print(f"Backing off {self.host}: concurrency {int(self.limit)}, paused {pause:.0f}s")
+        elif latency > self.target_latency:
+            self.limit = max(self.min_concurrency, self.limit * 0.9)
+        elif outcome.status is not None and outcome.status < 400:
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+        self.changed.set()
+
+    def _refill(self, now):
+        if self.rate:
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+
+class RateController:
+    # One HostLimiter per host, created on first use. `rates` maps a domain (matching the
+    # host or any subdomain) to (requests_per_sec, burst).
+    def __init__(self, start_concurrency: int = 2, max_concurrency: int = 16, rates: dict = None, target_latency: float = 5.0):
+        self.start_concurrency = start_concurrency
+        self.max_concurrency = max_concurrency
+        self.rates = rates or {}
+        self.target_latency = target_latency
+        self.limiters = {}
+
+    def limiter(self, url: str) -> HostLimiter:
+        host = (urlparse(url).hostname or "").lower()
+        if host not in self.limiters:
+            rate, burst = self._rate_for(host)
+            self.limiters[host] = HostLimiter(
+                host, rate=rate, burst=burst, start=self.start_concurrency,
+                max_concurrency=self.max_concurrency, target_latency=self.target_latency,
+            )
+        return self.limiters[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        limiter = self.limiter(url)
+        await limiter.acquire()
+        outcome = Outcome()
+        start = time.monotonic()
+        try:
+            yield outcome
+        finally:
+            limiter.release(time.monotonic() - start, outcome)
+
+    def _rate_for(self, host):
+        for domain, (rate, burst) in self.rates.items():
+            if host == domain or host.endswith("." + domain):
+                return rate, burst
+        return None, None
+
+
+def parse_rate(spec: str):
+    # "example.com=2" or "example.com=2:5" -> ("example.com", (2.0, 5))
+    domain, _, value = spec.partition("=")
+    rate, _, burst = value.partition(":")
+    return domain.strip().lower(), (float(rate), int(burst) if burst else None)
+
+
+def parse_retry_after(value):
+    # Retry-After is either seconds or an HTTP date
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    from email.utils import parsedate_to_datetime
+    from datetime import datetime, timezone
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,119 @@
+import asyncio
+
+# Marks the time of the last DOM change, then reports whether the page has been quiet
+# for `quiet` ms. The observer is installed on the first poll and lives with the document.
+QUIET_JS = """
+(quiet) => {
+    if (window.__scraperLastMutation === undefined) {
+        window.__scraperLastMutation = performance.now();
+        new MutationObserver(() => { window.__scraperLastMutation = performance.now(); })
+            .observe(document, {childList: true, subtree: true, characterData: true});
+    }
+    return document.readyState !== 'loading'
+        && performance.now() - window.__scraperLastMutation >= quiet;
+}
+"""
+# True once the page has navigated away or shows more links than before
+CHANGED_JS = """
+([url, links]) => location.href !== url || document.querySelectorAll('a[href]').length > links
+"""
+GREW_JS = """
+([height, links]) => document.body.scrollHeight > height || document.querySelectorAll('a[href]').length > links
+"""
+CHALLENGE_GONE_JS = "() => !/Just a moment|One moment/.test(document.title)"
+SNAPSHOT_JS = """
+() => [location.href, document.querySelectorAll('a[href]').length, document.body ? document.body.scrollHeight : 0]
+"""
+
+
+class Readiness:
+    # Waits for concrete signs that a page is ready instead of fixed sleeps: a per-site
+    # "content ready" selector when one is configured, otherwise the DOM going quiet;
+    # after a click or scroll, the URL changing or more links appearing. A click that
+    # starts no navigation or XHR/fetch request at all is given up on quickly. Every wait
+    # is bounded and a timeout just means "carry on".
+    def __init__(self, ready_selector: str = None, timeout: float = 8.0, quiet: float = 0.5,
+                 request_grace: float = 2.0):
+        self.ready_selector = ready_selector
+        self.timeout = timeout
+        self.quiet = quiet
+        self.request_grace = request_grace
+
+    async def settle(self, page, timeout: float = None):
+        timeout_ms = (timeout or self.timeout) * 1000
+        try:
+            if self.ready_selector:
+                await page.wait_for_selector(self.ready_selector, timeout=timeout_ms)
+            else:
+                await page.wait_for_function(QUIET_JS, arg=self.quiet * 1000, polling=100, timeout=timeout_ms)
+            return True
+        except Exception:
+            return False
+
+    async def content_ready(self, page):
+        # Article pages only wait when the site has a ready selector; otherwise
+        # domcontentloaded is already enough for server-rendered HTML
+        if self.ready_selector:
+            await self.settle(page)
+
+    async def clear_challenge(self, page, timeout: float = 30.0):
+        # Cloudflare-style interstitials reload into the real page once solved
+        title = await page.title()
+        if "One moment" not in title and "Just a moment" not in title:
+            return True
+        print(f"Cloudflare challenge detected (Title: {title}). Waiting for it to clear...")
+        try:
+            await page.wait_for_function(CHALLENGE_GONE_JS, polling=250, timeout=timeout * 1000)
+            await page.wait_for_load_state("domcontentloaded")
+            return True
+        except Exception:
+            return False
+
+    async def snapshot(self, page):
+        # [url, number of links, page height]
+        return await page.evaluate(SNAPSHOT_JS)
+
+    async def follow(self, page, action, timeout: float = None):
+        # Runs action() (a click) and returns True once it has led somewhere: a new URL or
+        # more links on the page, which has then settled. False if nothing changed in time.
+        url, links, _ = await self.snapshot(page)
+        timeout_ms = (timeout or self.timeout) * 1000
+        changed = asyncio.create_task(page.wait_for_function(CHANGED_JS, arg=[url, links], polling=100, timeout=timeout_ms))
+        started = asyncio.create_task(page.wait_for_event(
+            "request", predicate=lambda r: r.resource_type in ("document", "xhr", "fetch"),
+            timeout=self.request_grace * 1000,
+        ))
+        await asyncio.sleep(0)  # both listeners are in place before the click
+        try:
+            await action()
+            done, _ = await asyncio.wait([changed, started], return_when=asyncio.FIRST_COMPLETED)
+            if changed in done or started.exception() is None:
+                await asyncio.wait([changed])
+            # else the click didn't even start loading anything
+        finally:
+            for task in (changed, started):
+                task.cancel()
+            await asyncio.gather(changed, started, return_exceptions=True)
+
+        # A navigation can also tear down the document the check was running in
+        if page.url == url and (changed.cancelled() or changed.exception() is not None):
+            return False
+        if page.url != url:
+            try:
+                await page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
+            except Exception:
+                pass
+        await self.settle(page)
+        return True
+
+    async def grow(self, page, action, timeout: float = 4.0):
+        # Runs action() (a scroll) and waits for the page to grow or gain links;
+        # False means it's the end of an infinite-scroll listing
+        _, links, height = await self.snapshot(page)
+        await action()
+        try:
+            await page.wait_for_function(GREW_JS, arg=[height, links], polling=100, timeout=timeout * 1000)
+        except Exception:
+            return False
+        await self.settle(page)
+        return True
@@ -0,0 +1,40 @@
+import json
+from urllib.parse import urlparse
+
+SEED_OPTIONS = ["url", "max_pages", "output", "start_date", "end_date", "categories", "concurrency", "state_file", "discovery", "ready_selector"]
+
+
+def load_seeds(path: str, defaults: dict, output_base: str):
+    # One seed per line: either a bare URL or a JSON object with per-seed options
+    # ({"url": ..., "categories": [...], "start_date": ..., "max_pages": ...}).
+    # Blank lines and lines starting with '#' are ignored. Missing options come from
+    # `defaults`; each seed gets its own output file unless it names one.
+    seeds = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                try:
+                    options = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{path}:{line_no}: invalid JSON seed ({e})")
+            else:
+                options = {"url": line}
+            if not options.get("url"):
+                raise ValueError(f"{path}:{line_no}: seed has no url")
+
+            unknown = set(options) - set(SEED_OPTIONS)
+            if unknown:
+                print(f"{path}:{line_no}: ignoring unknown seed options {sorted(unknown)}")
+
+            seed = dict(defaults)
+            seed.update({k: v for k, v in options.items() if k in SEED_OPTIONS})
+            if isinstance(seed.get("categories"), str):
+                seed["categories"] = seed["categories"].split()
+            if not options.get("output"):
+                host = (urlparse(seed["url"]).hostname or "site").replace(".", "_")
+                seed["output"] = f"{output_base}_{len(seeds) + 1:02d}_{host}"
+            seeds.append(seed)
+    return seeds
@@ -0,0 +1,51 @@
+import json
+import os
+import time
+from urllib.parse import urlsplit
+
+
+def site_key(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class SessionStore:
+    # Browser storage state (cookies, localStorage) kept per site between runs, so a
+    # crawl starts with the cookies an earlier run earned - Cloudflare clearance among
+    # them - instead of sitting through the challenge again. A saved session is used for
+    # max_age seconds after it was written, and cookies past their own expiry are dropped.
+    def __init__(self, directory: str, max_age: float = 6 * 3600):
+        self.directory = directory
+        self.max_age = max_age
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, url: str) -> str:
+        return os.path.join(self.directory, f"{site_key(url)}.json")
+
+    def load(self, url: str):
+        # Playwright storage_state dict for url's site, or None if there is no usable one
+        path = self.path(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        now = time.time()
+        if now - saved.get("saved_at", 0) > self.max_age:
+            return None
+        state = saved.get("state") or {}
+        cookies = [c for c in state.get("cookies", []) if not (c.get("expires", -1) > 0 and c["expires"] <= now)]
+        if not cookies and not state.get("origins"):
+            return None
+        return {"cookies": cookies, "origins": state.get("origins", [])}
+
+    def save(self, url: str, state: dict):
+        # Written to a temp file and swapped in, readable by the owner only (it holds cookies)
+        path = self.path(url)
+        temp = f"{path}.tmp"
+        fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": time.time(), "state": state}, f)
+        os.replace(temp, path)
@@ -0,0 +1,229 @@
+import re
+import zlib
+from urllib.parse import urljoin, urlparse
+from xml.etree.ElementTree import XMLPullParser
+
+SITEMAP_LINE_RE = re.compile(r"^\s*sitemap:\s*(\S+)", re.I | re.M)
+FEED_LINK_RE = re.compile(r"<link[^>]+type=[\"']application/(?:rss|atom)\+xml[\"'][^>]*>", re.I)
+HREF_RE = re.compile(r"href=[\"']([^\"']+)[\"']", re.I)
+# Where sites usually put them when robots.txt and the page don't say
+FALLBACK_SITEMAPS = ["/sitemap.xml", "/sitemap_index.xml", "/news-sitemap.xml"]
+FALLBACK_FEEDS = ["/feed", "/rss"]
+ENTRY_TAGS = ("sitemap", "url", "item", "entry")
+
+
+def _local(tag):
+    # "{http://www.sitemaps.org/schemas/sitemap/0.9}loc" -> "loc"
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+class EntryParser:
+    # Reads a sitemap, sitemap index, news sitemap, RSS or Atom document as it arrives:
+    # feed() it the body in chunks (gzipped or not) and it returns the entries completed
+    # so far, as (kind, url, date_string) with kind "sitemap" for child sitemaps and
+    # "page" for content. Elements are removed from the tree once read, so memory stays
+    # flat however large the file is.
+    def __init__(self):
+        self.parser = XMLPullParser(events=("start", "end"))
+        self.head = b""
+        self.inflate = None
+        self.started = False
+        self.path = []  # open elements, root first
+        self.fields = {}
+
+    def feed(self, chunk: bytes) -> list:
+        if not self.started:
+            # Two bytes tell a gzip file from XML
+            self.head += chunk
+            if len(self.head) < 2:
+                return []
+            chunk, self.head, self.started = self.head, b"", True
+            if chunk[:2] == b"\x1f\x8b":
+                self.inflate = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self.inflate:
+            chunk = self.inflate.decompress(chunk)
+        self.parser.feed(chunk)
+        return self._entries()
+
+    def close(self) -> list:
+        if not self.started:
+            self.parser.feed(self.head)
+        elif self.inflate:
+            self.parser.feed(self.inflate.flush())
+        self.parser.close()
+        return self._entries()
+
+    def _entries(self):
+        entries = []
+        for event, element in self.parser.read_events():
+            name = _local(element.tag)
+            if event == "start":
+                self.path.append(element)
+                if name in ENTRY_TAGS:
+                    self.fields = {}  # Drops the channel/feed-level <link> read so far
+                continue
+            self.path.pop()
+            entry = self._read(name, element)
+            if entry:
+                entries.append(entry)
+            # Done with it: detach it unless it's part of an entry still being read
+            if self.path and not any(_local(parent.tag) in ENTRY_TAGS for parent in self.path):
+                self.path[-1].remove(element)
+        return entries
+
+    def _read(self, name, element):
+        fields = self.fields
+        if name in ("loc", "lastmod", "publication_date", "pubdate", "date", "published", "updated", "guid"):
+            fields.setdefault(name, (element.text or "").strip())
+        elif name == "link":
+            # RSS: <link>url</link>; Atom: <link rel="alternate" href="url"/>
+            href = element.get("href")
+            if href is None:
+                fields.setdefault("link", (element.text or "").strip())
+            elif element.get("rel", "alternate") == "alternate":
+                fields.setdefault("link", href.strip())
+        elif name in ENTRY_TAGS:
+            self.fields = {}
+            url = fields.get("loc") or fields.get("link") or (fields.get("guid") if fields.get("guid", "").startswith("http") else None)
+            date = (fields.get("publication_date") or fields.get("pubdate") or fields.get("published")
+                    or fields.get("date") or fields.get("lastmod") or fields.get("updated"))
+            if url:
+                return ("sitemap" if name == "sitemap" else "page"), url, date
+        return None
+
+
+def parse_entries(content: bytes):
+    # The entries of a whole document already in memory
+    parser = EntryParser()
+    return parser.feed(content) + parser.close()
+
+
+class Discovery:
+    # Finds article URLs without walking listing pages: the sitemaps named in robots.txt
+    # (following sitemap indexes, gzipped or not, news sitemaps included) and the RSS/Atom
+    # feeds the seed page advertises. With a date window, entries whose lastmod/pubDate
+    # falls outside it are dropped before anything is fetched, and child sitemaps last
+    # modified before the window starts are not even downloaded.
+    def __init__(self, fetcher, site_url: str, start=None, end=None, max_sitemaps: int = 200):
+        self.fetcher = fetcher
+        self.site_url = site_url
+        self.host = (urlparse(site_url).hostname or "").lower()
+        self.start = start
+        self.end = end
+        self.max_sitemaps = max_sitemaps
+        self.sources = 0
+        self.out_of_window = 0
+        self.guessed = set()
+
+    async def links(self):
+        seen = set()
+        sitemaps, feeds = await self._locations()
+        pending = sitemaps + feeds
+        fetched = set()
+        while pending and len(fetched) < self.max_sitemaps:
+            location = pending.pop(0)
+            if location in fetched:
+                continue
+            fetched.add(location)
+            children = []
+            try:
+                entries = 0
+                # Parsed chunk by chunk as the body downloads, never held whole
+                async with self.fetcher.stream(location) as response:
+                    if response.status_code != 200:
+                        continue
+                    parser = EntryParser()
+                    async for chunk in response.aiter_bytes():
+                        found = parser.feed(chunk)
+                        entries += len(found)
+                        for url in self._pages(found, seen, children):
+                            yield url
+                    found = parser.close()
+                    entries += len(found)
+                    for url in self._pages(found, seen, children):
+                        yield url
+                if entries:
+                    self.sources += 1
+            except Exception as e:
+                # Guessed locations are often HTML pages or missing, that's expected
+                if location not in self.guessed:
+                    print(f"Could not read {location}: {e}")
+            # Newest child sitemaps first; undated ones last
+            pending = [url for _, url in sorted(children, key=lambda c: c[0], reverse=True)] + pending
+
+    def _pages(self, entries, seen, children):
+        # New in-window pages of this site; child sitemaps worth reading go to `children`
+        for kind, url, date in entries:
+            if kind == "sitemap":
+                if not self._before_window(date):
+                    children.append((date or "", url))
+            elif url not in seen and self._same_site(url):
+                seen.add(url)
+                if self._in_window(date):
+                    yield url
+                else:
+                    self.out_of_window += 1
+
+    async def _locations(self):
+        sitemaps, feeds = [], []
+        try:
+            robots = await self.fetcher.fetch(urljoin(self.site_url, "/robots.txt"))
+            if robots.status == 200:
+                sitemaps = SITEMAP_LINE_RE.findall(robots.html)
+        except Exception:
+            pass
+        try:
+            page = await self.fetcher.fetch(self.site_url)
+            for tag in FEED_LINK_RE.findall(page.html or ""):
+                href = HREF_RE.search(tag)
+                if href:
+                    feeds.append(urljoin(self.site_url, href.group(1)))
+        except Exception:
+            pass
+        if not sitemaps:
+            sitemaps = [urljoin(self.site_url, path) for path in FALLBACK_SITEMAPS]
+            self.guessed.update(sitemaps)
+        if not feeds:
+            feeds = [urljoin(self.site_url, path) for path in FALLBACK_FEEDS]
+            self.guessed.update(feeds)
+        return sitemaps, feeds
+
+    def _same_site(self, url):
+        host = (urlparse(url).hostname or "").lower()
+        return host == self.host or host.endswith("." + self.host) or self.host.endswith("." + host)
+
+    def _parse(self, date):
+        from scraper.utils import normalize_date
+
+        value = normalize_date(date) if date else None
+        window_tz = (self.start or self.end).tzinfo
+        if value and value.tzinfo and not window_tz:
+            value = value.replace(tzinfo=None)
+        elif value and window_tz and not value.tzinfo:
+            value = value.replace(tzinfo=window_tz)
+        return value
+
+    def _in_window(self, date):
+        if not (self.start or self.end) or not date:
+            return True  # Undated entries are judged after extraction
+        value = self._parse(date)
+        if not value:
+            return True
+        return not (self.start and value < self.start) and not (self.end and value > self.end)
+
+    def _before_window(self, date):
+        # A child sitemap whose newest entry predates the window has nothing for us
+        if not self.start or not date:
+            return False
+        value = self._parse(date)
+        return bool(value and value < self.start)
+
+
+async def sitemap_urls(fetcher, site_url: str, limit: int = 500):
+    # Up to `limit` page URLs from the site's sitemaps and feeds, newest sitemaps first
+    urls = []
+    async for url in Discovery(fetcher, site_url).links():
+        urls.append(url)
+        if len(urls) >= limit:
+            break
+    return urls
@@ -0,0 +1,178 @@
+import json
+import os
+from xml.sax.saxutils import escape, quoteattr
+
+FIELDS = ["url", "title", "date", "author", "content", "description", "category", "tags", "scraped_at"]
+
+
+class StreamWriter:
+    # Appends items as they are accepted instead of holding the whole crawl in memory.
+    # Items are buffered and flushed to disk every batch_size items (and on close),
+    # so the output can be tailed while the crawl runs. on_flush is called once a batch
+    # has reached the file: anything that records items as saved belongs there.
+    extension = ""
+
+    def __init__(self, output_base: str, source_url: str = None, append: bool = False, batch_size: int = 20,
+                 on_flush=None):
+        self.path = self.output_path(output_base)
+        self.source_url = source_url
+        self.append = append and os.path.exists(self.path)
+        self.batch_size = batch_size
+        self.on_flush = on_flush
+        self.buffer = []
+        self.count = 0
+        self.open()
+
+    def write(self, item: dict):
+        self.buffer.append(item)
+        self.count += 1
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.write_batch(self.buffer)
+            self.buffer = []
+        self.file.flush()
+        if self.on_flush:
+            self.on_flush()
+
+    def close(self):
+        self.flush()
+        self.finish()
+        self.file.close()
+        print(f"Saved {self.count} new items to {self.path}")
+
+    def output_path(self, output_base):
+        return f"{output_base}.{self.extension}"
+
+    def open(self):
+        self.file = open(self.path, "a" if self.append else "w", encoding="utf-8", newline="")
+
+    def write_batch(self, items):
+        raise NotImplementedError
+
+    def finish(self):
+        pass
+
+
+class CsvStreamWriter(StreamWriter):
+    extension = "csv"
+
+    def open(self):
+        import csv
+
+        super().open()
+        self.writer = csv.DictWriter(self.file, fieldnames=FIELDS, extrasaction="ignore")
+        if not self.append:
+            self.writer.writeheader()
+
+    def write_batch(self, items):
+        for item in items:
+            row = dict(item)
+            row["tags"] = str(row.get("tags", []))
+            self.writer.writerow(row)
+
+
+class JsonLinesStreamWriter(StreamWriter):
+    extension = "jsonl"
+
+    def write_batch(self, items):
+        for item in items:
+            self.file.write(json.dumps(item, ensure_ascii=False, default=str) + "\n")
+
+
+class XmlStreamWriter(StreamWriter):
+    extension = "xml"
+    closing_tag = "</items>\n"
+
+    def open(self):
+        if self.append:
+            # Drop the closing tag of the previous run so new items go inside the root
+            with open(self.path, "r+", encoding="utf-8") as f:
+                text = f.read()
+                if text.endswith(self.closing_tag):
+                    f.seek(0)
+                    f.truncate(len(text.encode("utf-8")) - len(self.closing_tag))
+        super().open()
+        if not self.append:
+            source = f" source={quoteattr(self.source_url)}" if self.source_url else ""
+            self.file.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<items{source}>\n')
+
+    def write_batch(self, items):
+        for item in items:
+            parts = ["  <item>\n"]
+            for field in FIELDS:
+                value = item.get(field, "")
+                if isinstance(value, list):
+                    tags = "".join(f"<tag>{escape(str(v))}</tag>" for v in value)
+                    parts.append(f"    <{field}>{tags}</{field}>\n")
+                else:
+                    parts.append(f"    <{field}>{escape(str(value or ''))}</{field}>\n")
+            parts.append("  </item>\n")
+            self.file.write("".join(parts))
+
+    def finish(self):
+        self.file.write(self.closing_tag)
+
+
+class DocxStreamWriter(StreamWriter):
+    # DOCX can't be appended to, so items are spooled to a JSON Lines file
+    # and the document is assembled from it once at the end. The spool is kept
+    # so a resumed crawl can rebuild the document with all items.
+    extension = "docx"
+
+    def output_path(self, output_base):
+        self.docx_path = f"{output_base}.docx"
+        return f"{output_base}.docx.spool.jsonl"
+
+    def open(self):
+        super().open()
+        if self.append:
+            # The previous run may have died before building its document: the spool has
+            # everything it saved, so the document is brought up to date right away
+            self.build()
+
+    def write_batch(self, items):
+        for item in items:
+            self.file.write(json.dumps(item, ensure_ascii=False, default=str) + "\n")
+
+    def close(self):
+        super().close()
+        self.build()
+
+    def build(self):
+        from docx import Document
+
+        document = Document()
+        document.add_heading(f"Scraped data from {self.source_url}" if self.source_url else "Scraped data", 0)
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                item = json.loads(line)
+                document.add_heading(item.get("title") or item.get("url", ""), level=1)
+                for field in FIELDS:
+                    if field in ("title", "content"):
+                        continue
+                    value = item.get(field)
+                    if isinstance(value, list):
+                        value = ", ".join(value)
+                    if value:
+                        document.add_paragraph(f"{field.replace('_', ' ').title()}: {value}")
+                if item.get("content"):
+                    document.add_paragraph(item["content"])
+        document.save(self.docx_path)
+        print(f"Saved document to {self.docx_path}")
+
+
+WRITERS = {
+    "csv": CsvStreamWriter,
+    "jsonl": JsonLinesStreamWriter,
+    "xml": XmlStreamWriter,
+    "docx": DocxStreamWriter,
+}
+
+
+def open_writer(output_base: str, output_format: str, source_url: str = None, append: bool = False, batch_size: int = 20,
+                on_flush=None):
+    return WRITERS[output_format](output_base, source_url=source_url, append=append, batch_size=batch_size,
+                                  on_flush=on_flush)
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import re
+from datetime import datetime, timezone
+from urllib.parse import urljoin, urlsplit
+
+# <script id="__NEXT_DATA__" type="application/json">{...}</script> and the like
+STATE_SCRIPT_RE = re.compile(r"<script[^>]*\bid=[\"'](__NEXT_DATA__|__NUXT_DATA__|__APOLLO_STATE__)[\"'][^>]*>(.*?)</script>", re.S | re.I)
+# window.__NUXT__ = {...}; window.__INITIAL_STATE__ = JSON.parse("...")
+STATE_ASSIGN_RE = re.compile(r"window\.(__NUXT__|__INITIAL_STATE__|__PRELOADED_STATE__|__APOLLO_STATE__)\s*=\s*")
+PATH_TOKEN_RE = re.compile(r"([^.\[\]]+)|\[(\d*)\]")
+
+# Keys that usually hold an item's link / publication date in site JSON
+URL_KEYS = ("url", "link", "href", "permalink", "webUrl", "canonicalUrl", "canonical_url", "shareUrl", "share_url")
+DATE_KEYS = ("datePublished", "publishedAt", "published_at", "firstPublishedDate", "publishDate", "publish_date",
+             "pubDate", "datetime_published", "date", "createdAt", "created_at")
+RECORD_FIELDS = ("title", "date", "author", "content", "description", "category", "tags", "canonical_url")
+
+
+def embedded_state(html: str) -> dict:
+    # {name: parsed JSON} for the state blobs a server-rendered app ships with the page.
+    # Found with regexes over the raw HTML, no DOM needed. JS-only states (Nuxt 2's
+    # function-wrapped __NUXT__) aren't JSON and are skipped.
+    states = {}
+    for match in STATE_SCRIPT_RE.finditer(html):
+        try:
+            states[match.group(1)] = json.loads(match.group(2))
+        except ValueError:
+            continue
+    decoder = json.JSONDecoder()
+    for match in STATE_ASSIGN_RE.finditer(html):
+        name, position = match.group(1), match.end()
+        try:
+            if html.startswith("JSON.parse(", position):
+                text, _ = decoder.raw_decode(html, position + len("JSON.parse("))
+                states[name] = json.loads(text)
+            else:
+                states[name], _ = decoder.raw_decode(html, position)
+        except ValueError:
+            continue
+    return states
+
+
+def resolve(data, path: str):
+    # Follows "props.pageProps.story.title" through dicts and lists. "items[0]" indexes a
+    # list, "authors[].name" maps over one (giving a list). "a.b | c.d" tries each path
+    # in turn and returns the first that gives something.
+    for alternative in path.split("|"):
+        value = _resolve(data, [m.groups() for m in PATH_TOKEN_RE.finditer(alternative.strip())])
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _resolve(value, tokens):
+    for position, (key, index) in enumerate(tokens):
+        if key is not None:
+            value = value.get(key) if isinstance(value, dict) else None
+        elif not isinstance(value, list):
+            return None
+        elif index == "":
+            rest = tokens[position + 1:]
+            items = [_resolve(item, rest) for item in value]
+            return [item for item in items if item not in (None, "", [], {})]
+        else:
+            value = value[int(index)] if int(index) < len(value) else None
+        if value is None:
+            return None
+    return value
+
+
+def html_text(value) -> str:
+    # State fields often carry HTML (story bodies); records hold plain text
+    from scraper.utils import clean_text
+
+    if isinstance(value, list):
+        return " ".join(filter(None, (html_text(item) for item in value)))
+    if not isinstance(value, str):
+        return "" if value is None else str(value)
+    if "<" in value and ">" in value:
+        import lxml.html
+        try:
+            value = lxml.html.fragment_fromstring(value, create_parent="div").text_content()
+        except Exception:
+            pass
+    return clean_text(value)
+
+
+def _flat_strings(value):
+    if isinstance(value, list):
+        return [text for item in value for text in _flat_strings(item)]
+    return [html_text(value)] if value not in (None, "") else []
+
+
+def load_mappings(path: str) -> dict:
+    # {domain: {"state": "__NEXT_DATA__", "article": {field: path}, "listing": {...}}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class StateMapper:
+    # Per-site field mappings from embedded state (or site JSON API responses) into the
+    # record Extractor.parse returns. A mapping is keyed by domain (matching the host or
+    # any subdomain) and has:
+    #   "state":   which blob to read ("__NEXT_DATA__", "__NUXT__", "__INITIAL_STATE__"...)
+    #   "article": {"title": path, "date": path, "author": path, "content": path, ...}
+    #   "listing": {"items": path to the list of stories, "url": path in an item,
+    #               "date": path in an item}
+    #   "timezone": UTC offset ("+05:30") for dates the state gives without one
+    # with paths as understood by resolve().
+    def __init__(self, mappings: dict = None):
+        self.mappings = mappings or {}
+
+    def spec(self, url: str):
+        host = (urlsplit(url).hostname or "").lower()
+        for domain, spec in self.mappings.items():
+            if host == domain or host.endswith("." + domain):
+                return spec
+        return None
+
+    def article(self, html: str, url: str):
+        # Record fields found in the page's state, or None without a mapping/state.
+        # Only fields the mapping yields are present.
+        spec = self.spec(url)
+        if not spec or not spec.get("article"):
+            return None
+        states = embedded_state(html)
+        state = states.get(spec.get("state")) if spec.get("state") else next(iter(states.values()), None)
+        if state is None:
+            return None
+        record = {}
+        for field, path in spec["article"].items():
+            if field not in RECORD_FIELDS:
+                continue
+            value = resolve(state, path)
+            if value is None:
+                continue
+            if field == "tags":
+                record[field] = _flat_strings(value)
+            elif field == "author":
+                record[field] = ", ".join(_flat_strings(value))
+            elif field == "date":
+                record[field] = self._date(value, spec.get("timezone"))
+            elif field == "canonical_url":
+                record[field] = urljoin(url, str(value))
+            else:
+                record[field] = html_text(value)
+        return {field: value for field, value in record.items() if value not in ("", [], None)}
+
+    def listing(self, data, page_url: str):
+        # {absolute url: date or None} for the stories in a listing's state or API response.
+        # With a "listing" mapping its items are read; otherwise every JSON object that has
+        # a same-site link (URL_KEYS) counts, with its date (DATE_KEYS) if it has one.
+        spec = (self.spec(page_url) or {}).get("listing")
+        found = {}
+        if spec:
+            for item in resolve(data, spec["items"]) or []:
+                link = resolve(item, spec.get("url", "url"))
+                if isinstance(link, str) and link:
+                    date = resolve(item, spec["date"]) if spec.get("date") else None
+                    found[urljoin(page_url, link)] = date if isinstance(date, str) else None
+            return found
+        host = (urlsplit(page_url).hostname or "").lower()
+        stack = [data]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, list):
+                stack.extend(reversed(value))
+            elif isinstance(value, dict):
+                link = next((value[k] for k in URL_KEYS if isinstance(value.get(k), str) and value[k]), None)
+                if link and (link.startswith("/") or (urlsplit(link).hostname or "").lower() == host):
+                    date = next((value[k] for k in DATE_KEYS if isinstance(value.get(k), str) and value[k]), None)
+                    found.setdefault(urljoin(page_url, link), date)
+                stack.extend(reversed(list(value.values())))
+        return found
+
+    def _date(self, value, zone: str = None):
+        from scraper.utils import normalize_date
+
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if isinstance(value, (int, float)) and value > 0:
+            # Epoch seconds or milliseconds
+            return datetime.fromtimestamp(value / 1000 if value > 1e11 else value, tz=timezone.utc).isoformat()
+        dt = normalize_date(value) if isinstance(value, str) else None
+        if dt and dt.tzinfo is None and zone:
+            dt = dt.replace(tzinfo=datetime.strptime(zone, "%z").tzinfo)
+        return dt.isoformat() if dt else ""
+
+
+class JsonCapture:
+    # Listens to a listing page's XHR/fetch JSON responses (infinite scroll, "load more",
+    # client-side pagination) and keeps the story links and dates StateMapper.listing
+    # finds in them, until take() hands them to the crawl.
+    def __init__(self, mapper: StateMapper, page_url: str):
+        self.mapper = mapper
+        self.page_url = page_url
+        self.found = {}
+        self.responses = 0
+        self.pending = 0
+
+    def attach(self, page):
+        page.on("response", self.on_response)
+        return self
+
+    async def on_response(self, response):
+        try:
+            if response.request.resource_type not in ("xhr", "fetch"):
+                return
+            if "json" not in (response.headers.get("content-type") or ""):
+                return
+        except Exception:
+            return
+        self.pending += 1
+        try:
+            data = await response.json()
+        except Exception:
+            return
+        finally:
+            self.pending -= 1
+        found = self.mapper.listing(data, self.page_url)
+        if found:
+            self.responses += 1
+            for link, date in found.items():
+                self.found.setdefault(link, date)
+
+    def add_state(self, html: str):
+        # The listing's own embedded state, for the stories it rendered into the page
+        for state in embedded_state(html).values():
+            for link, date in self.mapper.listing(state, self.page_url).items():
+                self.found.setdefault(link, date)
+
+    async def settle(self, timeout: float = 5.0):
+        # Lets JSON bodies still being read arrive before take()
+        loop = asyncio.get_running_loop()
+        end = loop.time() + timeout
+        while self.pending and loop.time() < end:
+            await asyncio.sleep(0.05)
+
+    def take(self):
+        # (links, {link: date}) found since the last call
+        found, self.found = self.found, {}
+        return list(found), {link: date for link, date in found.items() if date}
@@ -0,0 +1,67 @@
+import lxml.html
+from bs4 import BeautifulSoup
+
+from scraper.content_density import ContentScorer
+from scraper.lxml_extractor import LxmlContentScorer
+
+STORY = "".join(f"<p>Paragraph {i} of the story, with a clause, and another one to make it long enough.</p>" for i in range(6))
+
+PAGE = f"""<html><body>
+<header class="masthead"><a href="/">Home</a> <a href="/india">India</a></header>
+<nav><ul><li><a href="/a">Some section with a long enough name, really</a></li></ul></nav>
+<div class="layout">
+  <div class="sidebar"><p>Most read: a sidebar paragraph that is long, with commas, everywhere.</p></div>
+  <div class="story-body">
+    <h1>The headline</h1>
+    {STORY}
+    <div class="related-stories"><a href="/x">Also read: another story that is not this one</a></div>
+    <ul class="links"><li><a href="/y">A linked list item that is quite long indeed</a></li></ul>
+    <p hidden>Hidden paragraph that should never show up, with a comma, or two.</p>
+    <p style="display: none">Another hidden paragraph, styled away, with commas, too.</p>
+  </div>
+</div>
+<footer><p>Copyright notice paragraph, all rights reserved, long enough to score.</p></footer>
+</body></html>"""
+
+def words(text):
+    return " ".join((text or "").split())
+
+def bs4_text(html):
+    return words(ContentScorer().extract(BeautifulSoup(html, "html.parser")))
+
+def lxml_text(html):
+    return words(LxmlContentScorer().extract(lxml.html.document_fromstring(html)))
+
+def test_article_text_only():
+    text = bs4_text(PAGE)
+    assert text.startswith("Paragraph 0 of the story") and "Paragraph 5" in text
+    for chrome in ("Home", "Some section", "Most read", "headline", "Also read", "linked list", "Hidden", "hidden", "Copyright"):
+        assert chrome not in text, chrome
+
+def test_sibling_paragraphs_join():
+    # Story paragraphs split over two containers are both kept
+    html = f"<html><body><div class='story'>{STORY}</div><div>{STORY.replace('Paragraph', 'More')}</div></body></html>"
+    text = bs4_text(html)
+    assert "Paragraph 0" in text and "More 5" in text
+
+def test_div_br_layout():
+    line = "A line of text in a div and br layout, long enough, with commas."
+    lines = "<br>\n".join([line] * 5)
+    html = f"<html><body><div class='entry'>{lines}</div><div><a href='/x'>link</a></div></body></html>"
+    assert bs4_text(html) == words(" ".join([line] * 5))
+
+def test_nothing_like_paragraphs():
+    assert ContentScorer().extract(BeautifulSoup("<html><body><a href='/'>Home</a><p>Short.</p></body></html>", "html.parser")) is None
+    assert lxml_text("<html><body><nav><p>" + STORY + "</p></nav></body></html>") == ""
+
+def test_lxml_same_text():
+    for html in (PAGE, f"<html><body><main>{STORY}</main><aside>{STORY}</aside></body></html>"):
+        assert lxml_text(html) == bs4_text(html)
+
+if __name__ == "__main__":
+    test_article_text_only()
+    test_sibling_paragraphs_join()
+    test_div_br_layout()
+    test_nothing_like_paragraphs()
+    test_lxml_same_text()
+    print("Content density tests passed.")
@@ -0,0 +1,62 @@
+from scraper.date_window import DateWindow
+from scraper.utils import normalize_date
+
+def window(stop_after=2):
+    return DateWindow(normalize_date("2026-01-10"), normalize_date("2026-01-20"), stop_after)
+
+def test_position():
+    w = window()
+    assert w.position("2026-01-05") == -1
+    assert w.position("2026-01-15T10:00:00+05:30") == 0
+    assert w.position("2026-01-25") == 1
+    assert w.position(None) is None
+    assert not w.in_range("2026-01-05") and w.in_range("2026-01-15") and w.in_range(None)
+    assert w.skipped == 1
+
+def test_exhausted_after_old_pages():
+    w = window(stop_after=2)
+    w.add_page(["/a", "/b"], {"/a": "2026-01-15", "/b": "2026-01-12"})
+    w.add_page([], {"/c": "2026-01-08", "/d": "2026-01-07"})
+    assert not w.exhausted()
+    w.add_page([], {"/e": "2026-01-06"})
+    assert w.exhausted()
+
+def test_undated_links_wait_for_their_articles():
+    w = window(stop_after=2)
+    w.add_page(["/a"], {})
+    w.add_page(["/b"], {})
+    # Nothing known yet, so the pages can't count as old
+    assert not w.exhausted()
+    w.record("/a", "2026-01-01")
+    assert not w.exhausted()
+    w.record("/b", "2026-01-02")
+    assert w.exhausted()
+    # A later record doesn't overwrite the listing's own date
+    w.add_page(["/c"], {"/c": "2026-01-15"})
+    w.record("/c", "2026-01-01")
+    assert w.dates["/c"] == 0
+
+def test_streak_must_be_consecutive():
+    w = window(stop_after=2)
+    w.add_page([], {"/a": "2026-01-01"})
+    w.add_page(["/b"], {"/b": "2026-01-15"})
+    w.add_page([], {"/c": "2026-01-01"})
+    assert not w.exhausted()
+
+def test_inactive_window():
+    assert not DateWindow().exhausted()
+    # An end date alone never stops pagination: older pages are still inside it
+    w = DateWindow(end=normalize_date("2026-01-20"), stop_after=1)
+    w.add_page(["/a"], {"/a": "2026-01-01"})
+    assert not w.exhausted()
+    w = DateWindow(normalize_date("2026-01-10"), stop_after=0)
+    w.add_page([], {"/a": "2026-01-01"})
+    assert not w.exhausted()
+
+if __name__ == "__main__":
+    test_position()
+    test_exhausted_after_old_pages()
+    test_undated_links_wait_for_their_articles()
+    test_streak_must_be_consecutive()
+    test_inactive_window()
+    print("Date window tests passed.")
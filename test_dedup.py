@@ -0,0 +1,29 @@
+from scraper.dedup import canonicalize_url, SimHashIndex
+
+def test_canonicalize_url():
+    assert canonicalize_url("HTTPS://WWW.A.com:443/news/x?utm_source=tw&b=2&a=1#top") == "https://www.a.com/news/x?a=1&b=2"
+    assert canonicalize_url("https://a.com/x?ref=home&id=5&fbclid=abc&gclid=1") == "https://a.com/x?id=5"
+    assert canonicalize_url("https://a.com?fbclid=1") == "https://a.com/"
+    # AMP variants are the same article; a site whose path is just /amp is left alone
+    assert canonicalize_url("http://a.com:8080/x/amp/") == "http://a.com:8080/x"
+    assert canonicalize_url("https://a.com/story/amp") == "https://a.com/story"
+    assert canonicalize_url("http://a.com/amp") == "http://a.com/amp"
+    # Non-web links are kept as they are
+    assert canonicalize_url("mailto:x@a.com") == "mailto:x@a.com"
+    # Same article, different spellings
+    assert canonicalize_url("https://a.com/x?b=2&a=1&utm_medium=social") == canonicalize_url("https://A.com/x?a=1&b=2")
+
+def test_near_duplicates():
+    text = " ".join(f"word{i}" for i in range(200))
+    index = SimHashIndex()
+    assert index.add("https://a.com/1", text) is None
+    assert index.add("https://a.com/2", text.replace("word100", "changed")) == "https://a.com/1"
+    assert index.add("https://a.com/3", " ".join(f"other{i}" for i in range(200))) is None
+    # Too short to judge
+    assert index.add("https://a.com/4", "word1 word2 word3") is None
+    assert index.add("https://a.com/5", "word1 word2 word3") is None
+
+if __name__ == "__main__":
+    test_canonicalize_url()
+    test_near_duplicates()
+    print("Dedup tests passed.")
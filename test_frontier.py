@@ -0,0 +1,133 @@
+from scraper.frontier import CrawlFrontier, QUEUED, IN_FLIGHT, DONE, SKIPPED, FAILED
+import os
+import tempfile
+import time
+
+def new_frontier(directory, resume=False):
+    return CrawlFrontier(os.path.join(directory, "crawl.db"), resume=resume)
+
+def test_add_returns_only_new_urls():
+    with tempfile.TemporaryDirectory() as directory:
+        frontier = new_frontier(directory)
+        assert frontier.add(["https://a.com/1", "https://a.com/2"]) == ["https://a.com/1", "https://a.com/2"]
+        assert frontier.add(["https://a.com/2", "https://a.com/3"]) == ["https://a.com/3"]
+        assert frontier.pending() == ["https://a.com/1", "https://a.com/2", "https://a.com/3"]
+        frontier.close()
+
+def test_done_stays_done():
+    with tempfile.TemporaryDirectory() as directory:
+        frontier = new_frontier(directory)
+        frontier.add(["https://a.com/1"])
+        frontier.mark("https://a.com/1", DONE, record={"title": "First"})
+        # A late worker reporting the same URL can't undo or duplicate it
+        frontier.mark("https://a.com/1", FAILED, error="late")
+        frontier.mark("https://a.com/1", DONE, record={"title": "Again"})
+        assert frontier.counts() == {DONE: 1}
+        assert frontier.results() == [{"title": "First"}]
+        frontier.close()
+
+def test_resume_requeues_in_flight():
+    with tempfile.TemporaryDirectory() as directory:
+        frontier = new_frontier(directory)
+        frontier.add(["https://a.com/1", "https://a.com/2", "https://a.com/3", "https://a.com/4"])
+        frontier.mark("https://a.com/1", DONE, record={"title": "One"})
+        frontier.mark("https://a.com/2", IN_FLIGHT)
+        frontier.mark("https://a.com/3", SKIPPED)
+        frontier.set_state("listing_url", "https://a.com/news?page=3")
+        frontier.close()
+
+        # Interrupted mid-fetch: the in-flight URL is queued again, finished ones stay finished
+        frontier = new_frontier(directory, resume=True)
+        assert frontier.counts() == {DONE: 1, SKIPPED: 1, QUEUED: 2}
+        assert set(frontier.pending()) == {"https://a.com/2", "https://a.com/4"}
+        assert frontier.finished_urls() == {"https://a.com/1", "https://a.com/3"}
+        assert frontier.get_state("listing_url") == "https://a.com/news?page=3"
+        assert frontier.results() == [{"title": "One"}]
+        frontier.close()
+
+        # Without resume the state file starts over
+        frontier = new_frontier(directory)
+        assert frontier.counts() == {}
+        assert frontier.get_state("listing_url") is None
+        frontier.close()
+
+def test_lease_expiry_and_reclaim():
+    with tempfile.TemporaryDirectory() as directory:
+        frontier = new_frontier(directory)
+        frontier.add([f"https://a.com/{i}" for i in range(5)])
+        first = frontier.lease("w1", limit=3, ttl=0.2)
+        assert first == ["https://a.com/0", "https://a.com/1", "https://a.com/2"]
+        # Leased URLs aren't handed out twice while the lease holds
+        assert frontier.lease("w2", limit=10, ttl=60) == ["https://a.com/3", "https://a.com/4"]
+        assert frontier.lease("w2", limit=10, ttl=60) == []
+        assert frontier.outstanding() == 5
+
+        frontier.mark("https://a.com/0", DONE, record={"title": "Zero"})
+        time.sleep(0.3)
+        # w1 went quiet: its unfinished URLs go to the next leaser
+        assert sorted(frontier.lease("w2", limit=10, ttl=60)) == ["https://a.com/1", "https://a.com/2"]
+        # and w1 finishing late doesn't change a URL that is done
+        frontier.mark("https://a.com/0", FAILED, error="late")
+        assert frontier.counts() == {DONE: 1, IN_FLIGHT: 4}
+        frontier.close()
+
+def test_done_seq_order():
+    with tempfile.TemporaryDirectory() as directory:
+        frontier = new_frontier(directory)
+        frontier.add(["https://a.com/1", "https://a.com/2", "https://a.com/3"])
+        frontier.lease("w1", limit=3)
+        # Results come back in completion order, not the order URLs were added
+        frontier.mark("https://a.com/3", DONE, record={"title": "Three"})
+        frontier.mark("https://a.com/2", SKIPPED)
+        frontier.mark("https://a.com/1", DONE, record={"title": "One"})
+        rows = frontier.results_after(0)
+        assert [record["title"] for _, record in rows] == ["Three", "One"]
+        assert rows[0][0] < rows[1][0]
+        assert frontier.results_after(rows[0][0]) == rows[1:]
+        assert frontier.outstanding() == 0
+        frontier.close()
+
+def test_texts_after_pages():
+    with tempfile.TemporaryDirectory() as directory:
+        frontier = new_frontier(directory)
+        urls = [f"https://a.com/{i}" for i in range(5)]
+        frontier.add(urls)
+        for i, url in enumerate(urls):
+            frontier.mark(url, DONE, record={"url": url, "content": f"text {i}", "title": "T"})
+        # Just the url and content, a page at a time in completion order
+        first = frontier.texts_after(0, limit=3)
+        assert [(url, content) for _, url, content in first] == [(urls[i], f"text {i}") for i in range(3)]
+        rest = frontier.texts_after(first[-1][0], limit=3)
+        assert [url for _, url, _ in rest] == urls[3:]
+        assert frontier.texts_after(rest[-1][0]) == []
+        frontier.close()
+
+def test_requeue_until_max_attempts():
+    with tempfile.TemporaryDirectory() as directory:
+        frontier = new_frontier(directory)
+        frontier.add(["https://a.com/1", "https://a.com/2"])
+        frontier.lease("w1", limit=2)
+        # Rate limited: back in the queue (lease dropped) until it has been tried 3 times
+        assert frontier.requeue("https://a.com/1", error="HTTP 429")
+        assert frontier.pending() == ["https://a.com/1"]
+        assert frontier.lease("w2", limit=1) == ["https://a.com/1"]
+        assert frontier.requeue("https://a.com/1", error="HTTP 429")
+        assert not frontier.requeue("https://a.com/1", error="HTTP 429")
+        assert frontier.counts() == {FAILED: 1, IN_FLIGHT: 1}
+        # Attempts survive a resume, and a done URL is never put back
+        frontier.mark("https://a.com/2", DONE, record={"title": "Two"})
+        assert not frontier.requeue("https://a.com/2")
+        frontier.close()
+        frontier = new_frontier(directory, resume=True)
+        assert frontier.counts() == {FAILED: 1, DONE: 1}
+        frontier.close()
+
+if __name__ == "__main__":
+    test_add_returns_only_new_urls()
+    test_done_stays_done()
+    test_resume_requeues_in_flight()
+    test_lease_expiry_and_reclaim()
+    test_done_seq_order()
+    test_texts_after_pages()
+    test_requeue_until_max_attempts()
+    print("Frontier tests passed.")
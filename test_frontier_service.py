@@ -0,0 +1,99 @@
+from scraper.frontier import CrawlFrontier, DONE
+from scraper.frontier_service import FrontierServer, RemoteFrontier, LeaseQueue
+import asyncio
+import os
+import tempfile
+
+TOKEN = "test-token"
+
+def serve(directory):
+    # A coordinator's frontier file, served on a free local port
+    path = os.path.join(directory, "crawl.db")
+    coordinator = CrawlFrontier(path)
+    server = FrontierServer(path, TOKEN, host="127.0.0.1", port=0).start()
+    host, port = server.httpd.server_address[:2]
+    return coordinator, server, f"http://{host}:{port}"
+
+def test_lease_queue_drains_remote_frontier():
+    with tempfile.TemporaryDirectory() as directory:
+        coordinator, server, url = serve(directory)
+        coordinator.add([f"https://a.com/{i}" for i in range(5)])
+        remote = RemoteFrontier(url, TOKEN)
+
+        async def drain():
+            queue = LeaseQueue(remote, "w1", batch_size=2, poll_interval=0.05, offload=True)
+            links = []
+            while True:
+                link = await queue.get()
+                if link is None:
+                    return links
+                links.append(link)
+                await asyncio.to_thread(remote.mark, link, DONE, record={"url": link})
+                if len(links) == 5:
+                    # The listing crawl ends once everything has been handed out
+                    coordinator.set_state("listing_done", True)
+
+        try:
+            links = asyncio.run(asyncio.wait_for(drain(), 10))
+            assert sorted(links) == [f"https://a.com/{i}" for i in range(5)]
+            assert coordinator.counts() == {DONE: 5}
+            assert [record["url"] for _, record in coordinator.results_after(0)] == links
+        finally:
+            remote.close()
+            server.close()
+            coordinator.close()
+
+def test_token_and_read_only_state():
+    with tempfile.TemporaryDirectory() as directory:
+        coordinator, server, url = serve(directory)
+        coordinator.add(["https://a.com/1", "https://a.com/2"])
+        coordinator.set_state("listing_done", False)
+        remote = RemoteFrontier(url, TOKEN)
+        stranger = RemoteFrontier(url, "wrong")
+        try:
+            assert remote.queued_count() == coordinator.queued_count() == 2
+            assert remote.get_state("listing_done") is False
+            for call in (lambda: stranger.lease("w1"), lambda: remote._call("set_state", key="stopped", value=True)):
+                try:
+                    call()
+                    assert False, "the call should have been refused"
+                except Exception:
+                    pass
+            assert coordinator.get_state("stopped") is None
+            assert coordinator.queued_count() == 2
+        finally:
+            remote.close()
+            stranger.close()
+            server.close()
+            coordinator.close()
+
+def test_worker_starts():
+    # Smoke test for a --frontier worker: it reads the seed and builds its per-site
+    # helpers before it needs a browser, so stopping it there runs that setup code
+    from scraper.crawler import Crawler
+
+    class Stop(Exception):
+        pass
+
+    async def no_browser(site_url):
+        raise Stop(site_url)
+
+    with tempfile.TemporaryDirectory() as directory:
+        coordinator, server, url = serve(directory)
+        coordinator.set_state("seed", {"url": "https://a.com/news", "start_date": "2026-01-01", "ready_selector": "article"})
+        crawler = Crawler(frontier_url=url, frontier_token=TOKEN, worker_id="w1")
+        crawler._open_context = no_browser
+        try:
+            asyncio.run(crawler._work_for_frontier())
+            assert False, "the worker should have stopped at _open_context"
+        except Stop as e:
+            assert str(e) == "https://a.com/news"
+        finally:
+            server.close()
+            coordinator.close()
+
+if __name__ == "__main__":
+    test_lease_queue_drains_remote_frontier()
+    test_token_and_read_only_state()
+    test_worker_starts()
+    print("Frontier service tests passed.")
@@ -0,0 +1,45 @@
+import json
+import os
+
+from scraper.extractor import Extractor, get_extractor
+from scraper.lxml_extractor import LxmlExtractor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PAGES = [
+    ("it_article.html", "https://www.indiatoday.in/india/story/some-story-123456"),
+    ("ht_sample.html", "https://www.hindustantimes.com/cricket/players/tim-david-67402"),
+    ("ht_sample_news.html", "https://www.hindustantimes.com/india-news/some-story-101.html"),
+]
+
+def read(name):
+    with open(os.path.join(HERE, name), encoding="utf-8") as f:
+        return f.read()
+
+def outputs(extractor):
+    records = []
+    for name, url in PAGES:
+        record = extractor.parse(read(name), url)
+        record.pop("scraped_at")
+        records.append(record)
+    return records
+
+def test_engines():
+    assert type(get_extractor("bs4")) is Extractor
+    assert type(get_extractor("lxml")) is LxmlExtractor
+
+def test_same_output_as_bs4():
+    for content_mode in ("density", "container"):
+        expected = outputs(Extractor(content_mode))
+        assert outputs(LxmlExtractor(content_mode)) == expected, content_mode
+        assert all(record["title"] for record in expected)
+
+def test_same_output_with_profiles():
+    profiles = json.loads(read("site_profiles.json"))
+    for content_mode in ("density", "container"):
+        assert outputs(LxmlExtractor(content_mode, profiles=profiles)) == outputs(Extractor(content_mode, profiles=profiles))
+
+if __name__ == "__main__":
+    test_engines()
+    test_same_output_as_bs4()
+    test_same_output_with_profiles()
+    print("lxml extractor tests passed.")
@@ -0,0 +1,37 @@
+import os
+import tempfile
+
+from scraper.page_cache import PageCache, config_fingerprint
+
+def test_reuse_and_validators():
+    path = os.path.join(tempfile.mkdtemp(), "cache.db")
+    cache = PageCache(path, config_fingerprint("bs4", "density"))
+    assert cache.get("https://a.com/1") is None
+    cache.put("https://a.com/1", "<html>one</html>", {"etag": '"v1"'}, {"title": "One"})
+    entry = cache.get("https://a.com/1")
+    assert cache.validators(entry) == {"If-None-Match": '"v1"'}
+    record = cache.reuse("https://a.com/1", entry)
+    assert record["title"] == "One" and record["scraped_at"]
+    assert cache.html("https://a.com/1") == "<html>one</html>"
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+def test_other_extractor_settings_miss():
+    path = os.path.join(tempfile.mkdtemp(), "cache.db")
+    cache = PageCache(path, config_fingerprint("bs4", "density"))
+    cache.put("https://a.com/1", "<html>one</html>", {}, {"title": "One"})
+    cache.close()
+    for config in (config_fingerprint("lxml", "density"), config_fingerprint("bs4", "container"),
+                   config_fingerprint("bs4", "density", profiles={"a.com": {"selectors": {"title": "h2"}}}),
+                   config_fingerprint("bs4", "density", state_mappings={"a.com": {"state": "__NEXT_DATA__"}})):
+        cache = PageCache(path, config)
+        assert cache.get("https://a.com/1") is None
+        cache.close()
+    cache = PageCache(path, config_fingerprint("bs4", "density", {}, {}))
+    assert cache.get("https://a.com/1")["record"] == {"title": "One"}
+    cache.close()
+
+if __name__ == "__main__":
+    test_reuse_and_validators()
+    test_other_extractor_settings_miss()
+    print("Page cache tests passed.")
@@ -0,0 +1,39 @@
+from scraper.pagination import detect_pattern
+
+def pages(first_url, next_url, count=3):
+    pattern = detect_pattern(first_url, next_url)
+    assert pattern is not None, (first_url, next_url)
+    return [pattern.url(number) for number in range(1, count + 1)]
+
+def test_query_patterns():
+    assert pages("https://a.com/news", "https://a.com/news?page=2") == [
+        "https://a.com/news?page=1", "https://a.com/news?page=2", "https://a.com/news?page=3"]
+    # Relative next links, other parameters kept
+    assert pages("https://a.com/news?cat=india", "?cat=india&page=2")[2] == "https://a.com/news?cat=india&page=3"
+    # Offsets count items: a missing offset is 0, and the step is the page size
+    assert pages("https://a.com/news", "https://a.com/news?offset=20") == [
+        "https://a.com/news?offset=0", "https://a.com/news?offset=20", "https://a.com/news?offset=40"]
+    # Learned from pages 2 and 3 of a click-through
+    assert pages("https://a.com/news?page=2", "https://a.com/news?page=3", 2) == [
+        "https://a.com/news?page=2", "https://a.com/news?page=3"]
+
+def test_path_patterns():
+    assert pages("https://a.com/news/", "https://a.com/news/page/2/") == [
+        "https://a.com/news/page/1/", "https://a.com/news/page/2/", "https://a.com/news/page/3/"]
+    assert pages("https://a.com/news", "https://a.com/news/2") == [
+        "https://a.com/news/1", "https://a.com/news/2", "https://a.com/news/3"]
+    assert pages("https://a.com/news/1", "https://a.com/news/2")[2] == "https://a.com/news/3"
+
+def test_not_pagination():
+    assert detect_pattern("https://a.com/news", "https://b.com/news?page=2") is None
+    assert detect_pattern("https://a.com/news?page=3", "https://a.com/news?page=2") is None
+    assert detect_pattern("https://a.com/news?sort=new", "https://a.com/news?sort=old") is None
+    assert detect_pattern("https://a.com/news", "https://a.com/story/2") is None
+    assert detect_pattern("https://a.com/news", "https://a.com/news?id=2") is None
+    assert detect_pattern("https://a.com/news?page=1&x=1", "https://a.com/news?page=2&x=2") is None
+
+if __name__ == "__main__":
+    test_query_patterns()
+    test_path_patterns()
+    test_not_pagination()
+    print("Pagination tests passed.")
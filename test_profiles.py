@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+
+from scraper.extractor import get_extractor
+from scraper.profiles import SiteProfile, SiteProfiles, load_profiles
+
+STEPS = ("meta", "json_ld", "time", "text")
+
+def test_pinned_steps_first():
+    profile = SiteProfile("a.com", pinned={"date": ["json_ld", "unknown"]})
+    assert profile.order("date", STEPS) == ["json_ld", "meta", "time", "text"]
+    assert profile.order("author", STEPS) == list(STEPS)
+
+def test_dead_steps_dropped_and_taken_back():
+    profile = SiteProfile("a.com")
+    skip_after = SiteProfile.SKIP_AFTER
+    for _ in range(skip_after):
+        profile.order("date", STEPS)
+        profile.record("date", "meta", True)
+        profile.record("date", "time", False)
+    assert profile.skipped() == {"date": ["time"]}
+    orders = [profile.order("date", STEPS) for _ in range(skip_after)]
+    assert orders[0] == ["meta", "json_ld", "text"]
+    # Every SKIP_AFTER-th page still runs the whole cascade
+    assert orders.count(list(STEPS)) == 1
+    # A step that has found something once is never dropped
+    for _ in range(skip_after):
+        profile.record("date", "meta", False)
+    assert profile.skipped() == {"date": ["time"]}
+    # A dropped step that matches again comes back
+    profile.record("date", "time", True)
+    assert profile.skipped() == {}
+    assert profile.order("date", STEPS) == list(STEPS)
+
+def test_profiles_by_domain():
+    profiles = SiteProfiles({"A.com": {"selectors": {"title": "h2.headline"}, "cascade": {"date": ["meta"]}}},
+                            compile=lambda css: css)
+    profile = profiles.for_url("https://news.a.com/story/1")
+    assert profile.domain == "a.com" and profiles.for_url("https://a.com/x") is profile
+    assert [rule.selector for rule in profile.rules["title"]] == ["h2.headline"]
+    # Hosts without a profile get their own, to learn cascade order
+    other = profiles.for_url("https://b.com/x")
+    assert other.domain == "b.com" and not other.rules and other is not profile
+    try:
+        SiteProfiles({"a.com": {"selectors": {"headline": "h2"}}}, compile=lambda css: css)
+        assert False, "unknown fields should be rejected"
+    except ValueError:
+        pass
+
+def test_selector_attribute():
+    rules = SiteProfiles({"a.com": {"selectors": {"date": ["time[datetime] @ datetime", "a[href*='@']"]}}},
+                         compile=lambda css: css).for_url("https://a.com/").rules["date"]
+    assert [(rule.compiled, rule.attr) for rule in rules] == [("time[datetime]", "datetime"), ("a[href*='@']", None)]
+
+def test_profile_selectors_in_extraction():
+    html = ("<html><body><h1>Site name</h1><h2 class='headline'>The real headline</h2>"
+            "<div class='when' data-ts='2026-01-15T10:00:00Z'>Thursday</div><article><p>"
+            + "Some words of the story. " * 30 + "</p></article></body></html>")
+    profiles = {"a.com": {"selectors": {"title": "h2.headline", "date": "div.when@data-ts"}}}
+    for engine in ("bs4", "lxml"):
+        data = get_extractor(engine, profiles=profiles).parse(html, "https://a.com/story/1")
+        assert data["title"] == "The real headline", engine
+        assert data["date"].startswith("2026-01-15T10:00:00"), engine
+        assert get_extractor(engine).parse(html, "https://a.com/story/1")["title"] == "Site name"
+
+def test_load_profiles():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "profiles.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"a.com": {"selectors": {"title": "h1"}}}, f)
+        assert load_profiles(path) == {"a.com": {"selectors": {"title": "h1"}}}
+
+if __name__ == "__main__":
+    test_pinned_steps_first()
+    test_dead_steps_dropped_and_taken_back()
+    test_profiles_by_domain()
+    test_selector_attribute()
+    test_profile_selectors_in_extraction()
+    test_load_profiles()
+    print("Profile tests passed.")
@@ -0,0 +1,118 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from scraper.rate_control import HostLimiter, Outcome, RateController, parse_rate, parse_retry_after
+
+def outcome(status=200, challenge=False, retry_after=None):
+    result = Outcome()
+    result.status, result.challenge, result.retry_after = status, challenge, retry_after
+    return result
+
+def test_aimd_window():
+    async def run():
+        limiter = HostLimiter("a.com", start=2, max_concurrency=4, target_latency=5.0)
+        # Healthy responses grow the window by about one per window's worth of requests
+        for _ in range(2):
+            await limiter.acquire()
+            limiter.release(0.1, outcome(200))
+        assert round(limiter.limit, 6) == 2.9
+        for _ in range(50):
+            await limiter.acquire()
+            limiter.release(0.1, outcome(200))
+        assert limiter.limit == 4
+        # Slow responses shrink it a little, errors leave it alone
+        limiter.in_flight += 1
+        limiter.release(10.0, outcome(200))
+        assert limiter.limit == 3.6
+        limiter.in_flight += 1
+        limiter.release(0.1, outcome(404))
+        assert limiter.limit == 3.6
+        # A 429 halves it and pauses the host for the Retry-After time
+        limiter.in_flight += 1
+        limiter.release(0.1, outcome(429, retry_after=30))
+        assert limiter.limit == 1.8
+        assert 29 < limiter.blocked_until - time.monotonic() <= 30
+        # Challenge pages count as a block too, down to the minimum
+        for _ in range(3):
+            limiter.in_flight += 1
+            limiter.release(0.1, outcome(200, challenge=True))
+        assert limiter.limit == 1
+        assert limiter.in_flight == 0
+
+    asyncio.run(run())
+
+def test_window_caps_concurrency():
+    async def run():
+        limiter = HostLimiter("a.com", start=2)
+        active, peak = 0, 0
+
+        async def request():
+            nonlocal active, peak
+            await limiter.acquire()
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            limiter.release(0.01, outcome(None))
+
+        await asyncio.gather(*(request() for _ in range(10)))
+        return peak
+
+    assert asyncio.run(run()) == 2
+
+def test_pause_delays_next_request():
+    async def run():
+        limiter = HostLimiter("a.com")
+        await limiter.acquire()
+        limiter.release(0.1, outcome(503, retry_after=0.2))
+        start = time.monotonic()
+        await limiter.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.19
+
+def test_token_bucket():
+    async def run():
+        limiter = HostLimiter("a.com", rate=20, burst=2, start=16)
+        start = time.monotonic()
+        for _ in range(6):
+            await limiter.acquire()
+        return time.monotonic() - start
+
+    # Two requests from the burst, then 4 more at 20/sec
+    elapsed = asyncio.run(run())
+    assert 0.18 <= elapsed < 0.5
+
+def test_controller_per_host():
+    controller = RateController(rates=dict([parse_rate("a.com=2:5")]))
+    limiter = controller.limiter("https://news.a.com/x")
+    assert (limiter.rate, limiter.burst) == (2.0, 5)
+    assert controller.limiter("https://NEWS.a.com/y") is limiter
+    assert controller.limiter("https://b.com/").rate is None
+
+    async def run():
+        async with controller.slot("https://b.com/x") as result:
+            result.status = 429
+        return controller.limiter("https://b.com/")
+
+    limiter = asyncio.run(run())
+    assert limiter.in_flight == 0 and limiter.blocked_until > time.monotonic()
+
+def test_parsing():
+    assert parse_rate("Example.com=0.5") == ("example.com", (0.5, None))
+    assert parse_retry_after("120") == 120.0
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert 55 < parse_retry_after(later) <= 60
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None and parse_retry_after(None) is None
+
+if __name__ == "__main__":
+    test_aimd_window()
+    test_window_caps_concurrency()
+    test_pause_delays_next_request()
+    test_token_bucket()
+    test_controller_per_host()
+    test_parsing()
+    print("Rate control tests passed.")
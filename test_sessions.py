@@ -0,0 +1,58 @@
+import json
+import os
+import stat
+import tempfile
+import time
+
+from scraper.sessions import SessionStore, site_key
+
+def cookie(name, expires=-1):
+    return {"name": name, "value": "v", "domain": ".a.com", "path": "/", "expires": expires}
+
+def test_site_key():
+    assert site_key("https://www.A.com/news") == site_key("https://a.com/x") == "a.com"
+    assert site_key("https://news.a.com/") == "news.a.com"
+
+def test_round_trip_and_expired_cookies():
+    with tempfile.TemporaryDirectory() as directory:
+        store = SessionStore(directory)
+        assert store.load("https://a.com/") is None
+        now = time.time()
+        state = {"cookies": [cookie("session"), cookie("cf_clearance", now + 3600), cookie("old", now - 10)],
+                 "origins": [{"origin": "https://a.com", "localStorage": [{"name": "k", "value": "v"}]}]}
+        store.save("https://www.a.com/news", state)
+        loaded = store.load("https://a.com/story/1")
+        assert [c["name"] for c in loaded["cookies"]] == ["session", "cf_clearance"]
+        assert loaded["origins"] == state["origins"]
+        # Only the owner can read it, and no temp file is left behind
+        assert stat.S_IMODE(os.stat(store.path("https://a.com/")).st_mode) == 0o600
+        assert os.listdir(directory) == ["a.com.json"]
+
+def test_old_sessions_are_not_used():
+    with tempfile.TemporaryDirectory() as directory:
+        store = SessionStore(directory, max_age=60)
+        store.save("https://a.com/", {"cookies": [cookie("session")], "origins": []})
+        assert store.load("https://a.com/") is not None
+        with open(store.path("https://a.com/"), encoding="utf-8") as f:
+            saved = json.load(f)
+        saved["saved_at"] -= 61
+        with open(store.path("https://a.com/"), "w", encoding="utf-8") as f:
+            json.dump(saved, f)
+        assert store.load("https://a.com/") is None
+
+def test_nothing_usable():
+    with tempfile.TemporaryDirectory() as directory:
+        store = SessionStore(directory)
+        # Every cookie expired and no localStorage
+        store.save("https://a.com/", {"cookies": [cookie("old", time.time() - 10)], "origins": []})
+        assert store.load("https://a.com/") is None
+        with open(store.path("https://b.com/"), "w", encoding="utf-8") as f:
+            f.write("{not json")
+        assert store.load("https://b.com/") is None
+
+if __name__ == "__main__":
+    test_site_key()
+    test_round_trip_and_expired_cookies()
+    test_old_sessions_are_not_used()
+    test_nothing_usable()
+    print("Session tests passed.")
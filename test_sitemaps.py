@@ -0,0 +1,136 @@
+import asyncio
+import gzip
+from contextlib import asynccontextmanager
+
+from scraper.sitemaps import Discovery, EntryParser, parse_entries
+from scraper.utils import normalize_date
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://a.com/sitemap-old.xml.gz</loc><lastmod>2025-06-30</lastmod></sitemap>
+  <sitemap><loc>https://a.com/sitemap-news.xml</loc><lastmod>2026-01-20</lastmod></sitemap>
+</sitemapindex>"""
+
+NEWS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url><loc>https://a.com/story/one</loc><lastmod>2026-01-19</lastmod>
+    <news:news><news:publication><news:name>A</news:name></news:publication>
+    <news:publication_date>2026-01-15T10:00:00+05:30</news:publication_date></news:news></url>
+  <url><loc>https://a.com/story/two</loc><lastmod>2025-12-01</lastmod></url>
+  <url><loc>https://other.com/story/three</loc></url>
+</urlset>"""
+
+OLD = b"""<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://a.com/story/old</loc><lastmod>2025-06-01</lastmod></url>
+</urlset>"""
+
+RSS = b"""<rss version="2.0"><channel><title>A</title><link>https://a.com/</link>
+  <item><title>One</title><link>https://a.com/story/rss-one</link><pubDate>Thu, 15 Jan 2026 10:00:00 +0000</pubDate></item>
+  <item><title>Two</title><guid>https://a.com/story/rss-two</guid></item>
+</channel></rss>"""
+
+ATOM = b"""<feed xmlns="http://www.w3.org/2005/Atom"><title>A</title><link href="https://a.com/"/>
+  <entry><title>One</title><link rel="alternate" href="https://a.com/story/atom-one"/>
+    <link rel="edit" href="https://a.com/edit/1"/><published>2026-01-16T08:00:00Z</published></entry>
+</feed>"""
+
+def chunked(content, size):
+    parser = EntryParser()
+    entries = []
+    for i in range(0, len(content), size):
+        entries += parser.feed(content[i:i + size])
+    return entries + parser.close()
+
+def test_sitemap_index_and_news():
+    assert parse_entries(INDEX) == [
+        ("sitemap", "https://a.com/sitemap-old.xml.gz", "2025-06-30"),
+        ("sitemap", "https://a.com/sitemap-news.xml", "2026-01-20")]
+    entries = parse_entries(NEWS)
+    # The news sitemap's publication date wins over lastmod
+    assert entries[0] == ("page", "https://a.com/story/one", "2026-01-15T10:00:00+05:30")
+    assert [url for _, url, _ in entries] == ["https://a.com/story/one", "https://a.com/story/two", "https://other.com/story/three"]
+
+def test_feeds():
+    assert parse_entries(RSS) == [
+        ("page", "https://a.com/story/rss-one", "Thu, 15 Jan 2026 10:00:00 +0000"),
+        ("page", "https://a.com/story/rss-two", None)]
+    assert parse_entries(ATOM) == [("page", "https://a.com/story/atom-one", "2026-01-16T08:00:00Z")]
+
+def test_gzip_and_chunks():
+    for document in (INDEX, NEWS, RSS, ATOM):
+        expected = parse_entries(document)
+        assert parse_entries(gzip.compress(document)) == expected
+        # Split anywhere, even inside the gzip header
+        for size in (1, 7, 64):
+            assert chunked(document, size) == expected
+            assert chunked(gzip.compress(document), size) == expected
+
+def test_read_elements_are_dropped():
+    rows = "".join(f"<url><loc>https://a.com/{i}</loc></url>" for i in range(1000))
+    parser = EntryParser()
+    entries = parser.feed(f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{rows}'.encode())
+    assert len(entries) == 1000
+    root = parser.path[0]
+    assert len(root) == 0
+    entries += parser.feed(b"</urlset>") + parser.close()
+    assert len(entries) == 1000
+
+class Response:
+    def __init__(self, content):
+        self.status_code = 200 if content is not None else 404
+        self.content = content
+
+    async def aiter_bytes(self):
+        for i in range(0, len(self.content), 100):
+            yield self.content[i:i + 100]
+
+class Fetcher:
+    # Serves the documents above as a.com, with robots.txt pointing at the index
+    def __init__(self):
+        self.documents = {
+            "https://a.com/sitemap_index.xml": INDEX,
+            "https://a.com/sitemap-news.xml": NEWS,
+            "https://a.com/sitemap-old.xml.gz": gzip.compress(OLD),
+            "https://a.com/feed": RSS,
+        }
+        self.streamed = []
+
+    async def fetch(self, url):
+        from scraper.fetcher import FetchResult
+
+        if url == "https://a.com/robots.txt":
+            return FetchResult(url, 200, "Sitemap: https://a.com/sitemap_index.xml\n", {})
+        return FetchResult(url, 200, "<html></html>", {})
+
+    @asynccontextmanager
+    async def stream(self, url):
+        self.streamed.append(url)
+        yield Response(self.documents.get(url))
+
+async def discover(start=None):
+    fetcher = Fetcher()
+    discovery = Discovery(fetcher, "https://a.com/news", start=start)
+    return [url async for url in discovery.links()], discovery, fetcher
+
+def test_discovery():
+    urls, discovery, fetcher = asyncio.run(discover())
+    # Newest child sitemap first, other sites' pages left out
+    assert urls == ["https://a.com/story/one", "https://a.com/story/two", "https://a.com/story/old",
+                    "https://a.com/story/rss-one", "https://a.com/story/rss-two"]
+    assert discovery.sources == 4
+
+def test_discovery_date_window():
+    urls, discovery, fetcher = asyncio.run(discover(normalize_date("2026-01-01")))
+    assert urls == ["https://a.com/story/one", "https://a.com/story/rss-one", "https://a.com/story/rss-two"]
+    assert discovery.out_of_window == 1
+    # The old child sitemap ends before the window, so it is never downloaded
+    assert "https://a.com/sitemap-old.xml.gz" not in fetcher.streamed
+
+if __name__ == "__main__":
+    test_sitemap_index_and_news()
+    test_feeds()
+    test_gzip_and_chunks()
+    test_read_elements_are_dropped()
+    test_discovery()
+    test_discovery_date_window()
+    print("Sitemap tests passed.")
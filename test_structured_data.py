@@ -0,0 +1,124 @@
+import asyncio
+import json
+
+from scraper.extractor import get_extractor
+from scraper.structured_data import JsonCapture, StateMapper, embedded_state, resolve
+
+STORY = {"props": {"pageProps": {"story": {
+    "headline": "From the state",
+    "body": ["<p>First <b>paragraph</b>.</p>", "<p>Second paragraph.</p>"],
+    "authors": [{"name": "Jane Roe"}, {"name": "Bob"}, {}],
+    "publishedAt": "2026-01-15T10:00:00",
+    "tags": [{"label": "India"}, {"label": "Politics"}],
+    "canonical": "/story/canonical-1",
+}}}}
+
+MAPPINGS = {"a.com": {
+    "state": "__NEXT_DATA__",
+    "timezone": "+05:30",
+    "article": {
+        "title": "props.pageProps.story.title | props.pageProps.story.headline",
+        "content": "props.pageProps.story.body",
+        "author": "props.pageProps.story.authors[].name",
+        "date": "props.pageProps.story.publishedAt",
+        "tags": "props.pageProps.story.tags[].label",
+        "canonical_url": "props.pageProps.story.canonical",
+        "unknown": "props",
+    },
+    "listing": {"items": "data.stories", "url": "path", "date": "meta.date"},
+}}
+
+def page(state):
+    return ('<html><head><script id="__NEXT_DATA__" type="application/json">' + json.dumps(state)
+            + "</script></head><body><h1>From the page</h1><article><p>" + "Rendered text. " * 40
+            + "</p></article></body></html>")
+
+def test_resolve():
+    data = {"a": {"items": [{"name": "x"}, {"name": ""}, {"other": 1}], "empty": ""}}
+    assert resolve(data, "a.items[0].name") == "x"
+    assert resolve(data, "a.items[].name") == ["x"]
+    assert resolve(data, "a.items[5].name") is None
+    assert resolve(data, "a.empty | a.items[0].name") == "x"
+    assert resolve(data, "a.missing.deeper") is None
+    assert resolve(data, "a[0]") is None
+
+def test_embedded_state():
+    html = (page({"x": 1}) + '<script>window.__INITIAL_STATE__ = JSON.parse("{\\"y\\": 2}");'
+            "window.__NUXT__ = {\"z\": [3]};</script>"
+            '<script id="__APOLLO_STATE__" type="application/json">not json</script>')
+    assert embedded_state(html) == {"__NEXT_DATA__": {"x": 1}, "__INITIAL_STATE__": {"y": 2}, "__NUXT__": {"z": [3]}}
+
+def test_article_mapping():
+    record = StateMapper(MAPPINGS).article(page(STORY), "https://news.a.com/story/1")
+    assert record == {
+        "title": "From the state",
+        "content": "First paragraph. Second paragraph.",
+        "author": "Jane Roe, Bob",
+        "date": "2026-01-15T10:00:00+05:30",
+        "tags": ["India", "Politics"],
+        "canonical_url": "https://news.a.com/story/canonical-1",
+    }
+    # No mapping for the site, or no state in the page
+    assert StateMapper(MAPPINGS).article(page(STORY), "https://b.com/story/1") is None
+    assert StateMapper(MAPPINGS).article("<html></html>", "https://a.com/story/1") is None
+    # Epoch dates, in seconds or milliseconds
+    mapper = StateMapper()
+    assert mapper._date(1768471200) == mapper._date(1768471200000) == "2026-01-15T10:00:00+00:00"
+
+def test_extractor_uses_state():
+    for engine in ("bs4", "lxml"):
+        data = get_extractor(engine, state_mappings=MAPPINGS).parse(page(STORY), "https://a.com/story/1")
+        assert data["title"] == "From the state", engine
+        assert data["author"] == "Jane Roe, Bob", engine
+        assert data["date"] == "2026-01-15T10:00:00+05:30", engine
+        assert get_extractor(engine).parse(page(STORY), "https://a.com/story/1")["title"] == "From the page"
+
+def test_listing():
+    mapper = StateMapper(MAPPINGS)
+    data = {"data": {"stories": [{"path": "/story/1", "meta": {"date": "2026-01-15"}}, {"path": "/story/2"}, {"x": 1}]}}
+    assert mapper.listing(data, "https://a.com/news") == {"https://a.com/story/1": "2026-01-15", "https://a.com/story/2": None}
+    # Without a listing mapping, any object with a same-site link counts
+    data = {"results": [{"url": "/story/3", "publishedAt": "2026-01-16"},
+                        {"link": "https://b.com/story/4"}, {"nested": {"href": "https://b.com/story/5"}}]}
+    assert StateMapper().listing(data, "https://b.com/news") == {
+        "https://b.com/story/3": "2026-01-16", "https://b.com/story/4": None, "https://b.com/story/5": None}
+
+class Request:
+    def __init__(self, resource_type):
+        self.resource_type = resource_type
+
+class Response:
+    def __init__(self, data, resource_type="xhr", content_type="application/json"):
+        self.data = data
+        self.request = Request(resource_type)
+        self.headers = {"content-type": content_type}
+
+    async def json(self):
+        return self.data
+
+def test_json_capture():
+    capture = JsonCapture(StateMapper(), "https://a.com/news")
+    stories = {"items": [{"url": "/story/1", "date": "2026-01-15"}, {"url": "/story/2"}]}
+
+    async def run():
+        await capture.on_response(Response(stories))
+        # Only XHR/fetch JSON counts
+        await capture.on_response(Response({"url": "/story/3"}, resource_type="document"))
+        await capture.on_response(Response({"url": "/story/4"}, content_type="text/html"))
+        await capture.settle()
+
+    asyncio.run(run())
+    capture.add_state(page({"story": {"url": "/story/5"}}))
+    assert capture.responses == 1
+    assert capture.take() == (["https://a.com/story/1", "https://a.com/story/2", "https://a.com/story/5"],
+                              {"https://a.com/story/1": "2026-01-15"})
+    assert capture.take() == ([], {})
+
+if __name__ == "__main__":
+    test_resolve()
+    test_embedded_state()
+    test_article_mapping()
+    test_extractor_uses_state()
+    test_listing()
+    test_json_capture()
+    print("Structured data tests passed.")
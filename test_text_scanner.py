@@ -0,0 +1,42 @@
+import lxml.html
+from bs4 import BeautifulSoup
+
+from scraper.lxml_extractor import LxmlTextScanner
+from scraper.text_scanner import TextScanner
+
+def scan(html):
+    # Same result from both tree types
+    result = TextScanner().scan(BeautifulSoup(html, "html.parser"))
+    assert LxmlTextScanner().scan(lxml.html.document_fromstring(html)) == result, html
+    return result
+
+def test_date_labels():
+    result = scan("<html><body><div><span>Updated:</span> <span>Jan 22, 2026, 10:00 AM IST</span> and more</div></body></html>")
+    assert result == {"dates": [("Updated:", "Jan 22, 2026, 10:00 AM")], "byline": None}
+    # Reported in label priority order, whatever order the page has them in
+    result = scan("<html><body><p>Published: 01 Jan 2026</p><p>Updated: 02 Jan 2026</p></body></html>")
+    assert result["dates"] == [("Updated:", "02 Jan 2026"), ("Published:", "01 Jan 2026")]
+
+def test_date_stays_in_its_block():
+    # The words after a label are read from its own div/p only
+    result = scan("<html><body><p>Date:</p><p>Not a date</p><div>Created: <b>5</b> <i>March</i></div></body></html>")
+    assert result["dates"] == [("Created:", "5 March"), ("Date:", "")]
+
+def test_byline():
+    assert scan("<html><body><div><span>By Jane Roe</span></div><p>Story text</p></body></html>")["byline"] == "By Jane Roe"
+    # The outermost element that is still short
+    assert scan("<html><body><div><p><a>By</a> <a>Jane</a></p></div></body></html>")["byline"] == "By Jane"
+    long_text = "By the time the river rose the whole town had already left for the hills"
+    assert scan(f"<html><body><p>{long_text}</p></body></html>")["byline"] is None
+
+def test_scripts_and_comments_ignored():
+    html = ("<html><head><script>var By = 1; // Updated: never</script></head>"
+            "<body><!-- Published: 2020 --><p>Nothing here</p></body></html>")
+    assert scan(html) == {"dates": [], "byline": None}
+
+if __name__ == "__main__":
+    test_date_labels()
+    test_date_stays_in_its_block()
+    test_byline()
+    test_scripts_and_comments_ignored()
+    print("Text scanner tests passed.")
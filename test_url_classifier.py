@@ -0,0 +1,61 @@
+from scraper.url_classifier import UrlClassifier, url_shape
+
+def test_shapes_and_heuristic():
+    assert url_shape("https://a.com/india/story/some-long-story-slug-123456.html") == (
+        "/india/story/{slug-id}.html", "/{w}/{w}/{slug-id}.html")
+    assert url_shape("https://a.com/sports") == ("/sports", None)
+    classifier = UrlClassifier()
+    assert classifier.accepts("https://a.com/2026/01/15/big-news-story")
+    assert not classifier.accepts("https://a.com/tag/cricket")
+    assert not classifier.accepts("https://a.com/news?page=2")
+    assert classifier.skipped == 2
+
+def test_rules_win():
+    classifier = UrlClassifier(article_patterns=[r"/tag/special/"], skip_patterns=[r"/live/"])
+    assert classifier.score("https://a.com/tag/special/1") == 1.0
+    assert classifier.score("https://a.com/live/some-long-story-slug-123456") == 0.0
+
+def test_blocking_needs_evidence():
+    classifier = UrlClassifier(explore=0)
+    url = "https://a.com/gallery/some-photo-gallery-123456"
+    for i in range(19):
+        classifier.learn(f"https://a.com/gallery/some-photo-gallery-{i}00000", False)
+    # 19 non-articles: too few to block, the heuristic still decides
+    assert classifier.accepts(url)
+    classifier.learn(url, False)
+    assert not classifier.accepts(url)
+    # A few articles are enough to let a shape through
+    for i in range(3):
+        classifier.learn(f"https://a.com/story/some-long-story-{i}00000", True)
+    assert classifier.score("https://a.com/story/some-long-story-900000") == 1.0
+
+def test_exploring_blocked_shapes():
+    classifier = UrlClassifier(explore=0.1)
+    for i in range(20):
+        classifier.learn(f"https://a.com/gallery/some-photo-gallery-{i}00000", False)
+    fetched = sum(classifier.accepts(f"https://a.com/gallery/some-photo-gallery-{i}11111") for i in range(50))
+    assert fetched == classifier.explored == 5
+    assert classifier.skipped == 45
+    # Rule and heuristic rejections are never explored
+    assert not any(classifier.accepts(f"https://a.com/tag/t{i}") for i in range(20))
+    assert classifier.explored == 5
+
+def test_old_evidence_fades():
+    classifier = UrlClassifier(max_samples=40, explore=0)
+    url = "https://a.com/gallery/some-photo-gallery-123456"
+    for _ in range(40):
+        classifier.learn(url, False)
+    assert classifier.score(url) == 0.0
+    # The site starts publishing articles under the shape
+    for _ in range(30):
+        classifier.learn(url, True)
+    assert classifier.accepts(url)
+    assert sum(classifier.counts[url_shape(url)[0]]) <= 40
+
+if __name__ == "__main__":
+    test_shapes_and_heuristic()
+    test_rules_win()
+    test_blocking_needs_evidence()
+    test_exploring_blocked_shapes()
+    test_old_evidence_fades()
+    print("URL classifier tests passed.")
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+import dateparser
+
+from scraper import utils
+from scraper.utils import clean_text, normalize_date
+
+class CountingParse:
+    # Stands in for dateparser.parse, counting the slow-path calls
+    def __init__(self):
+        self.calls = 0
+        self.parse = dateparser.parse
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.parse(*args, **kwargs)
+
+def counting():
+    utils._absolute_dates.clear()
+    counter = CountingParse()
+    dateparser.parse = counter
+    return counter
+
+def test_clean_text():
+    assert clean_text("  Some\n\ttext   here ") == "Some text here"
+    assert clean_text(None) == ""
+
+def test_fast_paths():
+    counter = counting()
+    try:
+        assert normalize_date("2026-01-15T10:00:00Z") == datetime(2026, 1, 15, 10, tzinfo=timezone.utc)
+        assert normalize_date("2026-01-15") == datetime(2026, 1, 15)
+        assert normalize_date("Thu, 15 Jan 2026 10:00:00 +0530") == datetime(
+            2026, 1, 15, 10, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+        assert counter.calls == 0
+        assert normalize_date("") is None and normalize_date(None) is None
+    finally:
+        dateparser.parse = counter.parse
+
+def test_absolute_text_parsed_once():
+    counter = counting()
+    try:
+        first = normalize_date("January 22, 2026 10:00 AM")
+        assert (first.year, first.month, first.day) == (2026, 1, 22)
+        assert normalize_date("January 22, 2026 10:00 AM") == first
+        assert counter.calls == 1
+    finally:
+        dateparser.parse = counter.parse
+
+def test_relative_text_parsed_every_time():
+    counter = counting()
+    try:
+        for text in ("2 hours ago", "yesterday", "Jan 22"):
+            normalize_date(text)
+            normalize_date(text)
+        # One parse per call, never a second one to tell it's relative
+        assert counter.calls == 6
+        assert not utils._absolute_dates
+        dt = normalize_date("2 hours ago")
+        assert timedelta(hours=1) < datetime.now() - dt < timedelta(hours=3)
+    finally:
+        dateparser.parse = counter.parse
+
+def test_cache_is_bounded_lru():
+    counter = counting()
+    size = utils.DATE_CACHE_SIZE
+    utils.DATE_CACHE_SIZE = 3
+    try:
+        for day in (1, 2, 3):
+            normalize_date(f"Jan {day}, 2026")
+        # Using day 1 again makes day 2 the least recently used
+        normalize_date("Jan 1, 2026")
+        normalize_date("Jan 4, 2026")
+        assert list(utils._absolute_dates) == ["Jan 3, 2026", "Jan 1, 2026", "Jan 4, 2026"]
+        assert counter.calls == 4
+    finally:
+        utils.DATE_CACHE_SIZE = size
+        dateparser.parse = counter.parse
+
+if __name__ == "__main__":
+    test_clean_text()
+    test_fast_paths()
+    test_absolute_text_parsed_once()
+    test_relative_text_parsed_every_time()
+    test_cache_is_bounded_lru()
+    print("Utils tests passed.")
@@ -0,0 +1,125 @@
+import re
+
+# Labels tried in priority order when no meta/JSON-LD date exists
+DATE_LABELS = ["Updated:", "Created:", "Published:", "Date:"]
+BLOCK_TAGS = {"span", "div", "p"}
+SCAN_RE = re.compile("|".join(re.escape(label) for label in DATE_LABELS) + "|By")
+
+DATE_WORDS = 5
+BYLINE_MAX_LEN = 50
+MAX_TAIL_CHARS = 300
+
+
+class TextScanner:
+    # Fallback scan for "Updated: ..." style dates and "By ..." bylines.
+    # Walks the text nodes once instead of calling get_text() on every span/div/p,
+    # and stops as soon as the best date label and a byline have been seen.
+    # Tree access is split out into iter_strings/parent/tag_name/short_text so other
+    # tree types can subclass it.
+
+    def scan(self, root):
+        dates = {}
+        byline = None
+        byline_done = False
+        pending = []  # [label, tail, block] still collecting the words that follow a label
+
+        for text, node in self.iter_strings(root):
+            for entry in pending:
+                if self._is_inside(node, entry[2]):
+                    entry[1] += text
+                    dates[entry[0]] = entry[1]
+                else:
+                    entry[1] = None
+            pending = [e for e in pending if e[1] is not None and not self._tail_complete(e[1])]
+
+            if "By" not in text and ":" not in text:
+                continue
+
+            for match in SCAN_RE.finditer(text):
+                label = match.group()
+                if label == "By":
+                    if not byline_done:
+                        element = self._byline_element(node)
+                        if element is not None:
+                            byline = self.short_text(element, BYLINE_MAX_LEN)
+                            byline_done = True
+                elif label not in dates:
+                    block = self._label_block(node)
+                    if block is None:
+                        continue
+                    tail = text[match.end():]
+                    dates[label] = tail
+                    if not self._tail_complete(tail):
+                        pending.append([label, tail, block])
+
+            if byline_done and DATE_LABELS[0] in dates and not pending:
+                break
+
+        return {
+            "dates": [(label, " ".join(dates[label].split()[:DATE_WORDS])) for label in DATE_LABELS if label in dates],
+            "byline": byline,
+        }
+
+    def _tail_complete(self, tail):
+        return len(tail.split()) > DATE_WORDS or len(tail) > MAX_TAIL_CHARS
+
+    def _label_block(self, node):
+        # Nearest div/p around a date label bounds the text read after it
+        # (a span usually holds just the label, with the date in a sibling)
+        span = None
+        element = self.parent(node)
+        while element is not None:
+            name = self.tag_name(element)
+            if name in ("div", "p"):
+                return element
+            if name == "span" and span is None:
+                span = element
+            element = self.parent(element)
+        return span
+
+    def _is_inside(self, node, element):
+        parent = self.parent(node)
+        while parent is not None:
+            if parent is element:
+                return True
+            parent = self.parent(parent)
+        return False
+
+    def _byline_element(self, node):
+        # Outermost span/div/p around this text whose full text is still short
+        found = None
+        element = self.parent(node)
+        while element is not None:
+            if self.short_text(element, BYLINE_MAX_LEN) is None:
+                break
+            if self.tag_name(element) in BLOCK_TAGS:
+                found = element
+            element = self.parent(element)
+        return found
+
+    # --- tree access (BeautifulSoup) ---
+
+    def iter_strings(self, root):
+        from bs4 import NavigableString
+
+        for node in root.descendants:
+            # Exact type check skips comments, <script>/<style> contents etc, like get_text()
+            if type(node) is NavigableString:
+                yield str(node), node
+
+    def parent(self, node):
+        return node.parent
+
+    def tag_name(self, element):
+        return element.name
+
+    def short_text(self, element, limit):
+        # Element text if shorter than limit, else None, without building long strings
+        parts = []
+        length = 0
+        for text in element.strings:
+            length += len(text)
+            if length >= limit:
+                return None
+            parts.append(text)
+        return "".join(parts)
@@ -0,0 +1,175 @@
+import json
+import os
+import re
+from urllib.parse import parse_qsl, urlsplit
+
+# Path segments that name a listing rather than an article
+LISTING_SEGMENTS = {
+    "tag", "tags", "topic", "topics", "author", "authors", "category", "categories",
+    "section", "sections", "page", "search", "latest", "archive", "archives", "live-updates",
+}
+PAGINATION_PARAMS = {"page", "p", "pg", "offset", "start"}
+ARTICLE_EXTENSIONS = (".html", ".htm", ".cms", ".php", ".aspx", ".shtml")
+WORD_SPLIT_RE = re.compile(r"[-_]+")
+DIGITS_RE = re.compile(r"\d{5,}")
+
+
+def segment_shape(segment: str) -> str:
+    # "2026" -> {yyyy}, "01" -> {n2}, "123456" -> {id}, "some-long-story-slug-123456.html"
+    # -> {slug-id}.html; short plain words (section names) stay literal
+    extension = ""
+    lowered = segment.lower()
+    for ext in ARTICLE_EXTENSIONS:
+        if lowered.endswith(ext):
+            segment, extension = segment[: -len(ext)], ext
+            break
+    if segment.isdigit():
+        if len(segment) == 4 and segment[:2] in ("19", "20"):
+            return "{yyyy}" + extension
+        if len(segment) <= 2:
+            return "{n2}" + extension
+        return ("{id}" if len(segment) >= 5 else "{n}") + extension
+    words = [w for w in WORD_SPLIT_RE.split(segment) if w]
+    has_id = bool(DIGITS_RE.search(segment))
+    if len(words) >= 3:
+        return ("{slug-id}" if has_id else "{slug}") + extension
+    if has_id:
+        return "{word-id}" + extension
+    return lowered + extension
+
+
+def url_shape(url: str):
+    # (specific, general) shapes of a URL's path; the general one also hides literal
+    # section names, so /india/story/{slug-id} and /world/story/{slug-id} share it.
+    # A general shape of nothing but words says too little and is left out (None).
+    parts = urlsplit(url)
+    shapes = [segment_shape(s) for s in parts.path.split("/") if s]
+    paged = any(key.lower() in PAGINATION_PARAMS for key, _ in parse_qsl(parts.query))
+    suffix = "?page" if paged else ""
+    specific = "/" + "/".join(shapes) + suffix
+    general = None
+    if any(s.startswith("{") for s in shapes):
+        general = "/" + "/".join(s if s.startswith("{") else "{w}" for s in shapes) + suffix
+    return specific, general
+
+
+def looks_like_article(record: dict, min_words: int = 50) -> bool:
+    # What the extractor found behind a URL, as a training label
+    return bool(record.get("title")) and len((record.get("content") or "").split()) >= min_words
+
+
+class UrlClassifier:
+    # Decides, before a link is scheduled, whether it looks like an article. Explicit
+    # regex rules win; then per-site URL shapes learned from what extraction actually
+    # found behind them; then a path heuristic (dates, long slugs, numeric IDs vs
+    # tag/author/category/pagination pages). Scores are 0..1, links under `threshold`
+    # are not fetched.
+    # A learned shape lets links through after min_samples pages, but only blocks them
+    # after block_samples, and counts are halved once a shape has max_samples so old
+    # evidence fades. Links turned away on a learned score alone still get fetched at
+    # an `explore` share, which lets a shape the site has started using for articles
+    # earn its way back.
+    def __init__(self, article_patterns: list = None, skip_patterns: list = None,
+                 threshold: float = 0.2, min_samples: int = 3, block_samples: int = 20,
+                 max_samples: int = 200, explore: float = 0.05):
+        self.article_rules = [re.compile(p) for p in article_patterns or []]
+        self.skip_rules = [re.compile(p) for p in skip_patterns or []]
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.block_samples = block_samples
+        self.max_samples = max_samples
+        self.explore = explore
+        # shape -> [articles, non_articles]
+        self.counts = {}
+        self.skipped = 0
+        self.explored = 0
+        self._learned_rejects = 0
+
+    def score(self, url: str) -> float:
+        return self._score(url)[0]
+
+    def accepts(self, url: str) -> bool:
+        score, learned = self._score(url)
+        if score >= self.threshold:
+            return True
+        if learned and self.explore > 0:
+            # Every 1/explore-th link a learned shape turns away is fetched anyway
+            self._learned_rejects += 1
+            if self._learned_rejects >= 1 / self.explore:
+                self._learned_rejects = 0
+                self.explored += 1
+                return True
+        self.skipped += 1
+        return False
+
+    def learn(self, url: str, is_article: bool):
+        for shape in filter(None, url_shape(url)):
+            counts = self.counts.setdefault(shape, [0, 0])
+            counts[0 if is_article else 1] += 1
+            if counts[0] + counts[1] > self.max_samples:
+                counts[0], counts[1] = counts[0] / 2, counts[1] / 2
+
+    def _score(self, url):
+        # (score, whether it came from a learned shape)
+        if any(rule.search(url) for rule in self.skip_rules):
+            return 0.0, False
+        if any(rule.search(url) for rule in self.article_rules):
+            return 1.0, False
+        for shape in filter(None, url_shape(url)):
+            learned = self._learned(shape)
+            if learned is not None:
+                return learned, True
+        return self._heuristic(url), False
+
+    def bootstrap(self, article_urls):
+        # Known article URLs (e.g. from the site's sitemap) seed the learned shapes
+        for url in article_urls:
+            self.learn(url, True)
+
+    def _learned(self, shape):
+        articles, others = self.counts.get(shape, (0, 0))
+        samples = articles + others
+        if samples < self.min_samples:
+            return None
+        score = articles / samples
+        if score < self.threshold and samples < self.block_samples:
+            # Not enough evidence yet to stop fetching the shape
+            return None
+        return score
+
+    def _heuristic(self, url):
+        parts = urlsplit(url)
+        segments = [s.lower() for s in parts.path.split("/") if s]
+        if not segments:
+            return 0.0
+        if any(s in LISTING_SEGMENTS for s in segments):
+            return 0.1
+        if any(key.lower() in PAGINATION_PARAMS for key, _ in parse_qsl(parts.query)):
+            return 0.1
+        shapes = [segment_shape(s) for s in segments]
+        score = 0.4
+        if "{yyyy}" in shapes:
+            score += 0.2
+        if any(s.startswith(("{slug", "{id", "{word-id")) for s in shapes):
+            score += 0.3
+        if segments[-1].endswith(ARTICLE_EXTENSIONS):
+            score += 0.1
+        if len(segments) == 1 and not shapes[0].startswith("{"):
+            score -= 0.25  # a bare section like /sports
+        return min(score, 1.0)
+
+    def load(self, path: str, host: str):
+        # Learned shapes are kept per host in a JSON file shared by all crawls
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for shape, counts in json.load(f).get(host, {}).items():
+                    self.counts[shape] = list(counts)
+
+    def save(self, path: str, host: str):
+        data = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        data[host] = self.counts
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
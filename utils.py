@@ -1,8 +1,62 @@
+import re
+from collections import OrderedDict
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+RFC_2822_RE = re.compile(r"^(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{4}\s+\d{1,2}:\d{2}")
+
+# Parsed dates by raw string, least recently used first, for strings that mean the same
+# date whenever they're read. "2 hours ago" or "yesterday" mean something else an hour
+# later, so they aren't kept.
+_absolute_dates = OrderedDict()
+DATE_CACHE_SIZE = 4096
+# Free text is only taken as absolute when it names a year and none of these words;
+# anything else ("2 hours ago", "Monday", "Jan 22", other languages) is parsed every time
+RELATIVE_WORDS_RE = re.compile(r"\b(?:ago|now|today|yesterday|tomorrow|last|next|this)\b", re.I)
+YEAR_RE = re.compile(r"(?<!\d)(?:19|20)\d{2}(?!\d)")
+
 def clean_text(text: str) -> str:
     if not text:
         return ""
     return " ".join(text.split())
 
-def normalize_date(date_str: str) -> str:
-    # TODO: Implement using dateparser
-    return date_str
+def normalize_date(date_str: str):
+    # Returns a datetime (or None). Absolute dates are cached, so the same raw string is
+    # only parsed once; relative ones are parsed against the current time on every call
+    if not isinstance(date_str, str):
+        return None
+    date_str = date_str.strip()
+    if not date_str:
+        return None
+    if date_str in _absolute_dates:
+        _absolute_dates.move_to_end(date_str)
+        return _absolute_dates[date_str]
+    dt, absolute = _parse_date(date_str)
+    if absolute:
+        _absolute_dates[date_str] = dt
+        if len(_absolute_dates) > DATE_CACHE_SIZE:
+            _absolute_dates.popitem(last=False)
+    return dt
+
+def _parse_date(date_str: str):
+    # (datetime or None, whether that doesn't depend on when it was parsed)
+    # Fast path: ISO-8601 (meta tags, JSON-LD) and RFC-2822 (feeds, HTTP headers)
+    if ISO_DATE_RE.match(date_str):
+        try:
+            return datetime.fromisoformat(date_str.replace("Z", "+00:00")), True
+        except ValueError:
+            pass
+    elif RFC_2822_RE.match(date_str):
+        try:
+            return parsedate_to_datetime(date_str), True
+        except (TypeError, ValueError):
+            pass
+
+    # Slow path: free text ("Updated: Jan 22, 2026 10:00 IST", "2 hours ago" ...)
+    import dateparser
+    dt = dateparser.parse(date_str)
+    return dt, dt is None or _is_absolute_text(date_str)
+
+def _is_absolute_text(date_str: str) -> bool:
+    return bool(YEAR_RE.search(date_str)) and not RELATIVE_WORDS_RE.search(date_str)